@@ -0,0 +1,149 @@
+# helpers/color/color_np.py
+# Vectorized (NumPy) counterparts of helpers.color.color_utils for batches of colors.
+
+from __future__ import annotations
+
+"""
+helpers.color.color_np
+----------------------
+
+Batched color math on NumPy arrays.
+
+Conventions:
+- A batch of N colors is a float64 array of shape (N, 3) holding 0..255 channel
+  values (integral after every conversion/blend, like ColorRGB).
+- HSV components are float64 arrays of shape (N,) in [0..1].
+
+Each function mirrors its scalar counterpart in color_utils (same clamping,
+same round-half-even), so batched results match the scalar helpers exactly.
+
+This module imports numpy at import time; it is intentionally not re-exported
+from helpers.color so the scalar helpers stay dependency-free.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from .color_types import ColorRGB
+from helpers.math.basic import clamp01
+
+Hsv = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def colors_to_np(colors: Sequence[ColorRGB]) -> np.ndarray:
+    """Pack ColorRGB values into an (N, 3) float64 batch."""
+    return np.array([(c.r, c.g, c.b) for c in colors], dtype=np.float64).reshape(-1, 3)
+
+
+def np_to_colors(rgb: np.ndarray) -> list[ColorRGB]:
+    """Unpack an (N, 3) batch into ColorRGB values."""
+    return [ColorRGB(r, g, b) for r, g, b in rgb.astype(np.int64).tolist()]
+
+
+def _finish_rgb(rgb: np.ndarray) -> np.ndarray:
+    # clamp8(round(x)) per channel
+    return np.clip(np.round(rgb), 0.0, 255.0)
+
+
+def rgb_to_hsv_np(rgb: np.ndarray) -> Hsv:
+    """Batched rgb_to_hsv (colorsys formulas, hue in [0..1])."""
+    c = np.clip(rgb / 255.0, 0.0, 1.0)
+    r, g, b = c[:, 0], c[:, 1], c[:, 2]
+
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    rangec = maxc - minc
+    gray = rangec == 0.0
+
+    # Substitute 1.0 where the scalar code would have returned early.
+    safe_range = np.where(gray, 1.0, rangec)
+    safe_max = np.where(gray, 1.0, maxc)
+
+    s = np.where(gray, 0.0, rangec / safe_max)
+    rc = (maxc - r) / safe_range
+    gc = (maxc - g) / safe_range
+    bc = (maxc - b) / safe_range
+
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = np.where(gray, 0.0, np.mod(h / 6.0, 1.0))
+    return h, s, maxc
+
+
+def hsv_to_rgb_np(h: np.ndarray, s: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Batched hsv_to_rgb -> (N, 3) 0..255 batch."""
+    h = np.clip(h, 0.0, 1.0)
+    s = np.clip(s, 0.0, 1.0)
+    v = np.clip(v, 0.0, 1.0)
+
+    h6 = h * 6.0
+    i = h6.astype(np.int64)  # truncation, as in colorsys
+    f = h6 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i % 6
+
+    # s == 0 needs no special case: p == q == t == v exactly.
+    r = np.choose(i, (v, q, p, p, t, v))
+    g = np.choose(i, (t, v, v, q, p, p))
+    b = np.choose(i, (p, p, t, v, v, q))
+    return _finish_rgb(np.stack((r, g, b), axis=1) * 255.0)
+
+
+def blend_rgb_np(a: np.ndarray, b: np.ndarray, t: float) -> np.ndarray:
+    """Batched blend_rgb; `b` may be a batch or a single (3,) color."""
+    t = clamp01(t)
+    return _finish_rgb(a + (b - a) * t)
+
+
+def auto_fg_color_np(bg: np.ndarray, *, threshold: float = 0.5) -> np.ndarray:
+    """Batched auto_fg_color (black or white per row)."""
+    c = np.clip(bg / 255.0, 0.0, 1.0)
+    lum = 0.2126 * c[:, 0] + 0.7152 * c[:, 1] + 0.0722 * c[:, 2]
+    white = np.where(lum > threshold, 0.0, 255.0)
+    return np.repeat(white[:, None], 3, axis=1)
+
+
+def opposite_hue_color_np(rgb: np.ndarray) -> np.ndarray:
+    """Batched opposite_hue_color."""
+    h, s, v = rgb_to_hsv_np(rgb)
+    return hsv_to_rgb_np(np.mod(h + 0.5, 1.0), s, v)
+
+
+def variants_from_anchor_np(
+    anchor: np.ndarray,
+    *,
+    low_alpha: float = 0.25,
+    muted_sat: float = 0.25,
+    muted_val: float = 0.50,
+    high_sat: float = 0.90,
+    high_val: float = 0.90,
+    cohesion_with: Optional[np.ndarray] = None,
+    cohesion_alpha: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Batched variants_from_anchor -> (low, muted, high); extremes are not produced."""
+    h, s, _v = rgb_to_hsv_np(anchor)
+
+    low = blend_rgb_np(anchor, np.zeros(3), clamp01(low_alpha))
+    muted = hsv_to_rgb_np(h, np.clip(s * muted_sat, 0.0, 1.0), np.full_like(h, clamp01(muted_val)))
+    high = hsv_to_rgb_np(h, np.clip(s * high_sat, 0.0, 1.0), np.full_like(h, clamp01(high_val)))
+
+    if cohesion_with is not None and cohesion_alpha > 0:
+        low = blend_rgb_np(low, cohesion_with, cohesion_alpha)
+        muted = blend_rgb_np(muted, cohesion_with, cohesion_alpha)
+        high = blend_rgb_np(high, cohesion_with, cohesion_alpha)
+
+    return low, muted, high
+
+
+def fg_variants_np(
+    fg: np.ndarray,
+    *,
+    muted_alpha: float = 0.6,
+    high_alpha: float = 0.3,
+    toward: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Batched fg_variants -> (muted, high)."""
+    base = toward if toward is not None else fg
+    return blend_rgb_np(fg, base, muted_alpha), blend_rgb_np(fg, base, high_alpha)
@@ -8,11 +8,32 @@ from json import JSONDecodeError
 from pathlib import Path
 from typing import Any, Callable
 
+try:  # optional accelerator; stdlib json is the fallback and the reference behavior
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
 from .dirs import ensure_parent
 from .text import read_text
 from .atomic import atomic_write_text
 
 
+def _loads(s: str) -> Any:
+    """
+    Decode JSON text, using orjson when installed.
+
+    orjson is stricter than json (no NaN/Infinity, 64-bit integers only), so
+    anything it rejects is re-parsed by json: results and error messages stay
+    those of the stdlib parser.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(s)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(s)
+
+
 def read_json(path: str | Path, *, encoding: str = "utf-8") -> Any:
     """
     Read JSON from a file and return the decoded object.
@@ -26,7 +47,7 @@ def read_json(path: str | Path, *, encoding: str = "utf-8") -> Any:
     s = read_text(p, encoding=encoding)
 
     try:
-        return json.loads(s)
+        return _loads(s)
     except JSONDecodeError as e:
         # Common case: empty file (or whitespace-only)
         if s.strip() == "":
@@ -62,7 +83,7 @@ def read_json_default(
         s = read_text(p, encoding=encoding)
         if s.strip() == "":
             return default
-        return json.loads(s)
+        return _loads(s)
 
     return read_json(p, encoding=encoding)
 
@@ -37,7 +37,8 @@ def clamp01(v: float) -> float:
 
 def clamp8(v: int) -> int:
     """Clamp integer v into 8-bit unsigned range [0..255]."""
-    return int(clamp(int(v), 0, 255))
+    v = int(v)
+    return 0 if v < 0 else 255 if v > 255 else v
 
 
 def clamp_int(v: float, lo: int, hi: int) -> int:
@@ -1,8 +1,10 @@
 # helpers/strip_map.py
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass
 from datetime import timedelta
+from itertools import accumulate
 from typing import List, Optional, Sequence, Tuple
 
 from .math.basic import clamp, clamp01
@@ -159,6 +161,58 @@ def segments_to_ranges(
 # Session -> active segment helpers
 # -----------------------------------------------------------------------------
 
+class SegmentTimeline:
+    """
+    Precomputed cumulative durations for a fixed sequence of segments.
+
+    Build once and reuse for per-frame lookups; both the active index and the
+    in-segment progress are answered with a single O(log n) bisect.
+
+    Notes:
+    - Zero/negative durations are clamped to zero width: they collapse to
+      instantaneous segments and are never active.
+    - Negative elapsed times are clamped to 0 (start of the first segment).
+    """
+
+    __slots__ = ("segments", "cumdur")
+
+    def __init__(self, segments: Sequence[TimeSegment]) -> None:
+        self.segments: Tuple[TimeSegment, ...] = tuple(segments)
+        self.cumdur: List[float] = list(
+            accumulate(max(0.0, seg.duration.total_seconds()) for seg in self.segments)
+        )
+
+    def locate(self, elapsed: timedelta) -> Optional[Tuple[int, float]]:
+        """
+        Return (active_index, progress_in_segment) for an elapsed time.
+
+        Returns None if there are no segments. Past the end, the index is
+        clamped to the last segment and progress is 1.0.
+        """
+        cum = self.cumdur
+        n = len(cum)
+        if n == 0:
+            return None
+
+        t = max(0.0, elapsed.total_seconds())
+        # cum is non-decreasing, so bisect_right skips zero-width segments:
+        # the hit satisfies prev <= t < cum[i], i.e. a positive width.
+        i = bisect.bisect_right(cum, t)
+        if i >= n:
+            return n - 1, 1.0
+
+        prev = cum[i - 1] if i else 0.0
+        return i, (t - prev) / (cum[i] - prev)
+
+    def active_index(self, elapsed: timedelta) -> Optional[int]:
+        loc = self.locate(elapsed)
+        return None if loc is None else loc[0]
+
+    def progress(self, elapsed: timedelta) -> Optional[float]:
+        loc = self.locate(elapsed)
+        return None if loc is None else loc[1]
+
+
 def active_segment_index(
     session: TimedSession,
     segments: Sequence[TimeSegment],
@@ -169,18 +223,13 @@ def active_segment_index(
     Returns None if:
       - session not started, or
       - segments is empty
+
+    For per-frame use, build a SegmentTimeline once and call active_index().
     """
     elapsed = session.active_elapsed()
     if elapsed is None or not segments:
         return None
-
-    t = elapsed.total_seconds()
-    acc = 0.0
-    for i, seg in enumerate(segments):
-        acc += seg.duration.total_seconds()
-        if t < acc:
-            return i
-    return len(segments) - 1
+    return SegmentTimeline(segments).active_index(elapsed)
 
 
 def segment_progress(
@@ -193,18 +242,9 @@ def segment_progress(
     Notes:
     - Zero/negative durations are skipped in-progress; they effectively
       collapse to instantaneous segments.
+    - For per-frame use, build a SegmentTimeline once and call progress().
     """
     elapsed = session.active_elapsed()
     if elapsed is None or not segments:
         return None
-
-    t = elapsed.total_seconds()
-    acc = 0.0
-    for seg in segments:
-        dur = seg.duration.total_seconds()
-        if dur <= 0:
-            continue
-        if t < acc + dur:
-            return (t - acc) / dur
-        acc += dur
-    return 1.0
+    return SegmentTimeline(segments).progress(elapsed)
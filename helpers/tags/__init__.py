@@ -8,6 +8,7 @@ from .validators import (
     validate_tag_catalog,
     apply_tag_add,
     apply_tag_remove,
+    apply_tag_remove_unchecked,
 )
 from .serde import dump_tag_catalog
 from .queries import (
@@ -30,6 +31,7 @@ __all__ = [
     "validate_tag_catalog",
     "apply_tag_add",
     "apply_tag_remove",
+    "apply_tag_remove_unchecked",
     "dump_tag_catalog",
     "split_tags",
     "group_by_namespace",
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Set, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 
 
 @dataclass(frozen=True)
@@ -32,6 +32,26 @@ class TagNamespace:
     allowed_values: Optional[Tuple[str, ...]] = None
     applies_to: Optional[Tuple[str, ...]] = None  # scope hints; app-defined strings
 
+    # Hash-set views of the tuples above (tuples keep declaration order for dumps).
+    _allowed_set: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+    _applies_set: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.allowed_values is not None:
+            object.__setattr__(self, "_allowed_set", frozenset(self.allowed_values))
+        if self.applies_to:
+            applies = frozenset(self.applies_to)
+            # "*" means every scope; store None so the check is a single test.
+            object.__setattr__(self, "_applies_set", None if "*" in applies else applies)
+
+    def allows_value(self, value: str) -> bool:
+        allowed = self._allowed_set
+        return allowed is None or value in allowed
+
+    def applies_to_scope(self, scope: str) -> bool:
+        applies = self._applies_set
+        return applies is None or scope in applies
+
 
 @dataclass(frozen=True)
 class TagCatalog:
@@ -51,7 +71,7 @@ class TagCatalog:
     def namespaces_for_scope(self, scope: str) -> List[TagNamespace]:
         out: List[TagNamespace] = []
         for ns in self.namespaces_by_name.values():
-            if not ns.applies_to or "*" in ns.applies_to or scope in ns.applies_to:
+            if ns.applies_to_scope(scope):
                 out.append(ns)
         return sorted(out, key=lambda x: x.name)
 
@@ -77,6 +97,17 @@ class TagSet:
                 seen.add(t)
         self.items = out
 
+    @classmethod
+    def from_canonical(cls, items: List[str]) -> "TagSet":
+        """
+        Wrap an already validated, de-duplicated list of canonical tag strings.
+
+        Skips the de-duplication pass in __post_init__; takes ownership of `items`.
+        """
+        tagset = object.__new__(cls)
+        tagset.items = items
+        return tagset
+
     def to_list(self) -> List[str]:
         return list(self.items)
 
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 from helpers.validation import ValidationError
 from helpers.validation.basic import require_dict, require_list_of_dicts, require_str, require_bool  # compat
@@ -13,47 +14,108 @@ from helpers.validation.basic import require_one_of  # if you have it; ok if unu
 from .types import Tag, TagCatalog, TagNamespace, TagSet
 
 
-_NS_RE = re.compile(r"^[a-z][a-z0-9_]*(?:[.-][a-z0-9_]+)*$", re.IGNORECASE)
-# value: allow fairly broad, but forbid whitespace at ends; forbid empty
-# (if you want stricter: swap regex)
-_VAL_RE = re.compile(r"^[^\s].*[^\s]$")
+# Explicit ASCII case classes instead of re.IGNORECASE: no Unicode case-folding
+# per character, and no accidental matches like KELVIN SIGN for "k".
+_NS_RE = re.compile(r"^[A-Za-z][A-Za-z0-9_]*(?:[.-][A-Za-z0-9_]+)*$", re.ASCII)
+_ns_match = _NS_RE.match
 
 
-def parse_tag(tag: str, *, path: str = "tag") -> Tag:
+def _valid_ns(ns: str) -> bool:
     """
-    Parse "ns:value" into Tag.
+    Return True if `ns` is a valid namespace.
 
-    Rules:
-    - exactly one ":" separator (first colon splits)
-    - namespace matches _NS_RE
-    - value non-empty and trimmed
+    Plain namespaces ("topic", "mood_2") are the common case and are checked
+    with C-level str predicates; an ASCII identifier is exactly
+    [A-Za-z_][A-Za-z0-9_]*. Dotted/dashed forms fall back to _NS_RE.
     """
-    if not isinstance(tag, str):
-        raise ValidationError(f"{path} must be a string (got {type(tag).__name__})")
+    if ns.isascii() and ns.isidentifier():
+        return ns[0] != "_"
+    return _ns_match(ns) is not None
+
 
+_PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_tag_cached(tag: str) -> Union[Tag, str]:
+    """
+    Pure "ns:value" parse, memoized per input string.
+
+    Returns the Tag, or an error message suffix (without the caller's path) so
+    failures are cached too and parse_tag can prefix its own path.
+
+    Note: a single whole-tag regex (trim + split + namespace + value in one
+    fullmatch) was measured at parity with this split/strip pipeline, and it
+    could not report which rule failed, so the stepwise form is kept.
+    """
     raw = tag.strip()
     if not raw:
-        raise ValidationError(f"{path} must be non-empty")
+        return "must be non-empty"
 
     if ":" not in raw:
-        raise ValidationError(f"{path} must be in 'namespace:value' form (got {tag!r})")
+        return f"must be in 'namespace:value' form (got {tag!r})"
 
     ns, val = raw.split(":", 1)
     ns = ns.strip()
     val = val.strip()
 
     if not ns or not val:
-        raise ValidationError(f"{path} must be in 'namespace:value' form (got {tag!r})")
+        return f"must be in 'namespace:value' form (got {tag!r})"
 
-    if not _NS_RE.match(ns):
-        raise ValidationError(f"{path} has invalid namespace {ns!r}")
+    if not _valid_ns(ns):
+        return f"has invalid namespace {ns!r}"
 
-    if not _VAL_RE.match(val):
-        raise ValidationError(f"{path} has invalid value {val!r}")
+    # value: allow fairly broad; forbid empty (checked above) and line breaks.
+    # Whitespace at the ends is already removed by strip(), so no regex is needed.
+    if "\n" in val:
+        return f"has invalid value {val!r}"
 
     return Tag(namespace=ns, value=val)
 
 
+def parse_tag(tag: str, *, path: str = "tag") -> Tag:
+    """
+    Parse "ns:value" into Tag.
+
+    Rules:
+    - exactly one ":" separator (first colon splits)
+    - namespace matches _NS_RE
+    - value non-empty and trimmed
+
+    Results are memoized per input string (Tag is frozen, so sharing is safe).
+    """
+    if not isinstance(tag, str):
+        raise ValidationError(f"{path} must be a string (got {type(tag).__name__})")
+
+    t = _parse_tag_cached(tag)
+    if isinstance(t, str):
+        raise ValidationError(f"{path} {t}")
+    return t
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _normalize_tag_cached(tag: str, lower_namespace: bool) -> Union[Tuple[Tag, str], str]:
+    t = _parse_tag_cached(tag)
+    if isinstance(t, str):
+        return t
+    if lower_namespace:
+        ns = t.namespace.lower()
+        if ns != t.namespace:
+            t = Tag(namespace=ns, value=t.value)
+    return t, t.to_str()
+
+
+def _normalize_tag(tag: str, *, lower_namespace: bool = True, path: str = "tag") -> Tuple[Tag, str]:
+    """Parse once and return the normalized (Tag, canonical string)."""
+    if not isinstance(tag, str):
+        raise ValidationError(f"{path} must be a string (got {type(tag).__name__})")
+
+    r = _normalize_tag_cached(tag, lower_namespace)
+    if isinstance(r, str):
+        raise ValidationError(f"{path} {r}")
+    return r
+
+
 def normalize_tag_str(tag: str, *, lower_namespace: bool = True) -> str:
     """
     Normalize a tag string:
@@ -61,37 +123,44 @@ def normalize_tag_str(tag: str, *, lower_namespace: bool = True) -> str:
     - optionally lower-case namespace
     - keep value as-is (except trimming)
     """
-    t = parse_tag(tag, path="tag")
-    ns = t.namespace.lower() if lower_namespace else t.namespace
-    return f"{ns}:{t.value}"
+    return _normalize_tag(tag, lower_namespace=lower_namespace)[1]
 
 
-def validate_tag_str(tag: str, catalog: Optional[TagCatalog] = None, *, scope: str = "*", path: str = "tag") -> str:
-    """
-    Validate a tag string, optionally against TagCatalog constraints.
-    Returns canonical normalized tag string (namespace lower-cased).
+def _validate_tag(tag: str, catalog: Optional[TagCatalog], *, scope: str, path: str) -> Tuple[Tag, str]:
     """
-    s = normalize_tag_str(tag, lower_namespace=True)
-    t = parse_tag(s, path=path)
+    Parse/normalize once and apply catalog constraints.
 
+    Returns the normalized (Tag, canonical string) so callers can reuse it
+    without re-parsing.
+    """
+    r = _normalize_tag(tag, lower_namespace=True, path=path)
     if catalog is None:
-        return s
+        return r
+
+    t = r[0]
 
     ns = catalog.get_namespace(t.namespace)
     if ns is None:
         raise ValidationError(f"{path}: unknown namespace '{t.namespace}'")
 
     # scope filtering is advisory; enforcement optional
-    if ns.applies_to and "*" not in ns.applies_to and scope not in ns.applies_to:
+    if not ns.applies_to_scope(scope):
         raise ValidationError(f"{path}: namespace '{t.namespace}' not allowed for scope '{scope}'")
 
-    if ns.allowed_values is not None:
-        if t.value not in ns.allowed_values:
-            raise ValidationError(
-                f"{path}: value '{t.value}' not allowed for namespace '{t.namespace}'"
-            )
+    if not ns.allows_value(t.value):
+        raise ValidationError(
+            f"{path}: value '{t.value}' not allowed for namespace '{t.namespace}'"
+        )
+
+    return r
+
 
-    return s
+def validate_tag_str(tag: str, catalog: Optional[TagCatalog] = None, *, scope: str = "*", path: str = "tag") -> str:
+    """
+    Validate a tag string, optionally against TagCatalog constraints.
+    Returns canonical normalized tag string (namespace lower-cased).
+    """
+    return _validate_tag(tag, catalog, scope=scope, path=path)[1]
 
 
 def validate_tagset(
@@ -114,19 +183,20 @@ def validate_tagset(
         raise ValidationError(f"{path} must be a list (got {type(tags).__name__})")
 
     out: List[str] = []
-    # normalize+basic validate
+    counts: Dict[str, int] = {}
+    seen: Set[str] = set()
+    # normalize+basic validate, de-duplicate and count namespaces in one pass
     for i, raw in enumerate(tags):
-        out.append(validate_tag_str(str(raw), catalog=catalog, scope=scope, path=f"{path}[{i}]"))
+        t, s = _validate_tag(str(raw), catalog, scope=scope, path=f"{path}[{i}]")
+        if s not in seen:
+            seen.add(s)
+            out.append(s)
+            counts[t.namespace] = counts.get(t.namespace, 0) + 1
 
-    tagset = TagSet(out)
+    tagset = TagSet.from_canonical(out)
 
     # enforce multi_valued constraints
     if catalog is not None:
-        counts: Dict[str, int] = {}
-        for s in tagset.items:
-            t = parse_tag(s, path=path)
-            counts[t.namespace] = counts.get(t.namespace, 0) + 1
-
         for ns_name, count in counts.items():
             ns = catalog.get_namespace(ns_name)
             if ns and not ns.multi_valued and count > 1:
@@ -146,8 +216,7 @@ def apply_tag_add(
     Add a tag to a set, respecting catalog constraints.
     If the namespace is single-valued, replaces existing values in that namespace.
     """
-    s = validate_tag_str(tag, catalog=catalog, scope=scope, path="tag")
-    t = parse_tag(s, path="tag")
+    t, s = _validate_tag(tag, catalog, scope=scope, path="tag")
 
     if catalog is not None:
         ns = catalog.get_namespace(t.namespace)
@@ -161,16 +230,41 @@ def apply_tag_add(
 def apply_tag_remove(tagset: TagSet, tag: str) -> TagSet:
     """
     Remove a tag (normalized).
+
+    Fast path: an exact match is removed without parsing (items in a TagSet
+    are already canonical). Otherwise the tag is normalized first, which also
+    raises ValidationError for malformed input.
     """
+    try:
+        tagset.items.remove(tag)
+        return tagset
+    except ValueError:
+        pass
+
     s = normalize_tag_str(tag, lower_namespace=True)
     tagset.remove(s)
     return tagset
 
 
+def apply_tag_remove_unchecked(tagset: TagSet, tag: str) -> TagSet:
+    """
+    Remove an already-canonical tag string without parsing/validation.
+
+    For trusted bulk callers (e.g. tags taken from the catalog or the set itself).
+    """
+    tagset.remove(tag)
+    return tagset
+
+
 # ─────────────────────────────────────────────────────────────
 # Catalog schema validation
 # ─────────────────────────────────────────────────────────────
 
+def _stripped_nonempty(values: List[str]) -> Tuple[str, ...]:
+    """Strip each string once, dropping empties (order preserved)."""
+    return tuple(v for v in map(str.strip, values) if v)
+
+
 def validate_tag_catalog(raw: Any) -> TagCatalog:
     """
     Validate a tag catalog document from raw JSON dict.
@@ -198,7 +292,7 @@ def validate_tag_catalog(raw: Any) -> TagCatalog:
     for i, ns_raw in enumerate(ns_list):
         p = f"tag_catalog.namespaces[{i}]"
         name = require_str(ns_raw, "name", path=p)
-        if not _NS_RE.match(name):
+        if not _valid_ns(name):
             raise ValidationError(f"{p}.name has invalid namespace name {name!r}")
 
         desc = ns_raw.get("description")
@@ -214,14 +308,14 @@ def validate_tag_catalog(raw: Any) -> TagCatalog:
         if allowed_values is not None:
             if not isinstance(allowed_values, list) or not all(isinstance(x, str) for x in allowed_values):
                 raise ValidationError(f"{p}.allowed_values must be a list of strings")
-            allowed_t = tuple(x.strip() for x in allowed_values if x.strip())
+            allowed_t = _stripped_nonempty(allowed_values)
 
         applies_to = ns_raw.get("applies_to")
         applies_t: Optional[Tuple[str, ...]] = None
         if applies_to is not None:
             if not isinstance(applies_to, list) or not all(isinstance(x, str) for x in applies_to):
                 raise ValidationError(f"{p}.applies_to must be a list of strings")
-            applies_t = tuple(x.strip() for x in applies_to if x.strip())
+            applies_t = _stripped_nonempty(applies_to)
 
         key = name.lower()
         if key in namespaces_by_name:
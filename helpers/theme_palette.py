@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Literal, Optional
+from typing import List, Literal, Optional, Sequence
 
 from helpers.color.color_types import ColorRGB
 
@@ -171,3 +171,99 @@ def generate_palette(
         # semantics
         warning=warning,
     )
+
+
+def generate_palettes_batch(
+    bases: Sequence[ColorRGB],
+    accents: Optional[Sequence[Optional[ColorRGB]]] = None,
+    fgs: Optional[Sequence[Optional[ColorRGB]]] = None,
+    *,
+    warning_mode: WarningMode = "global",
+    cohesion: float = 0.15,
+) -> List[ThemePalette]:
+    """
+    Generate many palettes at once (same rules as generate_palette).
+
+    accents/fgs, when given, must have one entry per base; None entries fall
+    back to the derived accent/fg exactly like the scalar function. All color
+    math runs as vectorized NumPy operations over the whole batch; results are
+    identical to calling generate_palette per item.
+
+    Requires numpy (imported lazily so this module stays dependency-free).
+    """
+    import numpy as np
+
+    from helpers.color import color_np as cnp
+
+    n = len(bases)
+    if n == 0:
+        return []
+    for name, items in (("accents", accents), ("fgs", fgs)):
+        if items is not None and len(items) != n:
+            raise ValueError(f"{name} must have {n} entries (got {len(items)})")
+
+    cohesion = clamp01(cohesion)
+
+    # ── Resolve anchors ────────────────────────────────────────
+    base_np = cnp.colors_to_np(bases)
+    accent_np = cnp.opposite_hue_color_np(base_np)
+    fg_np = cnp.auto_fg_color_np(base_np)
+    for items, arr in ((accents, accent_np), (fgs, fg_np)):
+        if items is not None:
+            for i, c in enumerate(items):
+                if c is not None:
+                    arr[i] = (c.r, c.g, c.b)
+
+    # ── Variants (same tuning as generate_palette) ─────────────
+    base_low, base_muted, base_high = cnp.variants_from_anchor_np(
+        base_np,
+        low_alpha=0.30,
+        muted_sat=0.20,
+        muted_val=0.45,
+        high_sat=0.75,
+        high_val=0.85,
+    )
+    accent_low, accent_muted, accent_high = cnp.variants_from_anchor_np(
+        accent_np,
+        low_alpha=0.25,
+        muted_sat=0.22,
+        muted_val=0.45,
+        high_sat=0.85,
+        high_val=0.90,
+        cohesion_with=base_np,
+        cohesion_alpha=cohesion,
+    )
+    fg_muted, fg_high = cnp.fg_variants_np(fg_np, muted_alpha=0.60, high_alpha=0.30, toward=base_np)
+
+    # ── Semantics: warning ─────────────────────────────────────
+    if warning_mode == "global":
+        warnings: List[ColorRGB] = [ColorRGB(255, 140, 0)] * n
+    else:
+        _h, s, v = cnp.rgb_to_hsv_np(base_np)
+        warning_raw = cnp.hsv_to_rgb_np(np.full_like(s, 0.08), np.maximum(s, 0.85), np.maximum(v, 0.90))
+        warnings = cnp.np_to_colors(cnp.blend_rgb_np(warning_raw, base_np, cohesion * 0.25))
+
+    # Keep caller-provided anchors as-is (like generate_palette does).
+    def _anchors(items: Optional[Sequence[Optional[ColorRGB]]], derived: List[ColorRGB]) -> List[ColorRGB]:
+        if items is None:
+            return derived
+        return [c if c is not None else d for c, d in zip(items, derived)]
+
+    accent_cs = _anchors(accents, cnp.np_to_colors(accent_np))
+    fg_cs = _anchors(fgs, cnp.np_to_colors(fg_np))
+
+    cols = zip(
+        bases,
+        accent_cs,
+        fg_cs,
+        cnp.np_to_colors(base_low),
+        cnp.np_to_colors(base_muted),
+        cnp.np_to_colors(base_high),
+        cnp.np_to_colors(accent_low),
+        cnp.np_to_colors(accent_muted),
+        cnp.np_to_colors(accent_high),
+        cnp.np_to_colors(fg_muted),
+        cnp.np_to_colors(fg_high),
+        warnings,
+    )
+    return [ThemePalette(*row) for row in cols]
@@ -4,11 +4,9 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
 class RateLimiter:
     """
     Simple rate limiter based on time.perf_counter().
@@ -20,10 +18,31 @@ class RateLimiter:
     Semantics:
       - Uses monotonic clock (perf_counter) to avoid wall-clock jumps.
       - If target_fps is None/0/negative, rate limiting is disabled.
-      - After sleeping, internal "last tick" is updated to the post-sleep timestamp.
+      - After sleeping, internal "last tick" is anchored to the intended tick
+        time (last + 1/target_fps), not the post-sleep clock, so pacing does not
+        drift with sleep jitter.
+      - The tick interval is computed when target_fps is assigned, not per call.
     """
-    target_fps: Optional[float] = None
-    _last: Optional[float] = None
+
+    __slots__ = ("_target_fps", "_min_dt", "_last")
+
+    def __init__(self, target_fps: Optional[float] = None) -> None:
+        self._target_fps: Optional[float] = None
+        self._min_dt: Optional[float] = None
+        self._last: Optional[float] = None
+        self.target_fps = target_fps
+
+    @property
+    def target_fps(self) -> Optional[float]:
+        return self._target_fps
+
+    @target_fps.setter
+    def target_fps(self, value: Optional[float]) -> None:
+        self._target_fps = value
+        self._min_dt = 1.0 / float(value) if value and value > 0 else None
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(target_fps={self._target_fps!r})"
 
     def reset(self) -> None:
         """Reset internal timing state (next tick acts as the first)."""
@@ -43,22 +62,22 @@ class RateLimiter:
               limiter.sleep_if_needed()
               do_work()
         """
-        if not self.target_fps or self.target_fps <= 0:
+        min_dt = self._min_dt
+        if min_dt is None:
             return
 
         now = time.perf_counter()
-        if self._last is None:
+        last = self._last
+        if last is None:
             self._last = now
             return
 
-        min_dt = 1.0 / float(self.target_fps)
-        dt = now - self._last
+        dt = now - last
         if dt >= min_dt:
             # We're already slow enough; just move the anchor forward.
             self._last = now
             return
 
-        sleep_s = max(0.0, min_dt - dt)
-        time.sleep(sleep_s)
-        # Anchor to "after sleep" so the next tick is spaced correctly.
-        self._last = time.perf_counter()
+        time.sleep(min_dt - dt)
+        # Anchor to the intended tick (saves a second perf_counter call).
+        self._last = last + min_dt
@@ -13,10 +13,12 @@ Key idea:
 - Parsing and input validation live in validation_time.py.
 """
 
+import math
 import time as _time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Tuple
 
 from .math.basic import clamp01
 from .validation.time import (
@@ -29,6 +31,10 @@ from .validation.time import (
 )
 
 
+# unix-seconds inputs accepted by dt()
+_NUMERIC = (int, float)
+
+
 def now(tz: timezone = timezone.utc) -> datetime:
     """
     Authoritative current wall-clock time in the given timezone.
@@ -77,7 +83,11 @@ def delta(a: TimeLike, b: TimeLike, *, tz: timezone = timezone.utc) -> timedelta
 
     Note:
     - For float/int inputs, values are treated as UNIX timestamps (seconds).
+    - If both are numeric, the difference is taken directly on the floats
+      (no datetime round-trip).
     """
+    if isinstance(a, _NUMERIC) and isinstance(b, _NUMERIC):
+        return timedelta(seconds=float(b) - float(a))
     da = dt(a, tz=tz)
     db = dt(b, tz=tz)
     return db - da
@@ -85,11 +95,15 @@ def delta(a: TimeLike, b: TimeLike, *, tz: timezone = timezone.utc) -> timedelta
 
 def since(start: TimeLike, *, tz: timezone = timezone.utc) -> timedelta:
     """Return (now - start)."""
+    if isinstance(start, _NUMERIC):
+        return timedelta(seconds=_time.time() - float(start))
     return delta(start, now(tz), tz=tz)
 
 
 def until(end: TimeLike, *, tz: timezone = timezone.utc) -> timedelta:
     """Return (end - now)."""
+    if isinstance(end, _NUMERIC):
+        return timedelta(seconds=float(end) - _time.time())
     return delta(now(tz), end, tz=tz)
 
 
@@ -107,30 +121,47 @@ def clamp_timedelta(td: timedelta, *, min_td: timedelta, max_td: timedelta) -> t
     return td
 
 
+def floor_to_epoch(ts: float, seconds: int) -> int:
+    """
+    Floor unix seconds to a multiple of `seconds` (float-only; no datetime).
+
+    Use this when aligning many raw timestamps in a loop. Fractional and
+    negative timestamps floor toward -inf (floor_to_epoch(-0.5, 1) == -1).
+    """
+    if seconds <= 0:
+        raise ValueError("seconds must be > 0")
+    # floor(floor(ts) / s) == floor(ts / s) for integer s; stays exact in ints.
+    return (math.floor(ts) // seconds) * seconds
+
+
+def ceil_to_epoch(ts: float, seconds: int) -> int:
+    """
+    Ceil unix seconds to a multiple of `seconds` (float-only; no datetime).
+
+    Fractional timestamps round up (ceil_to_epoch(1.5, 1) == 2).
+    """
+    if seconds <= 0:
+        raise ValueError("seconds must be > 0")
+    return -(-math.ceil(ts) // seconds) * seconds
+
+
 def floor_to(t: datetime, *, seconds: int) -> datetime:
     """
     Floor datetime to nearest multiple of `seconds` since epoch.
 
     Useful for tick alignment (e.g., snap to 1s / 5s boundaries).
     """
-    if seconds <= 0:
-        raise ValueError("seconds must be > 0")
     t = ensure_tz(t)
-    epoch = int(t.timestamp())
-    floored = (epoch // seconds) * seconds
-    return datetime.fromtimestamp(floored, tz=t.tzinfo)
+    # Whole-second truncation first, as before the epoch helpers existed.
+    return datetime.fromtimestamp(floor_to_epoch(int(t.timestamp()), seconds), tz=t.tzinfo)
 
 
 def ceil_to(t: datetime, *, seconds: int) -> datetime:
     """
     Ceil datetime to nearest multiple of `seconds` since epoch.
     """
-    if seconds <= 0:
-        raise ValueError("seconds must be > 0")
     t = ensure_tz(t)
-    epoch = int(t.timestamp())
-    ceiled = ((epoch + seconds - 1) // seconds) * seconds
-    return datetime.fromtimestamp(ceiled, tz=t.tzinfo)
+    return datetime.fromtimestamp(ceil_to_epoch(int(t.timestamp()), seconds), tz=t.tzinfo)
 
 
 def format_timedelta(td: timedelta, *, show_hours: bool = False) -> str:
@@ -140,12 +171,18 @@ def format_timedelta(td: timedelta, *, show_hours: bool = False) -> str:
     Behavior:
     - Negative timedeltas are clamped to 0 (display does not show minus).
     """
-    total_seconds = int(max(0, td.total_seconds()))
-    seconds = total_seconds % 60
-    minutes = (total_seconds // 60) % 60
-    hours = total_seconds // 3600
-
-    if show_hours or hours > 0:
+    total_seconds = int(td.total_seconds())
+    if total_seconds < 0:
+        total_seconds = 0
+    return _format_seconds(total_seconds, show_hours)
+
+
+@lru_cache(maxsize=64)
+def _format_seconds(total_seconds: int, show_hours: bool) -> str:
+    # UI labels re-request the same second many times per second; cache it.
+    minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if show_hours or hours:
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
     return f"{minutes:02d}:{seconds:02d}"
 
@@ -235,12 +272,18 @@ class PauseState:
     - paused_at: when the current pause began (None if not paused)
     - last_paused_at / last_resumed_at: last transition times
     - total_paused: accumulated paused time across pauses
+
+    Durations are measured on the monotonic clock; the datetime fields are
+    kept for display/serialization. If paused_at is assigned directly (not via
+    pause()), the wall-clock difference is used instead.
     """
     tz: timezone = timezone.utc
     paused_at: Optional[datetime] = None
     last_paused_at: Optional[datetime] = None
     last_resumed_at: Optional[datetime] = None
     total_paused: timedelta = field(default_factory=timedelta)
+    # (paused_at, monotonic_s at pause) recorded by pause()
+    _paused_mark: Optional[Tuple[datetime, float]] = field(default=None, init=False, repr=False, compare=False)
 
     def pause(self) -> None:
         """Begin a pause if not already paused."""
@@ -248,24 +291,51 @@ class PauseState:
             t = now(self.tz)
             self.paused_at = t
             self.last_paused_at = t
+            self._paused_mark = (t, monotonic_s())
 
     def resume(self) -> None:
         """End a pause if currently paused; accumulate paused duration."""
         if self.paused_at is not None:
             t = now(self.tz)
-            self.total_paused += (t - self.paused_at)
+            self.total_paused += timedelta(seconds=self._active_pause_s(monotonic_s()))
             self.paused_at = None
+            self._paused_mark = None
             self.last_resumed_at = t
 
     def is_paused(self) -> bool:
         return self.paused_at is not None
 
+    def _active_pause_s(self, mono: float, wall: Optional[datetime] = None) -> float:
+        """
+        Seconds spent in the current pause (0.0 if not paused).
+
+        `wall` is the caller's already-taken now() for the wall-clock fallback,
+        so chained queries share a single clock read.
+        """
+        paused_at = self.paused_at
+        if paused_at is None:
+            return 0.0
+        mark = self._paused_mark
+        if mark is not None and mark[0] is paused_at:
+            return mono - mark[1]
+        return ((wall if wall is not None else now(self.tz)) - paused_at).total_seconds()
+
+    def _paused_s_at(self, mono: float, wall: Optional[datetime] = None) -> float:
+        """Total paused seconds (including an active pause) at monotonic time `mono`."""
+        return self.total_paused.total_seconds() + self._active_pause_s(mono, wall)
+
+    def _paused_duration_at(self, wall: datetime) -> timedelta:
+        """paused_duration() using the caller's current wall-clock time."""
+        if self.paused_at:
+            return timedelta(seconds=self._paused_s_at(monotonic_s(), wall))
+        return self.total_paused
+
     def paused_duration(self) -> timedelta:
         """
         Total paused duration including an active pause (if any).
         """
         if self.paused_at:
-            return self.total_paused + (now(self.tz) - self.paused_at)
+            return timedelta(seconds=self._paused_s_at(monotonic_s()))
         return self.total_paused
 
     def since_last_pause(self) -> Optional[timedelta]:
@@ -290,6 +360,7 @@ class PauseState:
         self.last_paused_at = None
         self.last_resumed_at = None
         self.total_paused = timedelta()
+        self._paused_mark = None
 
 
 @dataclass
@@ -299,9 +370,14 @@ class TimedSession:
 
     active_elapsed() / active_remaining() subtract/add paused duration so the session's
     "active time" does not advance while paused.
+
+    active_elapsed() runs on the monotonic clock when the session was started
+    via start(); a window.start assigned directly falls back to wall-clock math.
     """
     window: TimeWindow = field(default_factory=TimeWindow)
     pause: PauseState = field(default_factory=PauseState)
+    # (window.start, monotonic_s at start) recorded by start()
+    _start_mark: Optional[Tuple[datetime, float]] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         # Keep pause tz aligned to window tz
@@ -309,6 +385,7 @@ class TimedSession:
 
     def start(self) -> None:
         self.window.set_start()
+        self._start_mark = (self.window.start, monotonic_s()) if self.window.start else None
         self.pause.tz = self.window.tz
         self.pause.reset()
 
@@ -316,11 +393,19 @@ class TimedSession:
         self.window.set_end()
 
     def active_elapsed(self) -> Optional[timedelta]:
-        if not self.window.start:
+        start = self.window.start
+        if not start:
             return None
-        return (now(self.window.tz) - self.window.start) - self.pause.paused_duration()
+        mark = self._start_mark
+        if mark is not None and mark[0] is start:
+            mono = monotonic_s()
+            return timedelta(seconds=(mono - mark[1]) - self.pause._paused_s_at(mono))
+        t = now(self.window.tz)
+        return (t - start) - self.pause._paused_duration_at(t)
 
     def active_remaining(self) -> Optional[timedelta]:
-        if not self.window.end:
+        end = self.window.end
+        if not end:
             return None
-        return (self.window.end - now(self.window.tz)) + self.pause.paused_duration()
+        t = now(self.window.tz)
+        return (end - t) + self.pause._paused_duration_at(t)
@@ -4,6 +4,6 @@
 DDP (Distributed Display Protocol) sender utilities.
 """
 
-from .ddp import DdpSender, build_ddp_packet
+from .ddp import DDP_MAX_PAYLOAD, DdpSender, build_ddp_packet, iter_ddp_packets
 
-__all__ = ["DdpSender", "build_ddp_packet"]
+__all__ = ["DDP_MAX_PAYLOAD", "DdpSender", "build_ddp_packet", "iter_ddp_packets"]
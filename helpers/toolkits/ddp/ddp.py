@@ -12,44 +12,118 @@ WLED DDP (RGB) expectations (common setup):
 - destination: usually 0x00
 - data_offset: byte offset into destination buffer (usually 0)
 - length: byte length of pixel payload
+- payload: at most DDP_MAX_PAYLOAD bytes per packet; larger frames are split
+  across packets with increasing data_offset (PUSH only on the last one)
 """
 
 import socket
 import struct
-from typing import Tuple
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 
 
-def build_ddp_packet(sequence: int, pixel_data: bytes, data_offset: int = 0) -> bytes:
+# Network byte order: !BBBBLH => 1,1,1,1,4,2 = 10 bytes
+_DDP_HDR = struct.Struct("!BBBBLH")
+assert _DDP_HDR.size == 10
+DDP_HEADER_LEN = _DDP_HDR.size
+_pack_header_into = _DDP_HDR.pack_into
+
+_DDP_FLAGS = 0x41       # PUSH + DDP version 1  (IMPORTANT for WLED realtime)
+_DDP_FLAGS_NO_PUSH = 0x40  # version 1 only; receivers wait for the PUSH packet
+_DDP_TYPE_RGB = 0x01    # RGB
+_DDP_DEST = 0x00
+
+# 480 RGB pixels; keeps header + payload inside a 1500-byte Ethernet MTU.
+DDP_MAX_PAYLOAD = 1440
+
+
+def _check_pixel_data(pixel_data: bytes, max_len: Optional[int] = DDP_MAX_PAYLOAD) -> None:
+    """Type + size contract: bytes-like, whole RGB triples, at most `max_len` bytes."""
+    if not isinstance(pixel_data, (bytes, bytearray, memoryview)):
+        raise TypeError(f"pixel_data must be bytes-like, got {type(pixel_data).__name__}")
+    n = len(pixel_data)
+    if n % 3:
+        raise ValueError(f"pixel_data must be whole RGB triples (got {n} bytes)")
+    if max_len is not None and n > max_len:
+        raise ValueError(f"pixel_data exceeds {max_len} bytes per DDP packet (got {n}); use iter_ddp_packets")
+
+
+def _pack_ddp_into(
+    buf: bytearray,
+    sequence: int,
+    pixel_data: bytes,
+    data_offset: int,
+    push: bool = True,
+) -> None:
+    """
+    Write header + payload into `buf` (sized DDP_HEADER_LEN + len(pixel_data)).
+
+    Contract: sequence and data_offset are ints (checked only under __debug__).
+    """
+    if __debug__:
+        assert isinstance(sequence, int), f"sequence must be int, got {type(sequence).__name__}"
+        assert isinstance(data_offset, int), f"data_offset must be int, got {type(data_offset).__name__}"
+    _pack_header_into(
+        buf,
+        0,
+        _DDP_FLAGS if push else _DDP_FLAGS_NO_PUSH,
+        sequence & 0xFF,
+        _DDP_TYPE_RGB,
+        _DDP_DEST,
+        data_offset,
+        len(pixel_data),
+    )
+    buf[DDP_HEADER_LEN:] = pixel_data
+
+
+def build_ddp_packet(sequence: int, pixel_data: bytes, data_offset: int = 0) -> bytearray:
     """
     Build a single DDP packet for RGB pixel data.
 
     Args:
         sequence: 0..255 (wraps), used by receivers to detect ordering
-        pixel_data: packed RGB bytes (3 bytes per pixel)
-        data_offset: byte offset into destination buffer (usually 0)
+        pixel_data: packed RGB bytes (3 bytes per pixel, at most DDP_MAX_PAYLOAD)
+        data_offset: byte offset into destination buffer (usually 0); must be an int
 
     Returns:
-        bytes: header + pixel payload
+        bytearray: header + pixel payload in one buffer (bytes-like, ready for sendto)
+
+    Raises:
+        ValueError: payload is not whole RGB triples or exceeds DDP_MAX_PAYLOAD.
     """
-    if not isinstance(pixel_data, (bytes, bytearray, memoryview)):
-        raise TypeError(f"pixel_data must be bytes-like, got {type(pixel_data).__name__}")
+    _check_pixel_data(pixel_data)
 
-    flags = 0x41        # PUSH + DDP version 1  (IMPORTANT for WLED realtime)
-    data_type = 0x01    # RGB
-    destination = 0x00
-    length = len(pixel_data)
+    # One allocation, one payload copy (no header + bytes(payload) concatenation).
+    buf = bytearray(DDP_HEADER_LEN + len(pixel_data))
+    _pack_ddp_into(buf, sequence, pixel_data, data_offset)
+    return buf
 
-    # Network byte order: !BBBBLH => 1,1,1,1,4,2 = 10 bytes
-    header = struct.pack(
-        "!BBBBLH",
-        flags,
-        sequence & 0xFF,
-        data_type,
-        destination,
-        int(data_offset),
-        int(length),
-    )
-    return header + bytes(pixel_data)
+
+def _split_payload(pixel_data: bytes, chunk: int) -> Iterator[memoryview]:
+    mv = memoryview(pixel_data).cast("B")
+    for off in range(0, len(mv), chunk):
+        yield mv[off:off + chunk]
+
+
+def iter_ddp_packets(sequence: int, pixel_data: bytes, *, chunk: int = DDP_MAX_PAYLOAD) -> Iterator[bytearray]:
+    """
+    Yield DDP packets for a frame of any length.
+
+    The payload is sliced via memoryview (no intermediate copies) into chunks of
+    `chunk` bytes at increasing data_offset. All packets share `sequence`; only
+    the last one carries PUSH.
+    """
+    _check_pixel_data(pixel_data, max_len=None)
+    if chunk <= 0 or chunk % 3 or chunk > DDP_MAX_PAYLOAD:
+        raise ValueError(f"chunk must be a positive multiple of 3 <= {DDP_MAX_PAYLOAD} (got {chunk})")
+
+    n = len(pixel_data)
+    offset = 0
+    for part in _split_payload(pixel_data, chunk):
+        size = len(part)
+        buf = bytearray(DDP_HEADER_LEN + size)
+        _pack_ddp_into(buf, sequence, part, offset, push=(offset + size >= n))
+        yield buf
+        offset += size
 
 
 class DdpSender:
@@ -59,18 +133,103 @@ class DdpSender:
     Notes:
     - Not thread-safe by itself; caller should serialize send_frame per sender.
     - Sequence wraps at 256.
+    - The packet buffer is reused while the payload size stays the same
+      (a strip has a fixed LED count), so steady-state sends do not allocate.
+    - The socket is connected to the receiver, so sends skip per-packet
+      address handling. ICMP "port unreachable" reports are ignored, matching
+      fire-and-forget sendto semantics.
+    - The socket is non-blocking with an enlarged send buffer. If the kernel
+      buffer is full the frame is dropped (counted in dropped_frames) rather
+      than stalling the render loop; pass strict=True to raise instead.
     """
 
-    def __init__(self, ip: str, port: int = 4048) -> None:
+    def __init__(
+        self,
+        ip: str,
+        port: int = 4048,
+        *,
+        sndbuf: Optional[int] = 256 * 1024,
+        strict: bool = False,
+    ) -> None:
         self._addr: Tuple[str, int] = (ip, int(port))
+        self._strict = bool(strict)
+        self._dropped = 0
         self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if sndbuf:
+            try:
+                self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, int(sndbuf))
+            except OSError:
+                pass  # keep the OS default
+        self._sock.connect(self._addr)
+        self._sock.setblocking(False)
         self._seq = 0
+        # payload length -> reusable packet buffer (a split frame uses at most two sizes)
+        self._bufs: Dict[int, bytearray] = {}
+
+    def _packet_buf(self, payload_len: int) -> bytearray:
+        buf = self._bufs.get(payload_len)
+        if buf is None:
+            if len(self._bufs) >= 4:
+                self._bufs.clear()
+            buf = self._bufs[payload_len] = bytearray(DDP_HEADER_LEN + payload_len)
+        return buf
+
+    @property
+    def dropped_frames(self) -> int:
+        """Frames skipped because the socket send buffer was full."""
+        return self._dropped
+
+    def _send(self, buf: bytearray) -> bool:
+        """Send one packet; return False if it was dropped (buffer full)."""
+        try:
+            self._sock.send(buf)
+        except ConnectionRefusedError:
+            # Receiver not listening (yet); realtime frames are best-effort.
+            pass
+        except BlockingIOError:
+            if self._strict:
+                raise
+            self._dropped += 1
+            return False
+        return True
 
     def send_frame(self, pixel_data: bytes) -> None:
-        packet = build_ddp_packet(self._seq, pixel_data, data_offset=0)
-        self._sock.sendto(packet, self._addr)
+        """Send one frame; payloads over DDP_MAX_PAYLOAD are split automatically."""
+        _check_pixel_data(pixel_data, max_len=None)
+        if len(pixel_data) > DDP_MAX_PAYLOAD:
+            self.send_universes(_split_payload(pixel_data, DDP_MAX_PAYLOAD))
+            return
+
+        buf = self._packet_buf(len(pixel_data))
+        _pack_ddp_into(buf, self._seq, pixel_data, 0)
+        self._send(buf)
         self._seq = (self._seq + 1) % 256
 
+    def send_universes(self, chunks: Iterable[bytes]) -> None:
+        """
+        Send one frame split across consecutive chunks ("universes").
+
+        Each chunk is placed at the running byte offset and all chunks share
+        one sequence number. Only the last packet carries the PUSH flag, so
+        receivers apply the frame once it is complete.
+        """
+        parts = list(chunks)
+        if not parts:
+            return
+        for part in parts:
+            _check_pixel_data(part)
+
+        seq = self._seq
+        offset = 0
+        last = len(parts) - 1
+        for i, part in enumerate(parts):
+            buf = self._packet_buf(len(part))
+            _pack_ddp_into(buf, seq, part, offset, push=(i == last))
+            if not self._send(buf):
+                break  # don't PUSH a partial frame; the drop is already counted
+            offset += len(part)
+        self._seq = (seq + 1) % 256
+
     def close(self) -> None:
         try:
             self._sock.close()
@@ -1,6 +1,7 @@
 # helpers/toolkits/ui/runtime/commands.py
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Callable, Dict, Optional
 
@@ -11,34 +12,41 @@ CommandFn = Callable[[UiCtx, Optional[dict]], None]
 EnabledFn = Callable[[UiCtx], bool]
 
 
-@dataclass
+@dataclass(slots=True)
 class _CmdEntry:
     fn: CommandFn
     enabled_when: Optional[EnabledFn] = None
 
 
 class CommandRegistry:
+    """
+    Command id -> handler.
+
+    Ids are interned on registration; ids coming from a loaded UiSpec are
+    interned too, so menu dispatch lookups hit on identity before comparing.
+    """
+
     def __init__(self) -> None:
         self._cmds: Dict[str, _CmdEntry] = {}
 
     def register(self, command_id: str, fn: CommandFn, enabled_when: Optional[EnabledFn] = None) -> None:
         if command_id in self._cmds:
             raise ValueError(f"Command already registered: {command_id}")
-        self._cmds[command_id] = _CmdEntry(fn=fn, enabled_when=enabled_when)
+        self._cmds[sys.intern(command_id)] = _CmdEntry(fn=fn, enabled_when=enabled_when)
 
     def is_enabled(self, command_id: str, ctx: UiCtx) -> bool:
         ent = self._cmds.get(command_id)
         if ent is None:
             return False
-        if ent.enabled_when is None:
-            return True
-        return bool(ent.enabled_when(ctx))
+        enabled_when = ent.enabled_when
+        return enabled_when is None or bool(enabled_when(ctx))
 
     def execute(self, command_id: str, ctx: UiCtx, payload: Optional[dict] = None) -> None:
         ent = self._cmds.get(command_id)
         if ent is None:
             raise KeyError(f"Unknown command_id: {command_id}")
-        if ent.enabled_when is not None and not ent.enabled_when(ctx):
+        enabled_when = ent.enabled_when
+        if enabled_when is not None and not enabled_when(ctx):
             return
         ent.fn(ctx, payload)
         ctx.events.emit("command_executed", command_id=command_id)
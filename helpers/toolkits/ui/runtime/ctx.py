@@ -10,7 +10,7 @@ from .events import UiEventBus
 from .windows import UiHost
 
 
-@dataclass
+@dataclass(slots=True)
 class UiCtx:
     spec: UiSpec
     state: UiState
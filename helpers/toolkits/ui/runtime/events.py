@@ -1,26 +1,99 @@
 # helpers/toolkits/ui/runtime/events.py
 from __future__ import annotations
 
+import threading
+from collections import deque
 from dataclasses import dataclass
+from queue import SimpleQueue
 from time import time
-from typing import Any, Dict, List
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UiEvent:
     type: str
     payload: Dict[str, Any]
     ts: float
 
 
+# (type, payload, ts) as buffered by UiEventBus; upgraded to UiEvent on drain().
+_RawEvent = Tuple[str, Dict[str, Any], float]
+
+Subscriber = Callable[[UiEvent], None]
+
+_STOP = object()
+
+
 class UiEventBus:
-    def __init__(self) -> None:
-        self._events: List[UiEvent] = []
+    """
+    In-memory event queue drained once per frame by the host loop.
+
+    Events are buffered as plain (type, payload, ts) tuples, stamped with
+    time() per emit, and only turned into UiEvent objects in drain().
+
+    `maxlen` bounds the buffer (oldest events are dropped); None = unbounded.
+
+    Subscribers (add_subscriber) are optional push consumers for slow work such
+    as logging or inspectors. They run on a background daemon thread fed by a
+    SimpleQueue, so emit() on the UI thread only enqueues. Subscribers see
+    events in emit order and must be thread-safe; exceptions they raise are
+    swallowed (stored in last_subscriber_error). drain() is unaffected.
+    """
+
+    def __init__(self, *, maxlen: Optional[int] = None) -> None:
+        self._buf: Deque[_RawEvent] = deque(maxlen=maxlen)
+
+        self._subscribers: Tuple[Subscriber, ...] = ()
+        self._q: Optional["SimpleQueue[Any]"] = None
+        self._thread: Optional[threading.Thread] = None
+        self.last_subscriber_error: Optional[str] = None
 
     def emit(self, type: str, **payload: Any) -> None:
-        self._events.append(UiEvent(type=type, payload=dict(payload), ts=time()))
+        # The kwargs dict is fresh per call and is handed to consumers as-is
+        # (UiEvent.payload). It is deliberately not pooled/reused: drained
+        # events may outlive the frame, and copying into a pooled dict would
+        # cost more than the allocation it saves.
+        ev = (type, payload, time())
+        self._buf.append(ev)
+        q = self._q
+        if q is not None:
+            q.put_nowait(ev)
+
+    def add_subscriber(self, fn: Subscriber) -> None:
+        """Register a push consumer; starts the dispatch thread on first use."""
+        self._subscribers = self._subscribers + (fn,)
+        if self._thread is None:
+            self._q = SimpleQueue()
+            self._thread = threading.Thread(target=self._dispatch_loop, args=(self._q,), name="UiEventBus", daemon=True)
+            self._thread.start()
+
+    def close(self, *, join_timeout_s: float = 2.0) -> None:
+        """Stop the dispatch thread after it delivers already-queued events (idempotent)."""
+        q, t = self._q, self._thread
+        if q is None or t is None:
+            return
+        self._q = None
+        self._thread = None
+        q.put_nowait(_STOP)
+        t.join(timeout=join_timeout_s)
+
+    def _dispatch_loop(self, q: "SimpleQueue[Any]") -> None:
+        while True:
+            raw = q.get()
+            if raw is _STOP:
+                return
+            t, p, ts = raw
+            ev = UiEvent(type=t, payload=p, ts=ts)
+            for fn in self._subscribers:
+                try:
+                    fn(ev)
+                except Exception as e:
+                    self.last_subscriber_error = repr(e)
 
     def drain(self) -> List[UiEvent]:
-        out = self._events[:]
-        self._events.clear()
+        buf = self._buf
+        if not buf:
+            return []
+        out = [UiEvent(type=t, payload=p, ts=ts) for t, p, ts in buf]
+        buf.clear()
         return out
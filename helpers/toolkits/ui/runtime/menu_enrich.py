@@ -1,7 +1,8 @@
 # helpers/toolkits/ui/runtime/menu_enrich.py
 from __future__ import annotations
 
-from typing import List, Set
+import weakref
+from typing import Dict, List, Set, Tuple
 
 from helpers.toolkits.ui.spec.models import (
     MenuItem,
@@ -14,25 +15,54 @@ from helpers.toolkits.ui.spec.models import (
 )
 
 
+# id(spec) -> enriched menus. UiSpec is frozen but unhashable (list fields), so
+# entries are keyed by identity and evicted when the spec is garbage-collected.
+_ENRICH_CACHE: Dict[int, Tuple[MenuSpec, ...]] = {}
+
+
 def enrich_menus(spec: UiSpec) -> List[MenuSpec]:
+    """
+    Return spec.menus plus default File/Help menus and View window toggles.
+
+    The result is memoized per UiSpec instance (specs are treated as immutable
+    once loaded), so repeated session builds skip the menu walk. A fresh list
+    is returned on every call.
+    """
+    key = id(spec)
+    cached = _ENRICH_CACHE.get(key)
+    if cached is None:
+        cached = _ENRICH_CACHE[key] = tuple(_enrich_menus(spec))
+        weakref.finalize(spec, _ENRICH_CACHE.pop, key, None)
+    return list(cached)
+
+
+def _enrich_menus(spec: UiSpec) -> List[MenuSpec]:
     menus = list(spec.menus)
-    menus = _ensure_default_file_help(spec, menus)
-    menus = _ensure_view_toggles(spec, menus)
+    # title -> index, built once; helpers append to `menus` and keep it in sync
+    idx: Dict[str, int] = {}
+    for i, m in enumerate(menus):
+        idx.setdefault(m.title, i)  # first menu wins, as with a linear scan
+    _ensure_default_file_help(spec, menus, idx)
+    _ensure_view_toggles(spec, menus, idx)
     return menus
 
 
-def _ensure_default_file_help(spec: UiSpec, menus: List[MenuSpec]) -> List[MenuSpec]:
-    titles = [m.title for m in menus]
-    cmd_ids = spec.command_ids()
-    out = list(menus)
+def _append_menu(menus: List[MenuSpec], idx: Dict[str, int], menu: MenuSpec) -> int:
+    idx[menu.title] = len(menus)
+    menus.append(menu)
+    return idx[menu.title]
 
-    if "File" not in titles:
+
+def _ensure_default_file_help(spec: UiSpec, menus: List[MenuSpec], idx: Dict[str, int]) -> None:
+    if "File" in idx and "Help" in idx:
+        return
+    if "File" not in idx:
         file_items: List[MenuItem] = []
-        if "app.quit" in cmd_ids:
+        if "app.quit" in spec.command_ids():
             file_items.append(MenuItemCommand(type="command", command_id="app.quit"))
-        out.append(MenuSpec(id="file", title="File", items=file_items))
+        _append_menu(menus, idx, MenuSpec(id="file", title="File", items=file_items))
 
-    if "Help" not in titles:
+    if "Help" not in idx:
         help_items: List[MenuItem] = []
         # If there is an about window, add it as a toggle
         about_candidates = [
@@ -42,40 +72,41 @@ def _ensure_default_file_help(spec: UiSpec, menus: List[MenuSpec]) -> List[MenuS
         ]
         if about_candidates:
             help_items.append(MenuItemWindowToggle(type="window_toggle", window_id=about_candidates[0]))
-        out.append(MenuSpec(id="help", title="Help", items=help_items))
-
-    return out
-
+        _append_menu(menus, idx, MenuSpec(id="help", title="Help", items=help_items))
 
-def _ensure_view_toggles(spec: UiSpec, menus: List[MenuSpec]) -> List[MenuSpec]:
-    view_idx = None
-    for i, m in enumerate(menus):
-        if m.title == "View":
-            view_idx = i
-            break
 
-    out = list(menus)
+def _ensure_view_toggles(spec: UiSpec, menus: List[MenuSpec], idx: Dict[str, int]) -> None:
+    view_idx = idx.get("View")
     if view_idx is None:
-        out.append(MenuSpec(id="view", title="View", items=[]))
-        view_idx = len(out) - 1
-
-    view_menu = out[view_idx]
-
-    existing: Set[str] = set()
-
-    def walk(items: List[MenuItem]) -> None:
-        for it in items:
-            if isinstance(it, MenuItemWindowToggle):
-                existing.add(it.window_id)
-            elif isinstance(it, MenuItemSubmenu):
-                walk(it.items)
-
-    walk(view_menu.items)
+        view_idx = _append_menu(menus, idx, MenuSpec(id="view", title="View", items=[]))
+
+    view_menu = menus[view_idx]
+
+    missing = set(spec.window_ids())
+    if not missing:
+        return  # no windows; nothing to toggle
+
+    # Cross off window ids already toggled anywhere under View (explicit stack,
+    # no recursion) and stop as soon as every window is covered. Menu item
+    # classes are concrete, so exact type checks suffice.
+    discard = missing.discard
+    stack: List[MenuItem] = list(view_menu.items)
+    seen_subs: Set[int] = set()
+    while stack:
+        it = stack.pop()
+        t = type(it)
+        if t is MenuItemWindowToggle:
+            discard(it.window_id)
+            if not missing:
+                return  # View already complete; keep the original MenuSpec
+        elif t is MenuItemSubmenu and id(it) not in seen_subs:
+            seen_subs.add(id(it))  # shared subtrees are walked once
+            stack.extend(it.items)
 
     new_items = list(view_menu.items)
-    for w in spec.windows:
-        if w.id not in existing:
-            new_items.append(MenuItemWindowToggle(type="window_toggle", window_id=w.id))
-
-    out[view_idx] = MenuSpec(id=view_menu.id, title=view_menu.title, items=new_items)
-    return out
+    new_items.extend(
+        MenuItemWindowToggle(type="window_toggle", window_id=w.id)
+        for w in spec.windows
+        if w.id in missing
+    )
+    menus[view_idx] = MenuSpec(id=view_menu.id, title=view_menu.title, items=new_items)
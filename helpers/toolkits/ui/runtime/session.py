@@ -1,10 +1,10 @@
 # helpers/toolkits/ui/runtime/session.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
-from helpers.toolkits.ui.spec.models import UiSpec
+from helpers.toolkits.ui.spec.models import UiSpec, WindowSpec
 from helpers.toolkits.ui.state.models import UiState
 from .commands import CommandRegistry
 from .ctx import UiCtx
@@ -13,19 +13,31 @@ from .windows import UiHost, WindowFactoryRegistry, WindowHandle
 from .menu_enrich import enrich_menus
 
 
-@dataclass
+@dataclass(slots=True)
 class UiSession:
     spec: UiSpec
     state: UiState
     commands: CommandRegistry
     factories: WindowFactoryRegistry
 
+    # Windows are materialized lazily: drawn_on_start windows at build(), the
+    # rest on first toggle (or when saved state says they are open).
     _handles: Optional[Dict[str, WindowHandle]] = None
+    _host: Optional[UiHost] = None
+    _ctx: Optional[UiCtx] = None
+    # Flat (window_id, handle) list for apply/capture, appended as windows are
+    # created; WindowSpecs not yet materialized, in spec order.
+    _plan: List[Tuple[str, WindowHandle]] = field(default_factory=list)
+    _pending: Dict[str, WindowSpec] = field(default_factory=dict)
 
     def build(self, host: UiHost, services: object | None = None) -> UiCtx:
         self._handles = {}
+        self._plan = []
+        self._pending = {w.id: w for w in self.spec.windows}
+        self._host = host
         events = UiEventBus()
         ctx = UiCtx(spec=self.spec, state=self.state, events=events, host=host, services=services)
+        self._ctx = ctx
 
         def on_command(command_id: str, payload: Optional[dict] = None) -> None:
             self.commands.execute(command_id, ctx, payload)
@@ -37,30 +49,62 @@ class UiSession:
         effective_menus = enrich_menus(self.spec)
         host.build_menus(effective_menus, on_command=on_command, on_window_toggle=on_window_toggle)
 
+        # Validate every factory up front (one pass, all offenders reported) so
+        # a bad spec still fails at build time even for lazily created windows.
+        registered = self.factories.keys()
+        missing = [f"{w.id} -> {w.factory}" for w in self.spec.windows if w.factory not in registered]
+        if missing:
+            raise KeyError(f"Windows reference unregistered factories: {', '.join(missing)}")
+
         for w in self.spec.windows:
-            if not self.factories.has(w.factory):
-                raise KeyError(f"Window {w.id} references unregistered factory: {w.factory}")
-            handle = host.create_window(w, w.factory, ctx)
-            self._handles[w.id] = handle
+            if w.drawn_on_start:
+                self._create_window(w)
 
         return ctx
 
+    def _create_window(self, w: WindowSpec) -> WindowHandle:
+        assert self._handles is not None and self._host is not None
+        handle = self._host.create_window(w, w.factory, self._ctx)
+        self._handles[w.id] = handle
+        self._plan.append((w.id, handle))
+        self._pending.pop(w.id, None)
+        return handle
+
+    def _ensure_window(self, window_id: str) -> WindowHandle:
+        """Return the window's handle, creating it (with its saved state applied) on first use."""
+        assert self._handles is not None
+        h = self._handles.get(window_id)
+        if h is None:
+            w = self._pending.get(window_id)
+            if w is None:
+                raise KeyError(f"Unknown window_id: {window_id}")
+            h = self._create_window(w)
+            h.apply_state(self.state.get_window(window_id))
+        return h
+
     def apply_state(self) -> None:
         assert self._handles is not None
-        for win_id, handle in self._handles.items():
-            ws = self.state.get_window(win_id)
-            handle.apply_state(ws)
+        # WindowStates are looked up per call, not cached in the plan:
+        # capture_state() replaces the entries in state.windows.
+        get_window = self.state.get_window
+        for win_id, handle in self._plan:
+            handle.apply_state(get_window(win_id))
+
+        for w in list(self._pending.values()):
+            ws = get_window(w.id)
+            if ws.is_open:
+                self._create_window(w).apply_state(ws)
+            # else: stays unmaterialized until toggled
 
     def capture_state(self) -> None:
+        # Windows never materialized keep their stored state as-is.
         assert self._handles is not None
-        for win_id, handle in self._handles.items():
-            self.state.windows[win_id] = handle.capture_state()
+        put = self.state.windows.__setitem__
+        for win_id, handle in self._plan:
+            put(win_id, handle.capture_state())
 
     def toggle_window(self, window_id: str) -> None:
-        assert self._handles is not None
-        if window_id not in self._handles:
-            raise KeyError(f"Unknown window_id: {window_id}")
-        h = self._handles[window_id]
+        h = self._ensure_window(window_id)
         new_open = not h.is_open()
         h.set_open(new_open)
         ws = self.state.get_window(window_id)
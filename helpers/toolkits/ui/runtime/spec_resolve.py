@@ -1,8 +1,9 @@
 # helpers/toolkits/ui/runtime/spec_resolve.py
 from __future__ import annotations
 
+import copy
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from helpers.validation import ValidationError
 from helpers.fs import read_json_strict
@@ -11,6 +12,13 @@ from helpers.fs.paths import join_safe
 from helpers.toolkits.ui.spec.models import WindowSpec
 
 
+# (resolved path, mtime_ns, size) -> parsed args document. Windows often share
+# one factory_args_ref; editing the file changes the key, so stale entries are
+# simply never hit again.
+_ARGS_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+_ARGS_CACHE_MAX = 64
+
+
 def resolve_window_factory_args(
     window: WindowSpec,
     *,
@@ -33,8 +41,7 @@ def _load_args_ref(ref: str, *, helpers_root: Optional[Path]) -> Dict[str, Any]:
 
     if ref.startswith("path:"):
         p = Path(ref[len("path:") :]).expanduser()
-        raw = read_json_strict(p, root_types=(dict,))
-        return dict(raw)
+        return _read_args_cached(p)
 
     if ref.startswith("configs:"):
         if helpers_root is None:
@@ -47,7 +54,30 @@ def _load_args_ref(ref: str, *, helpers_root: Optional[Path]) -> Dict[str, Any]:
             raise ValidationError(f"configs: ref must be 'configs:<app>/<path>', got {ref!r}")
         app, rel = tail.split("/", 1)
         p = join_safe(Path(helpers_root), "configs", app, rel)
-        raw = read_json_strict(p, root_types=(dict,))
-        return dict(raw)
+        return _read_args_cached(p)
 
     raise ValidationError(f"Unsupported factory_args_ref scheme: {ref!r}")
+
+
+def _read_args_cached(p: Path) -> Dict[str, Any]:
+    """
+    Read an args JSON object, memoized by (path, mtime, size).
+
+    Returns a deep copy, so callers may mutate the result (including nested
+    values) without corrupting the cached document.
+    """
+    try:
+        p = p.resolve()
+        st = p.stat()
+    except OSError:
+        # Let read_json_strict report the missing/unreadable file as before.
+        return dict(read_json_strict(p, root_types=(dict,)))
+
+    key = (str(p), st.st_mtime_ns, st.st_size)
+    raw = _ARGS_CACHE.get(key)
+    if raw is None:
+        raw = read_json_strict(p, root_types=(dict,))
+        if len(_ARGS_CACHE) >= _ARGS_CACHE_MAX:
+            _ARGS_CACHE.clear()
+        _ARGS_CACHE[key] = raw
+    return copy.deepcopy(raw)
@@ -1,8 +1,9 @@
 # helpers/toolkits/ui/runtime/windows.py
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Protocol
+from typing import Any, Callable, Dict, KeysView, Optional, Protocol
 
 from helpers.toolkits.ui.spec import WindowSpec
 from helpers.toolkits.ui.state import WindowState
@@ -18,7 +19,7 @@ class WindowHandle(Protocol):
     def capture_state(self) -> WindowState: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtraStateHooks:
     """
     Optional per-window extra-state hooks.
@@ -42,7 +43,7 @@ class UiHost(Protocol):
 WindowBuildFn = Callable[[UiHost, Any, str, str], Optional[ExtraStateHooks]]
 
 
-@dataclass
+@dataclass(slots=True)
 class _FactoryEntry:
     fn: WindowBuildFn
 
@@ -54,13 +55,21 @@ class WindowFactoryRegistry:
     def register(self, factory_key: str, fn: WindowBuildFn) -> None:
         if factory_key in self._factories:
             raise ValueError(f"Factory already registered: {factory_key}")
-        self._factories[factory_key] = _FactoryEntry(fn=fn)
+        self._factories[sys.intern(factory_key)] = _FactoryEntry(fn=fn)
 
-    def build(self, factory_key: str, host: UiHost, ctx: Any, window_id: str, parent_tag: str) -> Optional[ExtraStateHooks]:
+    def get_or_raise(self, factory_key: str) -> WindowBuildFn:
+        """Return the build function for `factory_key` (single lookup); KeyError if unknown."""
         ent = self._factories.get(factory_key)
         if ent is None:
             raise KeyError(f"Unknown factory key: {factory_key}")
-        return ent.fn(host, ctx, window_id, parent_tag)
+        return ent.fn
+
+    def build(self, factory_key: str, host: UiHost, ctx: Any, window_id: str, parent_tag: str) -> Optional[ExtraStateHooks]:
+        return self.get_or_raise(factory_key)(host, ctx, window_id, parent_tag)
 
     def has(self, factory_key: str) -> bool:
         return factory_key in self._factories
+
+    def keys(self) -> KeysView[str]:
+        """Live read-only view of the registered factory keys."""
+        return self._factories.keys()
@@ -2,13 +2,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, FrozenSet, List, Literal, Optional, Union
 
 
 CommandKind = Literal["app", "builtin", "runtime"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandSpec:
     id: str
     title: str
@@ -20,25 +20,25 @@ class CommandSpec:
 MenuItemType = Literal["command", "submenu", "separator", "window_toggle"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MenuItemCommand:
     type: Literal["command"]
     command_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MenuItemSubmenu:
     type: Literal["submenu"]
     title: str
     items: List["MenuItem"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MenuItemSeparator:
     type: Literal["separator"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MenuItemWindowToggle:
     type: Literal["window_toggle"]
     window_id: str
@@ -47,7 +47,7 @@ class MenuItemWindowToggle:
 MenuItem = Union[MenuItemCommand, MenuItemSubmenu, MenuItemSeparator, MenuItemWindowToggle]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MenuSpec:
     id: str
     title: str
@@ -57,14 +57,14 @@ class MenuSpec:
 DockArea = Literal["left", "right", "top", "bottom", "center"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DockHint:
     area: DockArea = "center"
     ratio: Optional[float] = None
     target_window_id: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WindowSpec:
     id: str
     title: str
@@ -78,6 +78,8 @@ class WindowSpec:
     factory_args_ref: Optional[str] = None
 
 
+# Not slotted: enrich_menus attaches a weakref.finalize to each spec, and
+# weakref_slot=True needs Python 3.11.
 @dataclass(frozen=True)
 class UiSpec:
     version: int
@@ -85,11 +87,23 @@ class UiSpec:
     menus: List[MenuSpec] = field(default_factory=list)
     windows: List[WindowSpec] = field(default_factory=list)
 
-    def command_ids(self) -> set[str]:
-        return {c.id for c in self.commands}
-
-    def window_ids(self) -> set[str]:
-        return {w.id for w in self.windows}
+    # Lazily computed id sets; a loaded spec is treated as immutable.
+    _command_ids: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+    _window_ids: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def command_ids(self) -> FrozenSet[str]:
+        ids = self._command_ids
+        if ids is None:
+            ids = frozenset(c.id for c in self.commands)
+            object.__setattr__(self, "_command_ids", ids)
+        return ids
+
+    def window_ids(self) -> FrozenSet[str]:
+        ids = self._window_ids
+        if ids is None:
+            ids = frozenset(w.id for w in self.windows)
+            object.__setattr__(self, "_window_ids", ids)
+        return ids
 
     def get_window(self, window_id: str) -> Optional[WindowSpec]:
         for w in self.windows:
@@ -1,10 +1,11 @@
 # helpers/toolkits/ui/spec/serde.py
 from __future__ import annotations
 
-import json
-from dataclasses import asdict
+import sys
 from pathlib import Path
-from typing import Any, Dict, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+from helpers.fs.json import read_json
 
 from .models import (
     CommandSpec,
@@ -21,19 +22,98 @@ from .models import (
 from .validate import validate_ui_spec
 
 
+def _intern(v: Any) -> str:
+    # Ids are used as registry/handle dict keys at runtime; interning them at
+    # load lets those lookups match on identity.
+    return sys.intern(str(v))
+
+
+def _p_command(d: Dict[str, Any]) -> MenuItem:
+    return MenuItemCommand(type="command", command_id=_intern(d["command_id"]))
+
+
+def _p_separator(d: Dict[str, Any]) -> MenuItem:
+    return MenuItemSeparator(type="separator")
+
+
+def _p_window_toggle(d: Dict[str, Any]) -> MenuItem:
+    return MenuItemWindowToggle(type="window_toggle", window_id=_intern(d["window_id"]))
+
+
+# Discriminator ("type") -> parser for leaf items; submenus are handled by
+# _parse_menu_items itself. One dict probe instead of an if-chain.
+_PARSERS: Dict[str, Callable[[Dict[str, Any]], MenuItem]] = {
+    "command": _p_command,
+    "separator": _p_separator,
+    "window_toggle": _p_window_toggle,
+}
+
+
+def _parse_menu_items(items_raw: List[Any]) -> List[MenuItem]:
+    """
+    Parse a list of menu item dicts, submenus included, without recursion.
+
+    A submenu is created as soon as it is seen with an empty `items` list that
+    its children are appended to later (the dataclass is frozen, the list is
+    not). Children are pushed reversed so every list fills in source order.
+    """
+    root: List[MenuItem] = []
+    stack: List[Tuple[List[MenuItem], Dict[str, Any]]] = [(root, cast(Dict[str, Any], x)) for x in reversed(items_raw)]
+    while stack:
+        out, d = stack.pop()
+        t = d.get("type")
+        if t == "submenu":
+            items: List[MenuItem] = []
+            out.append(MenuItemSubmenu(type="submenu", title=str(d["title"]), items=items))
+            stack.extend((items, cast(Dict[str, Any], x)) for x in reversed(d.get("items", [])))
+            continue
+        parse = _PARSERS.get(t) if isinstance(t, str) else None
+        if parse is None:
+            raise ValueError(f"Unknown menu item type: {t!r}")
+        out.append(parse(d))
+    return root
+
+
 def _parse_menu_item(d: Dict[str, Any]) -> MenuItem:
-    t = d.get("type")
-    if t == "command":
-        return MenuItemCommand(type="command", command_id=str(d["command_id"]))
-    if t == "separator":
-        return MenuItemSeparator(type="separator")
-    if t == "window_toggle":
-        return MenuItemWindowToggle(type="window_toggle", window_id=str(d["window_id"]))
-    if t == "submenu":
-        items_raw = d.get("items", [])
-        items = [_parse_menu_item(cast(Dict[str, Any], x)) for x in items_raw]
-        return MenuItemSubmenu(type="submenu", title=str(d["title"]), items=items)
-    raise ValueError(f"Unknown menu item type: {t!r}")
+    return _parse_menu_items([d])[0]
+
+
+def _share_subtrees(roots: List[List[MenuItem]]) -> None:
+    """
+    Replace structurally identical menu items/submenus with one shared instance.
+
+    Items are canonicalized bottom-up in place (the `items` lists are mutable).
+    Leaves are frozen and hashable, so they key the registry directly. A
+    submenu's key is its title plus the ids of its already-canonical children,
+    which keeps keys flat instead of hashing whole nested trees.
+    """
+    registry: Dict[Any, MenuItem] = {}
+    canon_sub: Dict[int, MenuItem] = {}
+
+    # Pre-order collection; reversed, every submenu comes after its descendants.
+    subs: List[MenuItemSubmenu] = []
+    stack: List[MenuItem] = [it for items in roots for it in items]
+    while stack:
+        it = stack.pop()
+        if type(it) is MenuItemSubmenu:
+            subs.append(it)
+            stack.extend(it.items)
+
+    def canon(it: MenuItem) -> MenuItem:
+        if type(it) is MenuItemSubmenu:
+            return canon_sub[id(it)]
+        return registry.setdefault(it, it)
+
+    for sub in reversed(subs):
+        items = sub.items
+        for i, child in enumerate(items):
+            items[i] = canon(child)
+        key = ("submenu", sub.title, tuple(id(c) for c in items))
+        canon_sub[id(sub)] = registry.setdefault(key, sub)
+
+    for items in roots:
+        for i, it in enumerate(items):
+            items[i] = canon(it)
 
 
 def _parse_dock_hint(d: Any) -> DockHint | None:
@@ -50,11 +130,11 @@ def _parse_dock_hint(d: Any) -> DockHint | None:
 
 def load_ui_spec(path: str | Path) -> UiSpec:
     p = Path(path)
-    raw = json.loads(p.read_text(encoding="utf-8"))
+    raw = read_json(p)  # orjson-accelerated when installed
 
     commands = [
         CommandSpec(
-            id=str(c["id"]),
+            id=_intern(c["id"]),
             title=str(c["title"]),
             kind=str(c.get("kind", "app")),
             payload_schema=(str(c["payload_schema"]) if c.get("payload_schema") else None),
@@ -65,8 +145,9 @@ def load_ui_spec(path: str | Path) -> UiSpec:
 
     menus = []
     for m in raw.get("menus", []):
-        items = [_parse_menu_item(x) for x in m.get("items", [])]
+        items = _parse_menu_items(m.get("items", []))
         menus.append(MenuSpec(id=str(m["id"]), title=str(m["title"]), items=items))
+    _share_subtrees([m.items for m in menus])
 
     windows = []
     for w in raw.get("windows", []):
@@ -79,9 +160,9 @@ def load_ui_spec(path: str | Path) -> UiSpec:
 
         windows.append(
             WindowSpec(
-                id=str(w["id"]),
+                id=_intern(w["id"]),
                 title=str(w["title"]),
-                factory=str(w["factory"]),
+                factory=_intern(w["factory"]),
                 drawn_on_start=bool(w.get("drawn_on_start", True)),
                 dock_hint=_parse_dock_hint(w.get("dock_hint")),
                 menu_path=([str(x) for x in menu_path_raw] if menu_path_raw is not None else None),
@@ -100,23 +181,64 @@ def load_ui_spec(path: str | Path) -> UiSpec:
     return spec
 
 
-def dump_ui_spec(spec: UiSpec) -> Dict[str, Any]:
-    def dump_menu_item(item: MenuItem) -> Dict[str, Any]:
-        if isinstance(item, MenuItemCommand):
-            return {"type": "command", "command_id": item.command_id}
-        if isinstance(item, MenuItemSeparator):
-            return {"type": "separator"}
-        if isinstance(item, MenuItemWindowToggle):
-            return {"type": "window_toggle", "window_id": item.window_id}
-        if isinstance(item, MenuItemSubmenu):
-            return {"type": "submenu", "title": item.title, "items": [dump_menu_item(x) for x in item.items]}
-        raise TypeError(f"Unsupported menu item: {type(item)}")
+def _d_command(item: Any) -> Dict[str, Any]:
+    return {"type": "command", "command_id": item.command_id}
+
+
+def _d_separator(item: Any) -> Dict[str, Any]:
+    return {"type": "separator"}
+
+
+def _d_window_toggle(item: Any) -> Dict[str, Any]:
+    return {"type": "window_toggle", "window_id": item.window_id}
+
+
+def _d_submenu(item: Any) -> Dict[str, Any]:
+    return {"type": "submenu", "title": item.title, "items": [_dump_menu_item(x) for x in item.items]}
+
+
+# Exact item class -> dumper.
+_DUMPERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    MenuItemCommand: _d_command,
+    MenuItemSeparator: _d_separator,
+    MenuItemWindowToggle: _d_window_toggle,
+    MenuItemSubmenu: _d_submenu,
+}
+
 
+def _dump_menu_item(item: MenuItem) -> Dict[str, Any]:
+    dump = _DUMPERS.get(type(item))
+    if dump is None:
+        # Subclasses of the menu item types are rare; resolve them via the MRO.
+        dump = next((_DUMPERS[k] for k in type(item).__mro__ if k in _DUMPERS), None)
+        if dump is None:
+            raise TypeError(f"Unsupported menu item: {type(item)}")
+    return dump(item)
+
+
+def _dump_command(c: CommandSpec) -> Dict[str, Any]:
+    # Field reads instead of dataclasses.asdict (which deep-copies every value).
+    return {
+        "id": c.id,
+        "title": c.title,
+        "kind": c.kind,
+        "payload_schema": c.payload_schema,
+        "enabled_when": c.enabled_when,
+    }
+
+
+def _dump_dock_hint(d: Optional[DockHint]) -> Optional[Dict[str, Any]]:
+    if d is None:
+        return None
+    return {"area": d.area, "ratio": d.ratio, "target_window_id": d.target_window_id}
+
+
+def dump_ui_spec(spec: UiSpec) -> Dict[str, Any]:
     out: Dict[str, Any] = {
         "version": spec.version,
-        "commands": [asdict(c) for c in spec.commands],
+        "commands": [_dump_command(c) for c in spec.commands],
         "menus": [
-            {"id": m.id, "title": m.title, "items": [dump_menu_item(x) for x in m.items]}
+            {"id": m.id, "title": m.title, "items": [_dump_menu_item(x) for x in m.items]}
             for m in spec.menus
         ],
         "windows": [
@@ -125,7 +247,7 @@ def dump_ui_spec(spec: UiSpec) -> Dict[str, Any]:
                 "title": w.title,
                 "factory": w.factory,
                 "drawn_on_start": w.drawn_on_start,
-                "dock_hint": (asdict(w.dock_hint) if w.dock_hint else None),
+                "dock_hint": _dump_dock_hint(w.dock_hint),
                 "menu_path": w.menu_path,
                 "factory_args": w.factory_args,
                 "factory_args_ref": w.factory_args_ref,
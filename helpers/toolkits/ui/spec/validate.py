@@ -11,29 +11,34 @@ def validate_ui_spec(spec: UiSpec) -> None:
     if spec.version not in SUPPORTED_SPEC_VERSIONS:
         raise ValueError(f"Unsupported UiSpec version: {spec.version}")
 
-    cmd_ids = [c.id for c in spec.commands]
-    win_ids = [w.id for w in spec.windows]
-    if len(set(cmd_ids)) != len(cmd_ids):
+    # Cached on the spec; duplicates show up as a size mismatch.
+    cmd_id_set = spec.command_ids()
+    win_id_set = spec.window_ids()
+    if len(cmd_id_set) != len(spec.commands):
         raise ValueError("Duplicate command IDs in UiSpec")
-    if len(set(win_ids)) != len(win_ids):
+    if len(win_id_set) != len(spec.windows):
         raise ValueError("Duplicate window IDs in UiSpec")
 
-    cmd_id_set = set(cmd_ids)
-    win_id_set = set(win_ids)
-
-    def walk_items(items):
-        for it in items:
-            if isinstance(it, MenuItemCommand):
-                if it.command_id not in cmd_id_set:
-                    raise ValueError(f"Menu references unknown command_id: {it.command_id}")
-            elif isinstance(it, MenuItemWindowToggle):
-                if it.window_id not in win_id_set:
-                    raise ValueError(f"Menu references unknown window_id: {it.window_id}")
-            elif isinstance(it, MenuItemSubmenu):
-                walk_items(it.items)
-
-    for m in spec.menus:
-        walk_items(m.items)
+    # Pre-order walk with an explicit stack (children pushed reversed), so the
+    # first offending item is reported exactly as a recursive walk would.
+    stack = []
+    seen_subs = set()
+    for m in reversed(spec.menus):
+        stack.extend(reversed(m.items))
+    while stack:
+        it = stack.pop()
+        t = type(it)
+        if t is MenuItemCommand:
+            if it.command_id not in cmd_id_set:
+                raise ValueError(f"Menu references unknown command_id: {it.command_id}")
+        elif t is MenuItemWindowToggle:
+            if it.window_id not in win_id_set:
+                raise ValueError(f"Menu references unknown window_id: {it.window_id}")
+        elif t is MenuItemSubmenu:
+            # Identical submenus are shared by the loader; check each once.
+            if id(it) not in seen_subs:
+                seen_subs.add(id(it))
+                stack.extend(reversed(it.items))
 
     for w in spec.windows:
         if not w.factory.strip():
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowState:
     id: str
     is_open: bool = True
@@ -17,7 +17,7 @@ class WindowState:
     extra: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class UiState:
     version: int = 1
     active_layout_id: str = "default"
@@ -28,6 +28,7 @@ class UiState:
     kv: Dict[str, Any] = field(default_factory=dict)
 
     def get_window(self, window_id: str) -> WindowState:
-        if window_id not in self.windows:
-            self.windows[window_id] = WindowState(id=window_id, is_open=False)
-        return self.windows[window_id]
+        ws = self.windows.get(window_id)
+        if ws is None:
+            ws = self.windows[window_id] = WindowState(id=window_id, is_open=False)
+        return ws
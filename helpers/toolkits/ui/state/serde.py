@@ -5,6 +5,9 @@ import json
 from pathlib import Path
 from typing import Any, Dict
 
+from helpers.fs.atomic import atomic_write_bytes
+from helpers.fs.json import read_json
+
 from .migrate import migrate_state_dict
 from .model import UiState, WindowState
 
@@ -13,28 +16,50 @@ def ensure_ui_state(raw: Dict[str, Any]) -> UiState:
     """
     Validate/normalize raw dict -> UiState (in-memory).
     Uses migrate_state_dict for versioning and fills defaults.
+
+    This is a hand-written decoder for a fixed schema (no per-call field
+    introspection); each key is looked up once.
+    """
+    return _build_ui_state(migrate_state_dict(dict(raw)), owned=False)
+
+
+def _build_ui_state(d: Dict[str, Any], *, owned: bool) -> UiState:
+    """
+    Build UiState from a migrated dict.
+
+    owned=True means `d` was freshly parsed and nobody else holds it, so its
+    `kv`/`extra` dicts are adopted instead of copied. Scalar and tuple
+    coercions still apply (JSON has no tuples).
     """
-    d = migrate_state_dict(dict(raw))
-
-    windows: Dict[str, WindowState] = {}
-    for win_id, ws in (d.get("windows", {}) or {}).items():
-        pos = ws.get("pos_xy")
-        size = ws.get("size_wh")
-        windows[str(win_id)] = WindowState(
-            id=str(win_id),
-            is_open=bool(ws.get("is_open", True)),
-            pos_xy=(tuple(pos) if pos is not None else None),    # type: ignore[arg-type]
-            size_wh=(tuple(size) if size is not None else None),  # type: ignore[arg-type]
-            docked_to=(str(ws["docked_to"]) if ws.get("docked_to") else None),
-            extra=dict(ws.get("extra", {}) or {}),
-        )
+    windows_raw = d.get("windows") or {}
+    windows: Dict[str, WindowState] = {
+        win_id: _window_state(win_id, ws, owned)
+        for win_id, ws in zip(map(str, windows_raw), windows_raw.values())
+    }
 
+    blob = d.get("dock_layout_blob")
+    kv = d.get("kv")
     return UiState(
         version=int(d.get("version", 1)),
         active_layout_id=str(d.get("active_layout_id", "default")),
-        dock_layout_blob=(str(d["dock_layout_blob"]) if d.get("dock_layout_blob") else None),
+        dock_layout_blob=(str(blob) if blob else None),
         windows=windows,
-        kv=dict(d.get("kv", {}) or {}),
+        kv=(kv if owned and type(kv) is dict else dict(kv or {})),
+    )
+
+
+def _window_state(win_id: str, ws: Dict[str, Any], owned: bool = False) -> WindowState:
+    pos = ws.get("pos_xy")
+    size = ws.get("size_wh")
+    docked = ws.get("docked_to")
+    extra = ws.get("extra")
+    return WindowState(
+        id=win_id,
+        is_open=bool(ws.get("is_open", True)),
+        pos_xy=(tuple(pos) if pos is not None else None),    # type: ignore[arg-type]
+        size_wh=(tuple(size) if size is not None else None),  # type: ignore[arg-type]
+        docked_to=(str(docked) if docked else None),
+        extra=(extra if owned and type(extra) is dict else dict(extra or {})),
     )
 
 
@@ -42,8 +67,11 @@ def load_ui_state(path: str | Path) -> UiState:
     p = Path(path)
     if not p.exists():
         return UiState()
-    d = json.loads(p.read_text(encoding="utf-8"))
-    return ensure_ui_state(d)
+    d = read_json(p)  # orjson-accelerated when installed
+    if type(d) is not dict:
+        return ensure_ui_state(d)
+    # Freshly parsed and private to this call: skip the defensive copies.
+    return _build_ui_state(migrate_state_dict(d), owned=True)
 
 
 def dump_ui_state(state: UiState) -> Dict[str, Any]:
@@ -66,6 +94,15 @@ def dump_ui_state(state: UiState) -> Dict[str, Any]:
 
 
 def save_ui_state(path: str | Path, state: UiState) -> None:
-    p = Path(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(dump_ui_state(state), ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    """
+    Write state as indented JSON, atomically (temp file + os.replace), so a
+    crash mid-save never leaves a truncated state file behind.
+    """
+    atomic_write_bytes(path, _dumps_indented(dump_ui_state(state)) + b"\n")
+
+
+def _dumps_indented(data: Dict[str, Any]) -> bytes:
+    # Stdlib json on purpose: saves are rate-limited (not a hot path), and
+    # orjson would write NaN/Infinity in kv/extra as null, losing them on the
+    # next load. json keeps them as NaN/Infinity, which read_json accepts.
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
@@ -15,6 +15,7 @@ This module is intentionally small and dependency-light.
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -27,6 +28,7 @@ from helpers.validation import (
 )
 
 
+@lru_cache(maxsize=1)
 def _helpers_root_from_here() -> Path:
     """
     Resolve the helpers/ root based on this file location.
@@ -38,16 +40,25 @@ def _helpers_root_from_here() -> Path:
         [1]=wled_http
         [2]=toolkits
         [3]=helpers   <-- we want this
+
+    Memoized: resolve() hits the filesystem and the answer cannot change.
     """
     return Path(__file__).resolve().parents[3]
 
 
 def default_config_path(*, helpers_root: Optional[Path] = None) -> Path:
-    root = (helpers_root or _helpers_root_from_here()).resolve()
-    return root / "configs" / "wled_http" / "default.json"
+    if helpers_root is None:
+        return _default_config_path()
+    return helpers_root.resolve() / "configs" / "wled_http" / "default.json"
+
+
+@lru_cache(maxsize=1)
+def _default_config_path() -> Path:
+    # _helpers_root_from_here() is already resolved.
+    return _helpers_root_from_here() / "configs" / "wled_http" / "default.json"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WledHttpConfig:
     ip: str
     http_port: int = 80
@@ -22,18 +22,140 @@ Default config location:
 """
 
 import json
-import urllib.request
-from dataclasses import dataclass
+import math
+import select
+import socket
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from .config import WledHttpConfig, load_default_config
 
+if TYPE_CHECKING:
+    import http.client
+
+# http.client (which pulls in email + ssl), urllib.error and orjson are
+# imported on first request, not at import time: UIs import the toolkits
+# package without necessarily talking to a device.
+
+_UNSET: Any = object()
+_orjson: Any = _UNSET
+
+
+def _get_orjson() -> Any:
+    """Return the orjson module, or None if unavailable (probed once)."""
+    global _orjson
+    if _orjson is _UNSET:
+        try:  # optional accelerator; stdlib json is the fallback
+            import orjson
+        except ImportError:  # pragma: no cover - depends on environment
+            orjson = None
+        _orjson = orjson
+    return _orjson
+
+
+def _loads(data: bytes | memoryview) -> Any:
+    # orjson decodes the UTF-8 body directly; anything it rejects is re-parsed
+    # by json so results and errors stay those of the stdlib.
+    oj = _get_orjson()
+    if oj is not None:
+        try:
+            return oj.loads(data)
+        except oj.JSONDecodeError:
+            pass
+    return json.loads(str(data, "utf-8"))
+
+
+def _has_nonfinite(obj: Any) -> bool:
+    """True if a NaN/Infinity float occurs anywhere in a JSON-like value."""
+    if type(obj) is float:
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(map(_has_nonfinite, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return any(map(_has_nonfinite, obj))
+    return False
+
+
+def _dumps(obj: Any) -> bytes:
+    # orjson rejects non-str keys, which json coerces, and silently writes
+    # NaN/Infinity as null where json writes NaN/Infinity; both cases use json
+    # so the bytes sent match the stdlib baseline. Patches are small, so the
+    # non-finite scan is cheap.
+    oj = _get_orjson()
+    if oj is not None and not _has_nonfinite(obj):
+        try:
+            return oj.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj).encode("utf-8")
+
+
+def _tune_socket(sock: socket.socket) -> None:
+    """
+    Low-latency options for the kept-alive control connection.
+
+    TCP_NODELAY: small state patches go out immediately instead of waiting
+    behind Nagle for the previous segment's ACK (http.client sets it too;
+    this does not depend on that). SO_KEEPALIVE: let the OS notice a device
+    that vanished while the connection sat idle between polls.
+    """
+    for level, opt in ((socket.IPPROTO_TCP, socket.TCP_NODELAY), (socket.SOL_SOCKET, socket.SO_KEEPALIVE)):
+        try:
+            sock.setsockopt(level, opt, 1)
+        except OSError:
+            pass  # unsupported on this platform; keep the default
+
+
+def _conn_dropped(conn: "http.client.HTTPConnection") -> bool:
+    """
+    True if an idle kept-alive connection can no longer be used.
+
+    Between requests nothing should be readable; a readable socket means the
+    peer closed it (EOF) or sent stray data. Checked before reuse so a stale
+    connection is replaced before a request is written to it.
+    """
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        if sock.fileno() < 0:
+            return True
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
 
 class WledHttpClient:
+    """
+    WLED JSON state client over one persistent (keep-alive) HTTP connection.
+
+    Notes:
+    - The connection is opened lazily and reused across calls, so repeated
+      polls skip the TCP handshake. An idle connection the device already
+      closed is detected and replaced before sending. If a reused connection
+      still fails as stale (reset / closed without any response), the request
+      is retried once on a fresh one, but only if the request had not been
+      fully sent or is a GET: POST patches such as {"on": "t"} are not
+      idempotent. Timeouts are never retried.
+    - Calls are serialized with a lock (one connection per client).
+    - The socket has TCP_NODELAY and SO_KEEPALIVE set (see _tune_socket).
+    - Response bodies with a Content-Length are read into one reusable
+      buffer and parsed from a memoryview, so steady polling does not
+      allocate a bytes object per response.
+    - Errors keep urllib semantics: non-2xx -> urllib.error.HTTPError,
+      network failures -> urllib.error.URLError.
+    """
+
     def __init__(self, ip: str, http_port: int = 80, timeout_s: float = 2.0) -> None:
-        self._base = f"http://{ip}:{int(http_port)}"
+        self._host = ip
+        self._port = int(http_port)
+        self._base = f"http://{ip}:{self._port}"
         self._timeout = float(timeout_s)
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._lock = threading.Lock()
+        self._buf = bytearray(8192)  # grown on demand; guarded by _lock
 
     @classmethod
     def from_config(cls, cfg: WledHttpConfig) -> "WledHttpClient":
@@ -52,22 +174,84 @@ class WledHttpClient:
             path = "/" + path
         return f"{self._base}{path}"
 
+    def _read_body(self, resp: "http.client.HTTPResponse") -> bytes | memoryview:
+        """Read the body into the reusable buffer (caller holds the lock)."""
+        import http.client
+
+        n = resp.length
+        if n is None:  # chunked / read-until-close
+            return resp.read()
+        if len(self._buf) < n:
+            self._buf = bytearray(n)
+        view = memoryview(self._buf)[:n]
+        got = 0
+        while got < n:
+            k = resp.readinto(view[got:])
+            if not k:
+                raise http.client.IncompleteRead(bytes(view[:got]), n - got)
+            got += k
+        return view
+
+    def _request(self, method: str, path: str, body: Optional[bytes] = None, *, parse: bool = False) -> Any:
+        """
+        Send one request on the kept-alive connection.
+
+        Returns the decoded JSON body if `parse`, else None (the body is still
+        drained so the connection can be reused).
+        """
+        import http.client
+        import urllib.error
+
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        # Signs that a reused keep-alive connection was closed by the device
+        # before answering. Timeouts are deliberately absent: the device may
+        # have received (and applied) the request and just be slow.
+        stale = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+        with self._lock:
+            for attempt in (0, 1):
+                conn = self._conn
+                if conn is not None and _conn_dropped(conn):
+                    conn.close()
+                    conn = self._conn = None
+                fresh = conn is None
+                if conn is None:
+                    conn = self._conn = http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
+                sent = False
+                try:
+                    if fresh:
+                        conn.connect()
+                        _tune_socket(conn.sock)
+                    conn.request(method, path, body=body, headers=headers)
+                    sent = True
+                    resp = conn.getresponse()
+                    data = self._read_body(resp)
+                except (http.client.HTTPException, OSError) as e:
+                    conn.close()
+                    self._conn = None
+                    retry = not fresh and not attempt and isinstance(e, stale) and (not sent or method == "GET")
+                    if not retry:
+                        raise urllib.error.URLError(e) from e
+                    continue
+                if resp.will_close:
+                    conn.close()
+                    self._conn = None
+                if not 200 <= resp.status < 300:
+                    raise urllib.error.HTTPError(self._url(path), resp.status, resp.reason, resp.headers, None)
+                # Parse while holding the lock: `data` may view the shared buffer.
+                return _loads(data) if parse else None
+        raise AssertionError("unreachable")
+
     def get_state(self) -> Dict[str, Any]:
         """Fetch current WLED state JSON."""
-        url = self._url("/json/state")
-        with urllib.request.urlopen(url, timeout=self._timeout) as resp:
-            data = resp.read()
-        return json.loads(data.decode("utf-8"))
+        return self._request("GET", "/json/state", parse=True)
 
     def set_state(self, state_patch: Dict[str, Any]) -> None:
         """Apply a state patch via POST /json/state."""
-        url = self._url("/json/state")
-        payload = json.dumps(state_patch).encode("utf-8")
-        req = urllib.request.Request(
-            url,
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=self._timeout) as resp:
-            resp.read()
+        self._request("POST", "/json/state", _dumps(state_patch))
+
+    def close(self) -> None:
+        """Close the kept-alive connection (a later call reopens it)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
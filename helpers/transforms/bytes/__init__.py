@@ -7,8 +7,12 @@ from .rgb_frame import (
     black_frame_bytes,
     solid_frame_bytes,
     apply_brightness_u8,
+    apply_brightness_u8_unchecked,
     apply_lut_u8,
+    apply_lut_u8_unchecked,
     make_gamma_lut_u8,
+    make_frame_pipeline,
+    reorder_frame,
 )
 
 __all__ = [
@@ -19,6 +23,10 @@ __all__ = [
     "black_frame_bytes",
     "solid_frame_bytes",
     "apply_brightness_u8",
+    "apply_brightness_u8_unchecked",
     "apply_lut_u8",
+    "apply_lut_u8_unchecked",
     "make_gamma_lut_u8",
+    "make_frame_pipeline",
+    "reorder_frame",
 ]
@@ -12,6 +12,7 @@ Scope:
 - Frame constructors (black/solid)
 - Validation (bytes-like, len % 3 == 0)
 - Per-byte transforms (brightness scaling, LUT, gamma LUT)
+- Fused brightness -> gamma -> channel-order pipeline (make_frame_pipeline)
 
 Non-goals:
 - Protocol logic (WLED/DDP) -> belongs in helpers.toolkits / drivers
@@ -21,7 +22,8 @@ Note:
 - Uses helpers.color.color_types.ColorRGB as the canonical color type.
 """
 
-from typing import Sequence
+from functools import lru_cache
+from typing import Callable, Sequence
 
 from helpers.color.color_types import ColorRGB
 from helpers.math.basic import clamp01, clamp8
@@ -38,6 +40,17 @@ _ORDER_INDEX: dict[str, tuple[int, int, int]] = {
     "BGR": (2, 1, 0),
 }
 
+# order -> packer taking clamped (r, g, b); one lookup, no index tuple per call.
+_PACKERS: dict[str, Callable[[int, int, int], bytes]] = {
+    "RGB": lambda r, g, b: bytes((r, g, b)),
+    "RBG": lambda r, g, b: bytes((r, b, g)),
+    "GRB": lambda r, g, b: bytes((g, r, b)),
+    "GBR": lambda r, g, b: bytes((g, b, r)),
+    "BRG": lambda r, g, b: bytes((b, r, g)),
+    "BGR": lambda r, g, b: bytes((b, g, r)),
+}
+assert _PACKERS.keys() == _ORDER_INDEX.keys()
+
 # ─────────────────────────────────────────────────────────────
 # Validation
 # ─────────────────────────────────────────────────────────────
@@ -78,14 +91,10 @@ def pack_rgb_u8(color: ColorRGB, order: str = "RGB") -> bytes:
 
     Clamping occurs here to keep ColorRGB as a simple value object.
     """
-    validate_color_order(order)
-    r = clamp8(color.r)
-    g = clamp8(color.g)
-    b = clamp8(color.b)
-
-    idx = _ORDER_INDEX[order]
-    ch = (r, g, b)
-    return bytes((ch[idx[0]], ch[idx[1]], ch[idx[2]]))
+    pack = _PACKERS.get(order)
+    if pack is None:
+        validate_color_order(order)  # raises with the canonical message
+    return pack(clamp8(color.r), clamp8(color.g), clamp8(color.b))
 
 
 def black_frame_bytes(pixel_count: int) -> bytes:
@@ -94,17 +103,25 @@ def black_frame_bytes(pixel_count: int) -> bytes:
     """
     if pixel_count < 0:
         raise ValueError("pixel_count must be >= 0")
-    return bytes([0]) * (pixel_count * 3)
+    return bytes(pixel_count * 3)
 
 
 def solid_frame_bytes(pixel_count: int, color: ColorRGB, order: str = "RGB") -> bytes:
     """
     Build a solid color frame for N pixels in the given channel order.
+
+    Recent (pixel_count, color, order) results are memoized.
     """
     if pixel_count < 0:
         raise ValueError("pixel_count must be >= 0")
-    px = pack_rgb_u8(color, order=order)
-    return px * pixel_count
+    return _solid_frame(pixel_count, color, order)
+
+
+@lru_cache(maxsize=16)
+def _solid_frame(pixel_count: int, color: ColorRGB, order: str) -> bytes:
+    # Render loops rebuild the same solid frame every tick; bytes are
+    # immutable, so the cached frame can be shared.
+    return pack_rgb_u8(color, order=order) * pixel_count
 
 
 # ─────────────────────────────────────────────────────────────
@@ -120,30 +137,59 @@ def apply_brightness_u8(frame: bytes, brightness: float) -> bytes:
     combine with a gamma LUT.
     """
     validate_frame_rgb(frame)
+    return apply_brightness_u8_unchecked(frame, brightness)
+
+
+def apply_brightness_u8_unchecked(frame: bytes, brightness: float) -> bytes:
+    """
+    apply_brightness_u8 without the frame type/length check.
+
+    For trusted callers chaining transforms on a frame they already validated
+    (e.g. the output of another transform here).
+    """
     b = clamp01(brightness)
     if b == 1.0:
         return bytes(frame)
     if b == 0.0:
-        return bytes([0]) * len(frame)
+        return bytes(len(frame))
+
+    # A byte only has 256 values: scale them once, then map the whole frame
+    # in C with bytes.translate.
+    return bytes(frame).translate(_brightness_table(b))
 
-    out = bytearray(len(frame))
-    for i, v in enumerate(frame):
-        out[i] = clamp8(int(round(v * b)))
-    return bytes(out)
+
+@lru_cache(maxsize=64)
+def _brightness_table(b: float) -> bytes:
+    """256-entry translate table for `round(v * b)` (same rounding as before)."""
+    # b is clamped to [0..1], so round(v * b) already lies in 0..255.
+    return bytes([round(v * b) for v in range(256)])
 
 
 def apply_lut_u8(frame: bytes, lut: Sequence[int]) -> bytes:
     """
     Apply a 256-entry LUT to every byte.
+
+    Entries are clamped to 0..255; a bytes LUT is used as-is (no per-call
+    conversion), which is the fastest form for repeated use.
     """
     validate_frame_rgb(frame)
+    return apply_lut_u8_unchecked(frame, lut)
+
+
+def apply_lut_u8_unchecked(frame: bytes, lut: Sequence[int]) -> bytes:
+    """apply_lut_u8 without the frame check (the LUT is still validated)."""
+    return bytes(frame).translate(_lut_table(lut))
+
+
+def _lut_table(lut: Sequence[int]) -> bytes:
+    """Clamp a 256-entry LUT into a bytes.translate table (bytes LUTs pass through)."""
     if len(lut) != 256:
         raise ValueError(f"lut must have length 256 (got {len(lut)})")
-
-    out = bytearray(len(frame))
-    for i, v in enumerate(frame):
-        out[i] = clamp8(int(lut[v]))
-    return bytes(out)
+    if isinstance(lut, bytes):
+        return lut
+    if isinstance(lut, (bytearray, memoryview)):
+        return bytes(lut)
+    return bytes([clamp8(int(x)) for x in lut])
 
 
 def make_gamma_lut_u8(gamma: float) -> list[int]:
@@ -154,13 +200,76 @@ def make_gamma_lut_u8(gamma: float) -> list[int]:
       - 1.0 => identity
       - >1  => darker mid-tones
       - <1  => brighter mid-tones
+
+    Tables are memoized per gamma; each call returns a fresh list.
     """
     if gamma <= 0:
         raise ValueError("gamma must be > 0")
+    return list(_gamma_lut(float(gamma)))
+
+
+@lru_cache(maxsize=32)
+def _gamma_lut(gamma: float) -> bytes:
+    # Memoized per gamma; a bytes table also feeds apply_lut_u8 without conversion.
+    # pow(x, gamma) stays in [0..1] for x in [0..1] and gamma > 0: no clamp needed.
+    return bytes([round(pow(i / 255.0, gamma) * 255.0) for i in range(256)])
+
+
+# ─────────────────────────────────────────────────────────────
+# Fused pipeline
+# ─────────────────────────────────────────────────────────────
+
+def _reorder_rgb(frame: bytes, idx: tuple[int, int, int]) -> bytes:
+    """Permute channels of a packed RGB frame; each plane is one strided C copy."""
+    if idx == (0, 1, 2):
+        return frame
+    out = bytearray(len(frame))
+    out[0::3] = frame[idx[0]::3]
+    out[1::3] = frame[idx[1]::3]
+    out[2::3] = frame[idx[2]::3]
+    return bytes(out)
+
+
+def reorder_frame(frame: bytes, order: str) -> bytes:
+    """
+    Reorder a packed RGB frame into `order` (e.g. "GRB" for WS2812 strips).
+
+    Whole-frame equivalent of packing each pixel with pack_rgb_u8(c, order):
+    three strided C copies instead of per-pixel Python. "RGB" returns the
+    frame as bytes unchanged.
+    """
+    validate_color_order(order)
+    validate_frame_rgb(frame)
+    return bytes(_reorder_rgb(frame, _ORDER_INDEX[order]))
+
+
+@lru_cache(maxsize=32)
+def make_frame_pipeline(brightness: float, gamma: float = 1.0, order: str = "RGB") -> Callable[[bytes], bytes]:
+    """
+    Build a function applying brightness -> gamma LUT -> channel order in one pass.
+
+    Equivalent to
+      apply_lut_u8(apply_brightness_u8(frame, brightness), make_gamma_lut_u8(gamma))
+    followed by reordering RGB input into `order`, but the two per-byte steps
+    are composed into a single 256-entry table (one translate over the frame).
+
+    Input frames are packed RGB. Pipelines are memoized per argument tuple.
+    """
+    validate_color_order(order)
+    if gamma <= 0:
+        raise ValueError("gamma must be > 0")
+
+    b = clamp01(brightness)
+    table = bytes(range(256)) if b == 1.0 else _brightness_table(b)
+    if gamma != 1.0:
+        table = table.translate(_gamma_lut(float(gamma)))
+    idx = _ORDER_INDEX[order]
+
+    # The fused per-byte step is a single bytes.translate: a C loop doing one
+    # table lookup per byte, which is what a JIT kernel (e.g. Numba) would
+    # compile to, without a compiler dependency or warm-up on small targets.
+    def apply(frame: bytes) -> bytes:
+        validate_frame_rgb(frame)
+        return _reorder_rgb(bytes(frame).translate(table), idx)
 
-    lut: list[int] = [0] * 256
-    for i in range(256):
-        x = i / 255.0
-        y = pow(x, gamma)
-        lut[i] = clamp8(int(round(y * 255.0)))
-    return lut
+    return apply
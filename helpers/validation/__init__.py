@@ -27,6 +27,7 @@ from .net import (
     ensure_port,
 )
 from .mapping import (
+    make_mapping_reader,
     path_join,
     require_bool,
     require_dict_of_str,
@@ -80,6 +81,7 @@ __all__ = [
     "ensure_http_url",
     # mapping readers
     "path_join",
+    "make_mapping_reader",
     "require_str",
     "require_int",
     "require_float",
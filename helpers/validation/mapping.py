@@ -3,8 +3,9 @@
 
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
-from typing import Any, Mapping, Optional, Sequence, TypeVar
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, TypeVar, Union
 
 from .errors import ValidationError, qpath
 from .net import _require_ip_value, ensure_endpoint, ensure_host, ensure_http_url, ensure_port
@@ -17,6 +18,7 @@ from .scalars import (
     ensure_list,
     ensure_list_of_dicts,
     ensure_list_of_str,
+    ensure_ip,
     ensure_one_of,
     ensure_pathlike,
     ensure_regex,
@@ -37,23 +39,26 @@ def path_join(path: str, key: str) -> str:
     Examples:
       path_join("strip", "led_count") -> "strip.led_count"
       path_join("", "controllers")    -> "controllers"
+
+    The readers below inline this expression (one f-string per field read,
+    none when path is empty) and pass the result down to _missing_value.
     """
     return f"{path}.{key}" if path else key
 
 
-def _get_value(d: Mapping[str, Any], key: str, *, path: str, default: Any) -> Any:
+def _missing_value(p: str, default: Any) -> Any:
     """
-    Common retrieval semantics:
-      - if key missing and default is _MISSING -> raise required error
-      - if key missing and default provided -> return default
-      - else return d[key]
+    Common missing-key semantics (`p` is the caller's already-joined path):
+      - default is _MISSING -> raise required error
+      - default provided    -> return default
+
+    Readers inline the present-key path as `v = d.get(key, _MISSING)` plus an
+    identity check (_MISSING is never a stored value), so a field that is
+    present costs one lookup and no extra call.
     """
-    p = path_join(path, key) if path else key
-    if key not in d:
-        if default is _MISSING:
-            raise ValidationError(f"Missing required field {qpath(p)}")
-        return default
-    return d[key]
+    if default is _MISSING:
+        raise ValidationError(f"Missing required field {qpath(p)}")
+    return default
 
 
 # -------------------------
@@ -83,8 +88,10 @@ def require_str(
     default: Any = _MISSING,
 ) -> str:
     """Read d[key] as a validated string."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     return ensure_str(v, path=p, allow_empty=allow_empty)
 
 
@@ -98,8 +105,10 @@ def require_int(
     default: Any = _MISSING,
 ) -> int:
     """Read d[key] as a validated int."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     return ensure_int(v, path=p, min_v=min_v, max_v=max_v)
 
 
@@ -113,8 +122,10 @@ def require_float(
     default: Any = _MISSING,
 ) -> float:
     """Read d[key] as a validated float."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     return ensure_float(v, path=p, min_v=min_v, max_v=max_v)
 
 
@@ -126,8 +137,10 @@ def require_bool(
     default: Any = _MISSING,
 ) -> bool:
     """Read d[key] as a validated bool."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     return ensure_bool(v, path=p)
 
 
@@ -139,8 +152,10 @@ def require_list_of_dicts(
     default: Any = _MISSING,
 ) -> list[dict]:
     """Read d[key] as a list of dicts."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     return ensure_list_of_dicts(v, path=p)
 
 
@@ -153,8 +168,10 @@ def require_list_of_str(
     default: Any = _MISSING,
 ) -> list[str]:
     """Read d[key] as a list of strings."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     return ensure_list_of_str(v, path=p, allow_empty_items=allow_empty_items)
 
 
@@ -167,8 +184,10 @@ def require_dict_of_str(
     default: Any = _MISSING,
 ) -> dict[str, str]:
     """Read d[key] as a dict[str, str]."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     return ensure_dict_of_str(v, path=p, allow_empty_values=allow_empty_values)
 
 
@@ -181,8 +200,10 @@ def require_one_of(
     default: Any = _MISSING,
 ) -> Any:
     """Read d[key] and ensure it is in allowed."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     return ensure_one_of(v, allowed, path=p)
 
 
@@ -196,8 +217,10 @@ def require_path(
     default: Any = _MISSING,
 ) -> Path:
     """Read d[key] as a Path-like value and return a Path."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     return ensure_pathlike(v, path=p, expanduser=expanduser, resolve=resolve)
 
 
@@ -209,8 +232,10 @@ def require_regex(
     default: Any = _MISSING,
 ):
     """Read d[key] as a regex pattern string and return compiled regex."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     return ensure_regex(v, path=p)
 
 
@@ -223,8 +248,10 @@ def require_ip(
     default: Any = _MISSING,
 ) -> str:
     """Read d[key] as an IP address string."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     # _require_ip_value expects an already-joined path string; we pass p.
     return _require_ip_value(v, p=p, version=version)
 
@@ -237,8 +264,10 @@ def require_port(
     default: Any = _MISSING,
 ) -> int:
     """Read d[key] as a TCP/UDP port (1..65535)."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     return ensure_port(v, path=p)
 
 
@@ -251,8 +280,10 @@ def require_host(
     default: Any = _MISSING,
 ) -> str:
     """Read d[key] as a host (hostname or IP)."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     return ensure_host(v, path=p, allow_localhost=allow_localhost)
 
 
@@ -264,8 +295,10 @@ def require_endpoint(
     default: Any = _MISSING,
 ) -> tuple[str, int]:
     """Read d[key] as an endpoint string and return (host, port)."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     return ensure_endpoint(v, path=p)
 
 
@@ -277,8 +310,10 @@ def require_http_url(
     default: Any = _MISSING,
 ) -> str:
     """Read d[key] as an http(s) URL."""
-    p = path_join(path, key) if path else key
-    v = _get_value(d, key, path=path, default=default)
+    p = f"{path}.{key}" if path else key
+    v = d.get(key, _MISSING)
+    if v is _MISSING:
+        v = _missing_value(p, default)
     return ensure_http_url(v, path=p)
 
 
@@ -295,10 +330,11 @@ def optional_str(
     default: Optional[str] = None,
 ) -> Optional[str]:
     """Optional string reader: returns default if missing or None."""
-    p = path_join(path, key) if path else key
-    if key not in d or d[key] is None:
+    p = f"{path}.{key}" if path else key
+    v = d.get(key)
+    if v is None:
         return default
-    return ensure_str(d[key], path=p, allow_empty=allow_empty)
+    return ensure_str(v, path=p, allow_empty=allow_empty)
 
 
 def optional_int(
@@ -311,10 +347,11 @@ def optional_int(
     default: Optional[int] = None,
 ) -> Optional[int]:
     """Optional int reader: returns default if missing or None."""
-    p = path_join(path, key) if path else key
-    if key not in d or d[key] is None:
+    p = f"{path}.{key}" if path else key
+    v = d.get(key)
+    if v is None:
         return default
-    return ensure_int(d[key], path=p, min_v=min_v, max_v=max_v)
+    return ensure_int(v, path=p, min_v=min_v, max_v=max_v)
 
 
 def optional_float(
@@ -327,10 +364,11 @@ def optional_float(
     default: Optional[float] = None,
 ) -> Optional[float]:
     """Optional float reader: returns default if missing or None."""
-    p = path_join(path, key) if path else key
-    if key not in d or d[key] is None:
+    p = f"{path}.{key}" if path else key
+    v = d.get(key)
+    if v is None:
         return default
-    return ensure_float(d[key], path=p, min_v=min_v, max_v=max_v)
+    return ensure_float(v, path=p, min_v=min_v, max_v=max_v)
 
 
 def optional_bool(
@@ -341,10 +379,11 @@ def optional_bool(
     default: Optional[bool] = None,
 ) -> Optional[bool]:
     """Optional bool reader: returns default if missing or None."""
-    p = path_join(path, key) if path else key
-    if key not in d or d[key] is None:
+    p = f"{path}.{key}" if path else key
+    v = d.get(key)
+    if v is None:
         return default
-    return ensure_bool(d[key], path=p)
+    return ensure_bool(v, path=p)
 
 
 def optional_list_of_str(
@@ -356,10 +395,11 @@ def optional_list_of_str(
     default: Optional[list[str]] = None,
 ) -> Optional[list[str]]:
     """Optional list[str] reader: returns default if missing or None."""
-    p = path_join(path, key) if path else key
-    if key not in d or d[key] is None:
+    p = f"{path}.{key}" if path else key
+    v = d.get(key)
+    if v is None:
         return default
-    return ensure_list_of_str(d[key], path=p, allow_empty_items=allow_empty_items)
+    return ensure_list_of_str(v, path=p, allow_empty_items=allow_empty_items)
 
 
 def optional_path(
@@ -372,7 +412,81 @@ def optional_path(
     default: Optional[Path] = None,
 ) -> Optional[Path]:
     """Optional path reader: returns default if missing or None."""
-    p = path_join(path, key) if path else key
-    if key not in d or d[key] is None:
+    p = f"{path}.{key}" if path else key
+    v = d.get(key)
+    if v is None:
         return default
-    return ensure_pathlike(d[key], path=p, expanduser=expanduser, resolve=resolve)
+    return ensure_pathlike(v, path=p, expanduser=expanduser, resolve=resolve)
+
+
+# -------------------------
+# Schema-bound readers
+# -------------------------
+
+# Field kind -> scalar validator (called as fn(value, path=..., **opts)).
+_FIELD_VALIDATORS: Dict[str, Callable[..., Any]] = {
+    "str": ensure_str,
+    "int": ensure_int,
+    "float": ensure_float,
+    "bool": ensure_bool,
+    "list_of_dicts": ensure_list_of_dicts,
+    "list_of_str": ensure_list_of_str,
+    "dict_of_str": ensure_dict_of_str,
+    "one_of": ensure_one_of,
+    "path": ensure_pathlike,
+    "regex": ensure_regex,
+    "ip": ensure_ip,
+    "port": ensure_port,
+    "host": ensure_host,
+    "endpoint": ensure_endpoint,
+    "http_url": ensure_http_url,
+}
+
+FieldSpec = Union[str, Tuple[str, Mapping[str, Any]]]
+
+
+def make_mapping_reader(
+    schema: Mapping[str, FieldSpec],
+    *,
+    path: str = "",
+) -> Callable[[Mapping[str, Any]], Dict[str, Any]]:
+    """
+    Bind a fixed field schema once and return a reader for many mappings.
+
+    schema maps key -> kind or (kind, opts), e.g.
+      {"led_count": ("int", {"min_v": 1}), "host": "host",
+       "mode": ("one_of", {"allowed": ("a", "b"), "default": "a"})}
+
+    opts are the keyword arguments of the matching require_* reader; "default"
+    has the same meaning (missing key -> default, absent default -> required),
+    and a default is validated/normalized like a present value.
+
+    The reader returns {key: validated value} with the same results and error
+    messages as calling the require_* readers field by field, but field paths
+    and validator options are resolved when the reader is built, not per call.
+    """
+    fields = []
+    for key, spec in schema.items():
+        kind, opts = (spec, {}) if isinstance(spec, str) else spec
+        fn = _FIELD_VALIDATORS.get(kind)
+        if fn is None:
+            raise ValueError(f"Unknown field kind {kind!r} for {key!r} (expected one of {sorted(_FIELD_VALIDATORS)})")
+        opts = dict(opts)
+        default = opts.pop("default", _MISSING)
+        p = f"{path}.{key}" if path else key
+        fields.append((key, p, partial(fn, path=p, **opts), default))
+    bound = tuple(fields)
+
+    def read(d: Mapping[str, Any]) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for key, p, check, default in bound:
+            v = d.get(key, _MISSING)
+            if v is _MISSING:
+                if default is _MISSING:
+                    raise ValidationError(f"Missing required field {qpath(p)}")
+                v = default
+            # Defaults go through the field check too, as in require_*.
+            out[key] = check(v)
+        return out
+
+    return read
@@ -3,15 +3,20 @@
 
 from __future__ import annotations
 
-import ipaddress
-import re
+import string
 from typing import Any, Optional
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from .errors import ValidationError, qpath
-from .scalars import ensure_int, ensure_ip, ensure_str
+from .scalars import _ip_address_cached, ensure_int, ensure_ip, ensure_str
 
-_HOST_LABEL_RE = re.compile(r"^(?!-)[A-Za-z0-9-]{1,63}(?<!-)$")
+# Hostname label charset (A-Z a-z 0-9 -). bytes.translate(None, delete) strips
+# these in one C pass; anything left over is an invalid character.
+_HOST_LABEL_CHARS = (string.ascii_letters + string.digits + "-").encode("ascii")
+
+
+def _has_bad_host_chars(s: str) -> bool:
+    return not s.isascii() or bool(s.encode("ascii").translate(None, _HOST_LABEL_CHARS))
 
 
 def ensure_port(v: Any, *, path: str = "port") -> int:
@@ -33,12 +38,15 @@ def ensure_host(v: Any, *, path: str = "host", allow_localhost: bool = True) ->
     if allow_localhost and s.lower() == "localhost":
         return "localhost"
 
-    # IP is acceptable.
-    try:
-        ipaddress.ip_address(s)
-        return s
-    except Exception:
-        pass
+    # IP is acceptable. Only probe when it could be one (IPv4 starts with an
+    # ASCII digit, IPv6 contains ":"), so plain hostnames skip the parse and
+    # the exception it raises.
+    if "0" <= s[0] <= "9" or ":" in s:
+        try:
+            _ip_address_cached(s)
+            return s
+        except ValueError:
+            pass
 
     # Hostname validation (basic, RFC-ish).
     if len(s) > 253:
@@ -48,8 +56,12 @@ def ensure_host(v: Any, *, path: str = "host", allow_localhost: bool = True) ->
     if any(not lbl for lbl in labels):
         raise ValidationError(f"{qpath(path)} must be a valid hostname (empty label in {s!r})")
 
+    # Label rules: 1..63 chars from _HOST_LABEL_CHARS, no leading/trailing "-".
+    # The charset is checked once for the whole name (dots removed); labels
+    # are only rescanned to report which one is bad.
+    bad_chars = _has_bad_host_chars(s.replace(".", ""))
     for lbl in labels:
-        if not _HOST_LABEL_RE.match(lbl):
+        if len(lbl) > 63 or lbl[0] == "-" or lbl[-1] == "-" or (bad_chars and _has_bad_host_chars(lbl)):
             raise ValidationError(f"{qpath(path)} must be a valid hostname (bad label {lbl!r})")
 
     return s
@@ -65,31 +77,29 @@ def ensure_endpoint(v: Any, *, path: str = "endpoint") -> tuple[str, int]:
     """
     s = ensure_str(v, path=path, allow_empty=False)
 
-    host: str
-    port_s: str
-
     if s.startswith("["):
         # IPv6 bracket form: [addr]:port
-        if "]" not in s:
-            raise ValidationError(f"{qpath(path)} must be in form '[ipv6]:port' (got {s!r})")
-        close = s.index("]")
-        host = s[1:close]
-        rest = s[close + 1 :]
-        if not rest.startswith(":"):
+        close = s.find("]")
+        if close < 0 or s[close + 1 : close + 2] != ":":
             raise ValidationError(f"{qpath(path)} must be in form '[ipv6]:port' (got {s!r})")
-        port_s = rest[1:]
-        host = ensure_ip(host, path=f"{path}.host", version=6)
+        host = ensure_ip(s[1:close], path=f"{path}.host", version=6)
+        port_s = s[close + 2 :]
     else:
         # Split on last ":" to allow hostnames containing ":" only via IPv6 bracket form.
-        if ":" not in s:
+        idx = s.rfind(":")
+        if idx < 0:
             raise ValidationError(f"{qpath(path)} must be in form 'host:port' (got {s!r})")
-        host, port_s = s.rsplit(":", 1)
-        host = ensure_host(host, path=f"{path}.host")
+        host = ensure_host(s[:idx], path=f"{path}.host")
+        port_s = s[idx + 1 :]
 
+    # ASCII digits only (no sign/space/underscore forms that int() would take).
+    # int() can still raise for huge digit strings (int_max_str_digits).
     try:
-        port = ensure_port(int(port_s), path=f"{path}.port")
-    except Exception as e:
-        raise ValidationError(f"{qpath(path)} invalid port in endpoint (got {s!r})") from e
+        port = int(port_s) if port_s.isascii() and port_s.isdigit() else 0
+    except ValueError:
+        port = 0
+    if not 1 <= port <= 65535:
+        raise ValidationError(f"{qpath(path)} invalid port in endpoint (got {s!r})")
 
     return host, port
 
@@ -101,7 +111,12 @@ def ensure_http_url(v: Any, *, path: str = "url") -> str:
     This is a basic structural check suitable for config validation.
     """
     s = ensure_str(v, path=path, allow_empty=False)
-    u = urlparse(s)
+    # urlsplit: scheme/netloc without urlparse's ";params" pass (and it is
+    # memoized by urllib itself on recent Pythons).
+    try:
+        u = urlsplit(s)
+    except ValueError as e:  # e.g. unbalanced "[" in an IPv6 host
+        raise ValidationError(f"{qpath(path)} must be a valid URL (got {s!r})") from e
     if u.scheme not in {"http", "https"}:
         raise ValidationError(f"{qpath(path)} must start with http:// or https:// (got {s!r})")
     if not u.netloc:
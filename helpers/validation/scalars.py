@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import ipaddress
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Iterable, Optional, Sequence, TypeVar
 
@@ -15,14 +16,14 @@ T = TypeVar("T")
 
 def ensure_dict(v: Any, *, path: str = "value") -> dict:
     """Ensure v is a dict."""
-    if not isinstance(v, dict):
+    if type(v) is not dict and not isinstance(v, dict):
         raise ValidationError(f"{qpath(path)} must be an object/dict (got {type_name(v)})")
     return v
 
 
 def ensure_list(v: Any, *, path: str = "value") -> list:
     """Ensure v is a list."""
-    if not isinstance(v, list):
+    if type(v) is not list and not isinstance(v, list):
         raise ValidationError(f"{qpath(path)} must be a list (got {type_name(v)})")
     return v
 
@@ -43,7 +44,7 @@ def ensure_str(v: Any, *, path: str = "value", allow_empty: bool = False) -> str
       - Returns the stripped string.
       - allow_empty=False (default) rejects empty/whitespace-only strings.
     """
-    if not isinstance(v, str):
+    if type(v) is not str and not isinstance(v, str):
         raise ValidationError(f"{qpath(path)} must be a string (got {type_name(v)})")
     s = v.strip()
     if not allow_empty and not s:
@@ -53,7 +54,7 @@ def ensure_str(v: Any, *, path: str = "value", allow_empty: bool = False) -> str
 
 def ensure_bool(v: Any, *, path: str = "value") -> bool:
     """Ensure v is a bool."""
-    if not isinstance(v, bool):
+    if type(v) is not bool:  # bool cannot be subclassed
         raise ValidationError(f"{qpath(path)} must be a bool (got {type_name(v)})")
     return v
 
@@ -71,7 +72,8 @@ def ensure_int(
     Note:
       bool is a subclass of int; we explicitly reject bool.
     """
-    if isinstance(v, bool) or not isinstance(v, int):
+    # Exact int (the common case) skips both isinstance checks.
+    if type(v) is not int and (isinstance(v, bool) or not isinstance(v, int)):
         raise ValidationError(f"{qpath(path)} must be an int (got {type_name(v)})")
 
     if min_v is not None and v < min_v:
@@ -94,7 +96,8 @@ def ensure_float(
     Note:
       bool is rejected.
     """
-    if isinstance(v, bool) or not isinstance(v, (int, float)):
+    t = type(v)
+    if t is not float and t is not int and (t is bool or not isinstance(v, (int, float))):
         raise ValidationError(f"{qpath(path)} must be a float (got {type_name(v)})")
 
     f = float(v)
@@ -117,7 +120,10 @@ def ensure_list_of_dicts(v: Any, *, path: str = "value") -> list[dict]:
     lst = ensure_list(v, path=path)
     out: list[dict] = []
     for i, item in enumerate(lst):
-        out.append(ensure_dict(item, path=f"{path}[{i}]"))
+        if type(item) is not dict:
+            # Item path is only built for the (rare) slow/error path.
+            item = ensure_dict(item, path=f"{path}[{i}]")
+        out.append(item)
     return out
 
 
@@ -131,6 +137,12 @@ def ensure_list_of_str(
     lst = ensure_list(v, path=path)
     out: list[str] = []
     for i, item in enumerate(lst):
+        if type(item) is str:
+            s = item.strip()
+            if s or allow_empty_items:
+                out.append(s)
+                continue
+        # Subclass or invalid item: the item path is only built here.
         out.append(ensure_str(item, path=f"{path}[{i}]", allow_empty=allow_empty_items))
     return out
 
@@ -147,6 +159,12 @@ def ensure_dict_of_str(
     for k, val in d.items():
         if not isinstance(k, str):
             raise ValidationError(f"{qpath(path)} keys must be strings (got {type_name(k)})")
+        if type(val) is str:
+            s = val.strip()
+            if s or allow_empty_values:
+                out[k] = s
+                continue
+        # Subclass or invalid value: the key path is only built here.
         out[k] = ensure_str(val, path=f"{path}.{k}", allow_empty=allow_empty_values)
     return out
 
@@ -167,6 +185,12 @@ def ensure_unique(
         seen.add(k)
 
 
+# ip_address() is pure Python (parse + v4/v6 probing). Configs repeat the same
+# addresses (gateways, DNS, controllers), and the address objects are
+# immutable, so parsed results are shared. Failures raise and are not cached.
+_ip_address_cached = lru_cache(maxsize=2048)(ipaddress.ip_address)
+
+
 def ensure_ip(ip: Any, *, path: str = "ip", version: Optional[int] = None) -> str:
     """
     Ensure an IP address string.
@@ -181,16 +205,17 @@ def ensure_ip(ip: Any, *, path: str = "ip", version: Optional[int] = None) -> st
     Returns:
       The stripped string.
     """
-    s = ensure_str(ip, path=path, allow_empty=False).strip()
+    if version is not None and version != 4 and version != 6:
+        raise ValidationError(f"{qpath(f'{path}.version')} must be one of [4, 6] (got {version!r})")
+
+    s = ensure_str(ip, path=path, allow_empty=False)  # already stripped
     try:
-        addr = ipaddress.ip_address(s)
+        addr = _ip_address_cached(s)
     except ValueError as e:
         raise ValidationError(f"{qpath(path)} must be a valid IP address (got {s!r})") from e
 
-    if version is not None:
-        ensure_one_of(version, (4, 6), path=f"{path}.version")
-        if addr.version != version:
-            raise ValidationError(f"{qpath(path)} must be IPv{version} (got {s!r})")
+    if version is not None and addr.version != version:
+        raise ValidationError(f"{qpath(path)} must be IPv{version} (got {s!r})")
 
     return s
 
@@ -211,13 +236,15 @@ def ensure_pathlike(
     """
     if isinstance(v, Path):
         p = v
+        s = str(p)  # cached by pathlib
     elif isinstance(v, str):
         s = ensure_str(v, path=path, allow_empty=False)
         p = Path(s)
     else:
         raise ValidationError(f"{qpath(path)} must be a path (str or Path) (got {type_name(v)})")
 
-    if expanduser:
+    # expanduser() only changes paths starting with "~" but always builds a new Path.
+    if expanduser and s.startswith("~"):
         p = p.expanduser()
 
     return p.resolve() if resolve else p
@@ -239,14 +266,21 @@ def ensure_enum_name(v: Any, *, path: str = "value") -> str:
     return s
 
 
+# Compiled patterns are immutable and thread-safe, so configs re-validated
+# repeatedly share one Pattern per source string. re's own cache is smaller
+# (512) and still pays its flag/type dispatch per call.
+_compile_regex = lru_cache(maxsize=1024)(re.compile)
+
+
 def ensure_regex(v: Any, *, path: str = "value") -> re.Pattern[str]:
     """
     Ensure v is a regex pattern string and return a compiled regex.
 
-    Useful for filter rules stored in config/JSON.
+    Useful for filter rules stored in config/JSON. Compiled patterns are
+    memoized per (stripped) pattern string.
     """
     s = ensure_str(v, path=path, allow_empty=False)
     try:
-        return re.compile(s)
+        return _compile_regex(s)
     except re.error as e:
         raise ValidationError(f"{qpath(path)} must be a valid regex (got {s!r})") from e
@@ -3,9 +3,8 @@
 
 from __future__ import annotations
 
-import re
 from datetime import datetime, timedelta, timezone, time as dtime
-from typing import Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 from .errors import ValidationError
 
@@ -23,7 +22,7 @@ def ensure_tz(t: datetime, tz: timezone = timezone.utc) -> datetime:
     Note:
       - We do not convert between timezones here; we only ensure tz-awareness.
     """
-    return t.replace(tzinfo=tz) if t.tzinfo is None else t
+    return t if t.tzinfo is not None else t.replace(tzinfo=tz)
 
 
 def parse_time_of_day(s: str) -> dtime:
@@ -34,23 +33,22 @@ def parse_time_of_day(s: str) -> dtime:
       ValidationError on invalid formats or ranges.
     """
     raw = s.strip()
-    if not re.fullmatch(r"\d{2}:\d{2}(:\d{2})?", raw):
+    # Fixed layout "HH:MM" / "HH:MM:SS": check separators and digit pairs by
+    # position instead of running a regex.
+    n = len(raw)
+    if not (
+        (n == 5 or (n == 8 and raw[5] == ":" and raw[6:8].isdecimal()))
+        and raw[2] == ":"
+        and raw[0:2].isdecimal()
+        and raw[3:5].isdecimal()
+    ):
         raise ValidationError(
             f"Invalid time-of-day format: {s!r} (expected 'HH:MM' or 'HH:MM:SS')"
         )
 
-    parts = raw.split(":")
-    if len(parts) not in (2, 3):
-        raise ValidationError(
-            f"Invalid time-of-day format: {s!r} (expected 'HH:MM' or 'HH:MM:SS')"
-        )
-
-    try:
-        hh = int(parts[0])
-        mm = int(parts[1])
-        ss = int(parts[2]) if len(parts) == 3 else 0
-    except Exception as e:
-        raise ValidationError(f"Invalid time-of-day numeric values: {s!r}") from e
+    hh = int(raw[0:2])
+    mm = int(raw[3:5])
+    ss = int(raw[6:8]) if n == 8 else 0
 
     if not (0 <= hh <= 23 and 0 <= mm <= 59 and 0 <= ss <= 59):
         raise ValidationError(f"Invalid time-of-day values: {s!r}")
@@ -76,6 +74,52 @@ def dt(value: Union[TimeLike, None], *, tz: timezone = timezone.utc) -> Optional
     raise TypeError(f"Unsupported time value: {type(value)}")
 
 
+def _on_reference_date(tod: dtime, tz: timezone, reference: Optional[datetime]) -> datetime:
+    ref = ensure_tz(reference, tz=tz) if reference is not None else datetime.now(tz)
+    return datetime(
+        year=ref.year,
+        month=ref.month,
+        day=ref.day,
+        hour=tod.hour,
+        minute=tod.minute,
+        second=tod.second,
+        tzinfo=ref.tzinfo,
+    )
+
+
+def _resolve_time_like_value(value: Any, tz: timezone, reference: Optional[datetime]) -> datetime:
+    return dt(value, tz=tz)  # type: ignore[return-value]
+
+
+def _resolve_time_of_day(value: dtime, tz: timezone, reference: Optional[datetime]) -> datetime:
+    return _on_reference_date(value, tz, reference)
+
+
+def _resolve_time_of_day_str(value: str, tz: timezone, reference: Optional[datetime]) -> datetime:
+    return _on_reference_date(parse_time_of_day(value), tz, reference)
+
+
+# Exact-type dispatch for resolve_time_like; subclasses (and bool) fall back
+# to the isinstance checks in _resolver_for.
+_TIME_RESOLVERS: Dict[type, Callable[[Any, timezone, Optional[datetime]], datetime]] = {
+    datetime: _resolve_time_like_value,
+    float: _resolve_time_like_value,
+    int: _resolve_time_like_value,
+    dtime: _resolve_time_of_day,
+    str: _resolve_time_of_day_str,
+}
+
+
+def _resolver_for(value: Any) -> Callable[[Any, timezone, Optional[datetime]], datetime]:
+    if isinstance(value, (datetime, float, int)):
+        return _resolve_time_like_value
+    if isinstance(value, dtime):
+        return _resolve_time_of_day
+    if isinstance(value, str):
+        return _resolve_time_of_day_str
+    raise TypeError(f"Unsupported time value: {type(value)}")
+
+
 def resolve_time_like(
     value: Union[TimeLike, TimeOfDayLike, None],
     *,
@@ -95,36 +139,28 @@ def resolve_time_like(
     """
     if value is None:
         return None
+    resolve = _TIME_RESOLVERS.get(type(value)) or _resolver_for(value)
+    return resolve(value, tz, reference)
 
-    if isinstance(value, (datetime, float, int)):
-        return dt(value, tz=tz)
-
-    ref = ensure_tz(reference, tz=tz) if reference is not None else datetime.now(tz)
-
-    if isinstance(value, dtime):
-        return datetime(
-            year=ref.year,
-            month=ref.month,
-            day=ref.day,
-            hour=value.hour,
-            minute=value.minute,
-            second=value.second,
-            tzinfo=ref.tzinfo,
-        )
 
-    if isinstance(value, str):
-        tod = parse_time_of_day(value)
-        return datetime(
-            year=ref.year,
-            month=ref.month,
-            day=ref.day,
-            hour=tod.hour,
-            minute=tod.minute,
-            second=tod.second,
-            tzinfo=ref.tzinfo,
-        )
+def resolve_time_like_many(
+    values: Iterable[Union[TimeLike, TimeOfDayLike, None]],
+    *,
+    tz: timezone,
+    reference: Optional[datetime] = None,
+) -> List[Optional[datetime]]:
+    """
+    resolve_time_like() over many values with one shared reference.
 
-    raise TypeError(f"Unsupported time value: {type(value)}")
+    When reference is None, "now" is read once for the whole batch (not per
+    time-of-day value), so every time-of-day lands on the same date.
+    """
+    ref = ensure_tz(reference, tz=tz) if reference is not None else datetime.now(tz)
+    resolvers = _TIME_RESOLVERS
+    return [
+        None if v is None else (resolvers.get(type(v)) or _resolver_for(v))(v, tz, ref)
+        for v in values
+    ]
 
 
 def ensure_end_after_start(start: datetime, end: datetime) -> datetime:
@@ -140,7 +176,12 @@ def ensure_end_after_start(start: datetime, end: datetime) -> datetime:
     return end
 
 
-_DURATION_TOKEN_RE = re.compile(r"(\d+(?:\.\d+)?)([smhdw])", flags=re.IGNORECASE)
+# Unit -> seconds (either case).
+_DURATION_UNIT_SECONDS = {
+    u: f
+    for unit, f in (("s", 1.0), ("m", 60.0), ("h", 3600.0), ("d", 86400.0), ("w", 604800.0))
+    for u in (unit, unit.upper())
+}
 
 
 def parse_duration(s: str) -> timedelta:
@@ -157,6 +198,9 @@ def parse_duration(s: str) -> timedelta:
       "2d"      -> 2 days
       "1.5h"    -> 1:30:00
 
+    Tokens are "<digits>[.<digits>]<unit>"; spaces are allowed between tokens.
+    The string is scanned once, left to right (no regex).
+
     Raises:
       ValidationError for invalid formats.
     """
@@ -164,30 +208,36 @@ def parse_duration(s: str) -> timedelta:
     if not raw:
         raise ValidationError("Duration must be a non-empty string")
 
-    matches = list(_DURATION_TOKEN_RE.findall(raw))
-    if not matches:
-        raise ValidationError(f"Invalid duration format: {s!r} (expected e.g. '1h30m', '90m')")
-
+    units = _DURATION_UNIT_SECONDS
+    n = len(raw)
     total_seconds = 0.0
-    consumed = "".join(f"{n}{u}" for n, u in matches)
-    if consumed.lower() != raw.lower().replace(" ", ""):
-        # Reject unknown characters/tokens.
-        raise ValidationError(f"Invalid duration format: {s!r}")
-
-    for num_s, unit in matches:
-        n = float(num_s)
-        u = unit.lower()
-        if u == "s":
-            total_seconds += n
-        elif u == "m":
-            total_seconds += n * 60.0
-        elif u == "h":
-            total_seconds += n * 3600.0
-        elif u == "d":
-            total_seconds += n * 86400.0
-        elif u == "w":
-            total_seconds += n * 604800.0
-        else:
-            raise ValidationError(f"Unsupported duration unit: {unit!r}")
+    tokens = 0
+    i = 0
+    while i < n:
+        if raw[i] == " ":
+            i += 1
+            continue
+
+        # number: digits, optionally "." + digits
+        j = i
+        while j < n and raw[j].isdecimal():
+            j += 1
+        if j < n and raw[j] == "." and j > i:
+            k = j + 1
+            while k < n and raw[k].isdecimal():
+                k += 1
+            if k > j + 1:
+                j = k
+
+        f = units.get(raw[j]) if i < j < n else None
+        if f is None:
+            if not tokens:
+                raise ValidationError(f"Invalid duration format: {s!r} (expected e.g. '1h30m', '90m')")
+            # Reject unknown characters/tokens.
+            raise ValidationError(f"Invalid duration format: {s!r}")
+
+        total_seconds += float(raw[i:j]) * f
+        tokens += 1
+        i = j + 1
 
     return timedelta(seconds=total_seconds)
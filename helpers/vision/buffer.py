@@ -4,13 +4,11 @@
 from __future__ import annotations
 
 import threading
-from dataclasses import dataclass, field
 from typing import Optional
 
 from .frame import Frame
 
 
-@dataclass
 class LatestFrameBuffer:
     """
     Thread-safe "latest frame" buffer.
@@ -20,23 +18,32 @@ class LatestFrameBuffer:
       - get_latest() returns immediately (may be None if nothing has been published)
       - wait_next(last_seq) blocks until a new frame is published or timeout
 
+    get_latest() and seq() read a single attribute without taking the lock
+    (an attribute load is atomic under the GIL), so polling consumers never
+    contend with the producer. The Condition serializes writers and backs
+    wait_next(), which returns a consistent (seq, frame) pair.
+
     This is intentionally minimal; it is a synchronization primitive, not a queue.
     """
-    _cond: threading.Condition = field(default_factory=lambda: threading.Condition(threading.Lock()))
-    _latest: Optional[Frame] = None
-    _seq: int = 0
+
+    __slots__ = ("_cond", "_latest", "_seq")
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._latest: Optional[Frame] = None
+        self._seq = 0
 
     def put(self, frame: Frame) -> None:
         """Publish a new frame and notify waiters."""
-        with self._cond:
+        cond = self._cond
+        with cond:
             self._latest = frame
             self._seq += 1
-            self._cond.notify_all()
+            cond.notify_all()
 
     def get_latest(self) -> Optional[Frame]:
         """Return the latest frame (or None if no frame has been published)."""
-        with self._cond:
-            return self._latest
+        return self._latest
 
     def wait_next(self, last_seq: int, *, timeout_s: Optional[float] = None) -> tuple[int, Optional[Frame]]:
         """
@@ -44,15 +51,15 @@ class LatestFrameBuffer:
 
         If timeout expires, returns the current (seq, latest) which may be unchanged.
         """
-        with self._cond:
+        cond = self._cond
+        with cond:
             if self._seq == last_seq:
-                self._cond.wait(timeout=timeout_s)
+                cond.wait(timeout=timeout_s)
             return self._seq, self._latest
 
     def seq(self) -> int:
         """Return current publish sequence number."""
-        with self._cond:
-            return self._seq
+        return self._seq
 
     def clear(self) -> None:
         """Drop the latest frame (does not reset seq)."""
@@ -2,6 +2,7 @@
 from .schema import VisionConfig, ensure_vision_config
 from .dump import dump_vision_config
 from .defaults import (
+    clear_config_cache,
     vision_catalog_loader,
     load_default_config_catalog,
     load_default_config_editable,
@@ -13,6 +14,7 @@ __all__ = [
     "VisionConfig",
     "ensure_vision_config",
     "dump_vision_config",
+    "clear_config_cache",
     "vision_catalog_loader",
     "load_default_config_catalog",
     "load_default_config_editable",
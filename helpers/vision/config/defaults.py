@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from helpers.persist import CatalogLoader
 from helpers.catalog import Catalog, EditableCatalog
@@ -11,6 +11,41 @@ from .schema import VisionConfig, ensure_vision_config
 from .dump import dump_vision_config
 
 
+# (resolved path, mtime_ns, size) -> validated Catalog. Editing the file changes
+# the key, so stale entries are simply never hit again. Editable loads are not
+# cached: they own a mutable raw document (and history).
+_CATALOG_CACHE: Dict[Tuple[str, int, int], Catalog[VisionConfig]] = {}
+_CATALOG_CACHE_MAX = 32
+
+
+def clear_config_cache() -> None:
+    """Drop all memoized vision config/template catalogs."""
+    _CATALOG_CACHE.clear()
+
+
+def _load_catalog_cached(path: Path, load: Callable[[], Catalog[VisionConfig]]) -> Catalog[VisionConfig]:
+    """
+    Return the Catalog for `path`, memoized by (path, mtime, size).
+
+    Catalog and VisionConfig are frozen, but params dicts are shared between
+    callers and must be treated as read-only.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        # Let the loader report the missing/unreadable file as before.
+        return load()
+
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cat = _CATALOG_CACHE.get(key)
+    if cat is None:
+        cat = load()
+        if len(_CATALOG_CACHE) >= _CATALOG_CACHE_MAX:
+            _CATALOG_CACHE.clear()
+        _CATALOG_CACHE[key] = cat
+    return cat
+
+
 def vision_catalog_loader(*, helpers_root: Optional[Path] = None) -> CatalogLoader[VisionConfig]:
     return CatalogLoader(
         app_name="vision",
@@ -24,7 +59,7 @@ def vision_catalog_loader(*, helpers_root: Optional[Path] = None) -> CatalogLoad
 
 def load_default_config_catalog(*, helpers_root: Optional[Path] = None) -> Catalog[VisionConfig]:
     loader = vision_catalog_loader(helpers_root=helpers_root)
-    return loader.load_config_catalog("default.json")
+    return _load_catalog_cached(loader.config_path("default.json"), lambda: loader.load_config_catalog("default.json"))
 
 
 def load_default_config_editable(*, helpers_root: Optional[Path] = None, history=None) -> EditableCatalog[VisionConfig]:
@@ -34,7 +69,7 @@ def load_default_config_editable(*, helpers_root: Optional[Path] = None, history
 
 def load_template_catalog(name: str, *, helpers_root: Optional[Path] = None) -> Catalog[VisionConfig]:
     loader = vision_catalog_loader(helpers_root=helpers_root)
-    return loader.load_template_catalog(name)
+    return _load_catalog_cached(loader.template_path(name), lambda: loader.load_template_catalog(name))
 
 
 def load_template_editable(name: str, *, helpers_root: Optional[Path] = None, history=None) -> EditableCatalog[VisionConfig]:
@@ -3,38 +3,68 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from helpers.validation import ValidationError, ensure_dict, ensure_str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VisionSourceConfig:
     """Validated config for the source/driver section."""
     driver: str
     params: Dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VisionTransformConfig:
     """Validated config for a single transform entry."""
     name: str
     params: Dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VisionPipelineConfig:
     """Validated config for the vision pipeline (source + transforms)."""
     source: VisionSourceConfig
     transforms: List[VisionTransformConfig]
 
 
-@dataclass(frozen=True)
+def _freeze(v: Any) -> Any:
+    """Hashable stand-in for a JSON-like value (dicts -> sorted item tuples, lists -> tuples)."""
+    if isinstance(v, dict):
+        return tuple(sorted((k, _freeze(x)) for k, x in v.items()))
+    if isinstance(v, list):
+        return tuple(map(_freeze, v))
+    return v
+
+
+@dataclass(frozen=True, slots=True)
 class VisionConfig:
-    """Top-level validated vision config document."""
+    """
+    Top-level validated vision config document.
+
+    Hashable (usable as a cache/set key): the hash covers the params dicts,
+    is computed on first use and then cached, so the document must not be
+    mutated afterwards.
+    """
     schema_version: int
     pipeline: VisionPipelineConfig
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        h = self._hash
+        if h is None:
+            p = self.pipeline
+            h = hash((
+                self.schema_version,
+                p.source.driver,
+                _freeze(p.source.params),
+                tuple((t.name, _freeze(t.params)) for t in p.transforms),
+            ))
+            object.__setattr__(self, "_hash", h)
+        return h
 
 
 def ensure_vision_config(raw: Any, *, path: str = "vision") -> VisionConfig:
@@ -58,7 +88,9 @@ def ensure_vision_config(raw: Any, *, path: str = "vision") -> VisionConfig:
     p = ensure_dict(d.get("pipeline"), path=f"{path}.pipeline")
 
     src = ensure_dict(p.get("source"), path=f"{path}.pipeline.source")
-    driver = ensure_str(src.get("driver"), path=f"{path}.pipeline.source.driver")
+    # Driver/transform names come from a small fixed set and end up as dict
+    # keys and comparison operands; interning lets those hit the identity check.
+    driver = sys.intern(ensure_str(src.get("driver"), path=f"{path}.pipeline.source.driver"))
     params = ensure_dict(src.get("params", {}), path=f"{path}.pipeline.source.params")
 
     # transforms list is optional (defaults to [])
@@ -69,7 +101,7 @@ def ensure_vision_config(raw: Any, *, path: str = "vision") -> VisionConfig:
     transforms: List[VisionTransformConfig] = []
     for i, tr in enumerate(tlist_raw):
         td = ensure_dict(tr, path=f"{path}.pipeline.transforms[{i}]")
-        name = ensure_str(td.get("name"), path=f"{path}.pipeline.transforms[{i}].name")
+        name = sys.intern(ensure_str(td.get("name"), path=f"{path}.pipeline.transforms[{i}].name"))
         tparams = ensure_dict(td.get("params", {}), path=f"{path}.pipeline.transforms[{i}].params")
         transforms.append(VisionTransformConfig(name=name, params=tparams))
 
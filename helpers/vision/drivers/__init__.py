@@ -11,15 +11,33 @@ Key API:
 - UvcOpenCvSource
 - make_source(driver, params)
 - list_driver_names()
+
+The source classes are loaded on first attribute access (PEP 562), so
+importing this package or the registry does not import the driver modules.
 """
 
-from .screen_mss import ScreenMssSource
-from .uvc_opencv import UvcOpenCvSource
+from importlib import import_module as _import_module
+from typing import Any
+
 from .registry import make_source, list_driver_names
 
+_LAZY_SOURCES = {
+    "ScreenMssSource": ".screen_mss",
+    "UvcOpenCvSource": ".uvc_opencv",
+}
+
 __all__ = [
     "ScreenMssSource",
     "UvcOpenCvSource",
     "make_source",
     "list_driver_names",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    mod = _LAZY_SOURCES.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_module(mod, __name__), name)
+    globals()[name] = value
+    return value
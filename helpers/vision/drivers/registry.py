@@ -3,21 +3,20 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 from helpers.validation.errors import ValidationError
-from helpers.validation.scalars import ensure_float, ensure_int, ensure_str
+from helpers.validation.scalars import ensure_bool, ensure_float, ensure_int, ensure_str
 
 from ..source import FrameSource
-from .screen_mss import ScreenMssSource
-from .uvc_opencv import UvcOpenCvSource
 
 
 Factory = Callable[[Mapping[str, Any]], FrameSource]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DriverSpec:
     """Metadata about a registered driver."""
     name: str
@@ -26,15 +25,19 @@ class DriverSpec:
 
 _REGISTRY: Dict[str, Factory] = {}
 _SPECS: Dict[str, DriverSpec] = {}
+# Sorted registry keys, rebuilt on register_driver (registration is rare, listing is not).
+_SORTED_NAMES: Tuple[str, ...] = ()
 
 
 def register_driver(name: str, factory: Factory, *, summary: str) -> None:
     """Register a new driver factory under a stable name."""
-    key = (name or "").strip()
+    global _SORTED_NAMES
+    key = sys.intern((name or "").strip())
     if not key:
         raise ValueError("register_driver: name must be non-empty")
     _REGISTRY[key] = factory
     _SPECS[key] = DriverSpec(name=key, summary=summary)
+    _SORTED_NAMES = tuple(sorted(_REGISTRY))
 
 
 def list_drivers() -> list[DriverSpec]:
@@ -44,7 +47,7 @@ def list_drivers() -> list[DriverSpec]:
 
 def list_driver_names() -> list[str]:
     """List known driver names."""
-    return sorted(_REGISTRY.keys())
+    return list(_SORTED_NAMES)
 
 
 def make_source(name: str, params: Optional[Mapping[str, Any]] = None) -> FrameSource:
@@ -70,19 +73,32 @@ def make_source(name: str, params: Optional[Mapping[str, Any]] = None) -> FrameS
 
 # ------------------------
 # Built-in factories
+# (driver modules are imported on first use, not at registration)
 # ------------------------
 
 def _make_screen_mss(p: Mapping[str, Any]) -> FrameSource:
+    from .screen_mss import ScreenMssSource
+
     monitor = ensure_int(p.get("monitor", 1), path="params.monitor", min_v=0)
 
     target_fps = p.get("target_fps", None)
     if target_fps is not None:
         target_fps = ensure_float(target_fps, path="params.target_fps", min_v=0.1)
 
-    return ScreenMssSource(monitor=monitor, target_fps=target_fps)
+    reuse_buffers = ensure_bool(p.get("reuse_buffers", False), path="params.reuse_buffers")
+    async_capture = ensure_bool(p.get("async_capture", False), path="params.async_capture")
+
+    return ScreenMssSource(
+        monitor=monitor,
+        target_fps=target_fps,
+        reuse_buffers=reuse_buffers,
+        async_capture=async_capture,
+    )
 
 
 def _make_uvc_opencv(p: Mapping[str, Any]) -> FrameSource:
+    from .uvc_opencv import UvcOpenCvSource
+
     device_index = ensure_int(p.get("device_index", 0), path="params.device_index", min_v=0)
 
     width = p.get("width", None)
@@ -3,14 +3,17 @@
 
 from __future__ import annotations
 
+import threading
 import time
+from types import MappingProxyType
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 import numpy as np
 
 from helpers.threading import RateLimiter
 
+from ..buffer import LatestFrameBuffer
 from ..frame import Frame, PixelFormat
 from ..source import FrameSource, SourceInfo
 
@@ -28,6 +31,37 @@ def _require_mss():
         raise RuntimeError("Missing optional dependency 'mss'. Install it to use ScreenMssSource.") from e
 
 
+# Producer pacing for async_capture when target_fps is None: an unpaced grab
+# loop would spin a core at compositor speed regardless of the consumer.
+ASYNC_DEFAULT_FPS = 60.0
+_JOIN_TIMEOUT_S = 2.0
+
+_UNSET: Any = object()
+_cv2: Any = _UNSET
+
+
+def _optional_cv2() -> Any:
+    """
+    Return cv2 if installed, else None (probed once).
+
+    Unlike uvc_opencv's _require_cv2, cv2 is only an accelerator here: the
+    BGRA->RGB conversion falls back to NumPy.
+    """
+    global _cv2
+    if _cv2 is _UNSET:
+        try:
+            import cv2  # type: ignore
+        except Exception:
+            cv2 = None
+        _cv2 = cv2
+    return _cv2
+
+
+def _bgra_view(raw: Any) -> np.ndarray:
+    """(H, W, 4) uint8 view over an mss ScreenShot's BGRA buffer (no copy)."""
+    return np.frombuffer(raw.raw, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+
+
 @dataclass
 class ScreenMssSource(FrameSource):
     """
@@ -45,14 +79,36 @@ class ScreenMssSource(FrameSource):
       target_fps:
         Optional limiter inside the driver; you can also limit in SourceRunner.
         If both are set, you'll effectively limit twice (usually avoid that).
+      reuse_buffers:
+        Convert into two preallocated RGB buffers used alternately instead of
+        allocating one per frame. Frame.image then stays valid only until two
+        more read() calls; copy it if you keep frames longer. Off by default.
+      async_capture:
+        Grab on a private producer thread (which owns the mss instance) into a
+        single latest-frame slot. read() then waits up to read_timeout_s for a
+        frame newer than the last one it returned (None on timeout); frames the
+        consumer is too slow for are dropped. target_fps paces the producer
+        (ASYNC_DEFAULT_FPS if None). Not combinable with reuse_buffers.
     """
 
     monitor: int = 1
     target_fps: Optional[float] = None
+    reuse_buffers: bool = False
+    async_capture: bool = False
+    read_timeout_s: float = 0.1
 
     _sct: Any = field(default=None, init=False, repr=False)
     _mon: Optional[Dict[str, int]] = field(default=None, init=False, repr=False)
+    _meta: Mapping[str, Any] = field(default_factory=dict, init=False, repr=False)
     _limiter: RateLimiter = field(default_factory=lambda: RateLimiter(target_fps=None), init=False, repr=False)
+    _rgb_bufs: list = field(default_factory=list, init=False, repr=False)
+    _rgb_idx: int = field(default=0, init=False, repr=False)
+
+    _thread: Optional[threading.Thread] = field(default=None, init=False, repr=False)
+    _stop: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _slot: Optional[LatestFrameBuffer] = field(default=None, init=False, repr=False)
+    _slot_seq: int = field(default=0, init=False, repr=False)
+    _producer_error: Optional[Exception] = field(default=None, init=False, repr=False)
 
     def open(self) -> None:
         """
@@ -60,14 +116,69 @@ class ScreenMssSource(FrameSource):
 
         Important:
           - mss uses thread-local resources on Windows; `open()` should be called
-            in the same thread that will call `read()`.
+            in the same thread that will call `read()` (with async_capture the
+            producer thread opens its own instance instead).
         """
+        if self.async_capture:
+            self._start_producer()
+            return
+
         self._open_sct()
 
         # Smoke-test a single grab here so we fail loudly (Python exception)
         # instead of crashing later in the UI loop.
         _ = self._grab_rgb_once()
 
+    def _start_producer(self) -> None:
+        """Start the capture thread and wait until it has opened and grabbed once."""
+        if self.reuse_buffers:
+            raise RuntimeError("screen_mss: reuse_buffers cannot be combined with async_capture")
+        t = self._thread
+        if t is not None:
+            if t.is_alive():
+                # Still running, or still stopping after a close() that timed out.
+                raise RuntimeError("screen_mss: capture thread is already running")
+            self._thread = None
+
+        ready = threading.Event()
+        self._stop.clear()
+        self._slot = LatestFrameBuffer()
+        self._slot_seq = 0
+        self._producer_error = None
+        self._thread = threading.Thread(target=self._producer_loop, args=(ready,), name="screen_mss", daemon=True)
+        self._thread.start()
+        ready.wait()
+
+        err = self._producer_error
+        if err is not None:
+            self._thread.join()
+            self._thread = None
+            self._slot = None
+            raise err
+
+    def _producer_loop(self, ready: threading.Event) -> None:
+        """Producer thread: open mss here (thread-local handles), then grab until stopped."""
+        slot = self._slot
+        try:
+            try:
+                self._open_sct()
+                _ = self._grab_rgb_once()
+            except Exception as e:
+                self._producer_error = e
+                return
+            finally:
+                ready.set()
+
+            stop = self._stop
+            while not stop.is_set():
+                frame = self._read_sync()
+                if frame is not None:
+                    slot.put(frame)
+        except Exception as e:
+            self._producer_error = e
+        finally:
+            self._close_sct()
+
     def _open_sct(self) -> None:
         """(Re)create the mss instance and monitor rect."""
         mss = _require_mss()
@@ -86,10 +197,30 @@ class ScreenMssSource(FrameSource):
                 f"Available monitors: {count if count is not None else 'unknown'}"
             ) from e
 
-        self._limiter = RateLimiter(target_fps=self.target_fps)
+        fps = self.target_fps
+        if fps is None and self.async_capture:
+            fps = ASYNC_DEFAULT_FPS
+        self._limiter = RateLimiter(target_fps=fps)
+        # Shared by every Frame from this session (Frame.meta is read-only).
+        self._meta = MappingProxyType({"driver": "screen_mss", "monitor": self.monitor})
 
     def close(self) -> None:
-        """Close the mss context (best-effort)."""
+        """Stop the producer thread if any and close the mss context (best-effort)."""
+        t = self._thread
+        if t is not None:
+            self._stop.set()
+            t.join(timeout=_JOIN_TIMEOUT_S)
+            self._slot = None
+            # The producer closes its own mss instance on exit. If it has not
+            # exited yet (grab stuck), keep the handle so open() refuses to
+            # start a second producer next to it.
+            if not t.is_alive():
+                self._thread = None
+        else:
+            self._close_sct()
+        self._limiter.reset()
+
+    def _close_sct(self) -> None:
         if self._sct is not None:
             try:
                 self._sct.close()
@@ -97,7 +228,7 @@ class ScreenMssSource(FrameSource):
                 pass
         self._sct = None
         self._mon = None
-        self._limiter.reset()
+        self._rgb_bufs = []
 
     def info(self) -> SourceInfo:
         """Return best-effort metadata about the selected monitor capture."""
@@ -111,15 +242,34 @@ class ScreenMssSource(FrameSource):
             extra={"monitor": self.monitor, "left": int(self._mon["left"]), "top": int(self._mon["top"])},
         )
 
+    def _next_rgb_buf(self, h: int, w: int) -> np.ndarray:
+        """Return the next of the two reusable (h, w, 3) buffers, (re)allocating on size change."""
+        bufs = self._rgb_bufs
+        if not bufs or bufs[0].shape != (h, w, 3):
+            bufs = self._rgb_bufs = [np.empty((h, w, 3), dtype=np.uint8), np.empty((h, w, 3), dtype=np.uint8)]
+        self._rgb_idx ^= 1
+        return bufs[self._rgb_idx]
+
     def _grab_rgb_once(self) -> np.ndarray:
         """Grab BGRA once and convert to RGB (uint8)."""
         if self._sct is None or self._mon is None:
             raise RuntimeError("screen_mss: not opened")
 
-        raw = self._sct.grab(self._mon)              # BGRA
-        img = np.array(raw, dtype=np.uint8)          # (H, W, 4)
-        bgr = img[:, :, :3]                          # (H, W, 3)
-        return bgr[:, :, ::-1].copy()                # RGB
+        bgra = _bgra_view(self._sct.grab(self._mon))
+        # One copy into a contiguous RGB array: cv2's SIMD shuffle when
+        # available, else a strided NumPy copy of channels 2,1,0.
+        cv2 = _optional_cv2()
+        if not self.reuse_buffers:
+            if cv2 is not None:
+                return cv2.cvtColor(bgra, cv2.COLOR_BGRA2RGB)
+            return bgra[:, :, 2::-1].copy()
+
+        dst = self._next_rgb_buf(bgra.shape[0], bgra.shape[1])
+        if cv2 is not None:
+            cv2.cvtColor(bgra, cv2.COLOR_BGRA2RGB, dst=dst)
+        else:
+            np.copyto(dst, bgra[:, :, 2::-1])
+        return dst
 
     def read(self) -> Optional[Frame]:
         """
@@ -127,10 +277,31 @@ class ScreenMssSource(FrameSource):
 
         Notes:
           - mss.grab returns BGRA; we convert to RGB8.
-          - Conversion makes a copy to ensure a contiguous RGB array.
+          - The BGRA buffer is viewed in place and converted with a single
+            copy into a contiguous RGB array (cv2.cvtColor if installed).
+          - With reuse_buffers=True that array is one of two recycled buffers
+            (see the class docstring for the lifetime rule).
           - On Windows, mss uses thread-local handle state; if that state is missing
             we recreate the mss instance and retry once.
+          - With async_capture this returns the producer's latest frame instead
+            (None if no newer frame arrived within read_timeout_s).
         """
+        slot = self._slot
+        if slot is not None:
+            seq, frame = slot.wait_next(self._slot_seq, timeout_s=self.read_timeout_s)
+            if seq == self._slot_seq:
+                err = self._producer_error
+                if err is not None:
+                    raise RuntimeError("screen_mss: capture thread failed") from err
+                return None
+            self._slot_seq = seq
+            return frame
+        if self._thread is not None:
+            return None  # closed, producer still stopping; its mss belongs to it
+        return self._read_sync()
+
+    def _read_sync(self) -> Optional[Frame]:
+        """Rate-limit, grab and wrap one frame on the calling thread."""
         if self._sct is None or self._mon is None:
             return None
 
@@ -143,7 +314,7 @@ class ScreenMssSource(FrameSource):
             if "_thread._local" in msg and ("srcdc" in msg or "srdc" in msg):
                 # Recreate in current thread and retry once.
                 try:
-                    self.close()
+                    self._close_sct()
                 except Exception:
                     pass
                 self._open_sct()
@@ -152,4 +323,4 @@ class ScreenMssSource(FrameSource):
                 raise
 
         ts = time.perf_counter()
-        return Frame(image=rgb, ts_monotonic=ts, fmt=PixelFormat.RGB8, meta={"driver": "screen_mss", "monitor": self.monitor})
+        return Frame(image=rgb, ts_monotonic=ts, fmt=PixelFormat.RGB8, meta=self._meta)
@@ -5,8 +5,9 @@
 from __future__ import annotations
 
 import time
+from types import MappingProxyType
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 import numpy as np
 
@@ -112,6 +113,7 @@ class UvcOpenCvSource(FrameSource):
     _limiter: RateLimiter = field(default_factory=lambda: RateLimiter(target_fps=None), init=False, repr=False)
     _negotiated: Dict[str, Any] = field(default_factory=dict, init=False, repr=False)
     _backend_used: Optional[int] = field(default=None, init=False, repr=False)
+    _meta: Mapping[str, Any] = field(default_factory=dict, init=False, repr=False)
 
     def open(self) -> None:
         """Open the camera and attempt best-effort property negotiation (probe-aligned ordering)."""
@@ -163,6 +165,12 @@ class UvcOpenCvSource(FrameSource):
 
         self._cap = cap
         self._limiter = RateLimiter(target_fps=self.target_fps)
+        # Shared by every Frame from this session (Frame.meta is read-only).
+        self._meta = MappingProxyType({
+            "driver": "uvc_opencv",
+            "device_index": self.device_index,
+            "backend_used": b,
+        })
 
         # Read back negotiated properties for info()/meta (best-effort)
         self._negotiated = {}
@@ -242,9 +250,4 @@ class UvcOpenCvSource(FrameSource):
             img = img.astype(np.uint8, copy=False)
 
         ts = time.perf_counter()
-        meta = {
-            "driver": "uvc_opencv",
-            "device_index": self.device_index,
-            "backend_used": self._backend_used,
-        }
-        return Frame(image=img, ts_monotonic=ts, fmt=PixelFormat.BGR8, meta=meta)
+        return Frame(image=img, ts_monotonic=ts, fmt=PixelFormat.BGR8, meta=self._meta)
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Mapping, Optional, Tuple
 
 import numpy as np
 
@@ -21,7 +21,7 @@ class PixelFormat(str, Enum):
     GRAY8 = "gray8"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Frame:
     """
     A single video/capture frame.
@@ -36,11 +36,12 @@ class Frame:
         PixelFormat of `image`
       meta:
         arbitrary metadata (device info, monitor index, negotiated FPS, crop/resize info, etc.)
+        Read-only: drivers may share one mapping across all frames they emit.
     """
     image: np.ndarray
     ts_monotonic: float
     fmt: PixelFormat = PixelFormat.RGB8
-    meta: Dict[str, Any] = field(default_factory=dict)
+    meta: Mapping[str, Any] = field(default_factory=dict)
 
     @property
     def h(self) -> int:
@@ -69,9 +70,12 @@ class Frame:
         Return a new Frame with updated image, optional format, and merged metadata updates.
 
         This is the standard transform pattern: do not mutate Frame.meta in-place.
+        Without meta_updates the (read-only) meta mapping is shared, not copied.
         """
-        m = dict(self.meta)
-        m.update(meta_updates)
+        m = self.meta
+        if meta_updates:
+            m = dict(m)
+            m.update(meta_updates)
         return Frame(
             image=image,
             ts_monotonic=self.ts_monotonic,
@@ -54,6 +54,11 @@ def rgb_to_rgba_u8(rgb: np.ndarray) -> np.ndarray:
 
     h, w, _ = rgb.shape
     rgba = np.empty((h, w, 4), dtype=np.uint8)
-    rgba[:, :, :3] = rgb
-    rgba[:, :, 3] = _ALPHA_FULL
+    # One strided copy per channel: NumPy's inner loop for a 3-byte-wide
+    # block copy (rgba[..., :3] = rgb) is several times slower than these
+    # single-element strided loops.
+    rgba[..., 0] = rgb[..., 0]
+    rgba[..., 1] = rgb[..., 1]
+    rgba[..., 2] = rgb[..., 2]
+    rgba[..., 3] = _ALPHA_FULL
     return rgba
@@ -2,35 +2,45 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Optional, Set
+from typing import FrozenSet, List, Optional, Tuple
 
 from helpers.vision.overlays.models import Annotation, LayerFilter
 
 
-def match_filter(a: Annotation, f: LayerFilter) -> bool:
-    if f.kinds is not None and len(f.kinds) > 0:
-        if a.kind not in f.kinds:
-            return False
-
-    tags: Set[str] = set(a.tags or [])
-
-    if f.exclude_tags_any:
-        for t in f.exclude_tags_any:
-            if t in tags:
-                return False
-
-    if f.require_tags_all:
-        for t in f.require_tags_all:
-            if t not in tags:
-                return False
+# (kinds, exclude_any, require_all, require_any); None/empty means "no constraint".
+_Compiled = Tuple[Optional[FrozenSet[str]], FrozenSet[str], FrozenSet[str], FrozenSet[str]]
+
+
+def _compile_filter(f: LayerFilter) -> _Compiled:
+    """Convert the filter's lists to frozensets once per filter_annotations call."""
+    return (
+        frozenset(f.kinds) if f.kinds else None,
+        frozenset(f.exclude_tags_any or ()),
+        frozenset(f.require_tags_all or ()),
+        frozenset(f.require_tags_any or ()),
+    )
+
+
+def _match(a: Annotation, c: _Compiled) -> bool:
+    # Cheapest check first (one hash lookup); tag checks are C-level set ops
+    # over a.tags directly, without building a per-annotation set.
+    kinds, ex_any, req_all, req_any = c
+    if kinds is not None and a.kind not in kinds:
+        return False
+    tags = a.tags or ()
+    if ex_any and not ex_any.isdisjoint(tags):
+        return False
+    if req_all and not req_all.issubset(tags):
+        return False
+    if req_any and req_any.isdisjoint(tags):
+        return False
+    return True
 
-    if f.require_tags_any:
-        ok = any(t in tags for t in f.require_tags_any)
-        if not ok:
-            return False
 
-    return True
+def match_filter(a: Annotation, f: LayerFilter) -> bool:
+    return _match(a, _compile_filter(f))
 
 
 def filter_annotations(annotations: List[Annotation], f: LayerFilter) -> List[Annotation]:
-    return [a for a in annotations if match_filter(a, f)]
+    c = _compile_filter(f)
+    return [a for a in annotations if _match(a, c)]
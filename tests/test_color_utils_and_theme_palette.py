@@ -91,3 +91,25 @@ def test_generate_palette_smoke():
     assert p.base == ColorRGB(30, 30, 30)
     assert p.fg in (ColorRGB(255, 255, 255), ColorRGB(0, 0, 0))
     assert isinstance(p.warning.r, int)
+
+
+def test_generate_palettes_batch_matches_scalar():
+    pytest.importorskip("numpy")
+    from helpers.theme_palette import generate_palettes_batch
+
+    bases = [ColorRGB(r, g, b) for r in (0, 37, 128, 255) for g in (0, 90, 255) for b in (0, 201, 255)]
+    accents = [None if i % 3 else ColorRGB(10 * i % 256, 200, 30) for i in range(len(bases))]
+    fgs = [None if i % 2 else ColorRGB(250, 250, 240) for i in range(len(bases))]
+
+    for mode in ("global", "relative"):
+        for cohesion in (0.0, 0.15, 1.0):
+            batch = generate_palettes_batch(bases, accents, fgs, warning_mode=mode, cohesion=cohesion)
+            scalar = [
+                generate_palette(base=b, accent=a, fg=f, warning_mode=mode, cohesion=cohesion)
+                for b, a, f in zip(bases, accents, fgs)
+            ]
+            assert batch == scalar
+
+    assert generate_palettes_batch([]) == []
+    with pytest.raises(ValueError):
+        generate_palettes_batch(bases, accents=[None])
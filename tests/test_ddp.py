@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import socket
+import struct
+
+import pytest
+
+from helpers.toolkits.ddp import DDP_MAX_PAYLOAD, DdpSender, build_ddp_packet, iter_ddp_packets
+
+
+def test_build_ddp_packet_header_and_payload():
+    payload = bytes(range(9))
+    pkt = build_ddp_packet(257, payload, data_offset=6)
+
+    assert len(pkt) == 10 + len(payload)
+    assert struct.unpack("!BBBBLH", pkt[:10]) == (0x41, 1, 0x01, 0x00, 6, 9)
+    assert bytes(pkt[10:]) == payload
+
+
+def test_build_ddp_packet_accepts_bytes_like():
+    payload = bytearray(b"\x01\x02\x03")
+    assert build_ddp_packet(0, memoryview(payload))[10:] == payload
+
+    with pytest.raises(TypeError):
+        build_ddp_packet(0, [1, 2, 3])  # type: ignore[arg-type]
+
+
+def test_build_ddp_packet_rejects_bad_sizes():
+    with pytest.raises(ValueError):
+        build_ddp_packet(0, b"\x01\x02")
+    with pytest.raises(ValueError):
+        build_ddp_packet(0, bytes(DDP_MAX_PAYLOAD + 3))
+
+
+def test_iter_ddp_packets_splits_with_offsets():
+    payload = bytes(range(256)) * 12 + bytes(9)  # 3081 bytes -> 1440 + 1440 + 201
+    pkts = list(iter_ddp_packets(7, payload))
+    headers = [struct.unpack("!BBBBLH", p[:10]) for p in pkts]
+
+    assert [h[4] for h in headers] == [0, 1440, 2880]
+    assert [h[5] for h in headers] == [1440, 1440, 201]
+    assert [h[0] for h in headers] == [0x40, 0x40, 0x41]
+    assert b"".join(bytes(p[10:]) for p in pkts) == payload
+
+    with pytest.raises(ValueError):
+        list(iter_ddp_packets(0, payload, chunk=1000))
+
+
+def test_ddp_sender_reuses_buffer_and_wraps_sequence():
+    rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    rx.bind(("127.0.0.1", 0))
+    rx.settimeout(2.0)
+    sender = DdpSender("127.0.0.1", rx.getsockname()[1])
+    try:
+        sender._seq = 255
+        sender.send_frame(b"\x01\x02\x03")
+        buf = sender._packet_buf(3)
+        sender.send_frame(b"\x04\x05\x06")
+        assert sender._packet_buf(3) is buf
+
+        first = rx.recv(64)
+        second = rx.recv(64)
+        assert first[1] == 255 and first[10:] == b"\x01\x02\x03"
+        assert second[1] == 0 and second[10:] == b"\x04\x05\x06"
+    finally:
+        sender.close()
+        rx.close()
+
+
+def test_ddp_sender_send_universes_offsets_and_push():
+    rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    rx.bind(("127.0.0.1", 0))
+    rx.settimeout(2.0)
+    sender = DdpSender("127.0.0.1", rx.getsockname()[1])
+    try:
+        sender.send_universes([b"\x01\x02\x03", b"\x04\x05\x06", b"\x07\x08\x09"])
+        headers = [struct.unpack("!BBBBLH", rx.recv(64)[:10]) for _ in range(3)]
+        assert [h[0] for h in headers] == [0x40, 0x40, 0x41]
+        assert [h[1] for h in headers] == [0, 0, 0]
+        assert [h[4] for h in headers] == [0, 3, 6]
+        assert sender._seq == 1
+    finally:
+        sender.close()
+        rx.close()
+
+
+def test_ddp_sender_splits_oversized_frames():
+    rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    rx.bind(("127.0.0.1", 0))
+    rx.settimeout(2.0)
+    sender = DdpSender("127.0.0.1", rx.getsockname()[1])
+    try:
+        sender.send_frame(bytes(DDP_MAX_PAYLOAD + 30))
+        a = struct.unpack("!BBBBLH", rx.recv(2048)[:10])
+        b = struct.unpack("!BBBBLH", rx.recv(2048)[:10])
+        assert (a[0], a[4], a[5]) == (0x40, 0, DDP_MAX_PAYLOAD)
+        assert (b[0], b[4], b[5]) == (0x41, DDP_MAX_PAYLOAD, 30)
+    finally:
+        sender.close()
+        rx.close()
+
+
+def test_ddp_sender_drops_frames_when_send_buffer_full():
+    class _FullSocket:
+        def send(self, buf):
+            raise BlockingIOError
+
+        def close(self):
+            pass
+
+    sender = DdpSender("127.0.0.1", 9)
+    sender._sock.close()
+    sender._sock = _FullSocket()  # type: ignore[assignment]
+    sender.send_frame(b"\x01\x02\x03")
+    sender.send_universes([b"\x01\x02\x03", b"\x04\x05\x06"])
+    assert sender.dropped_frames == 2
+
+    sender._strict = True
+    with pytest.raises(BlockingIOError):
+        sender.send_frame(b"\x01\x02\x03")
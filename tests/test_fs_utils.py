@@ -90,3 +90,18 @@ def test_json_io(tmp_path: Path):
     p2 = tmp_path / "cfg" / "atomic.json"
     atomic_write_json(p2, {"x": [1, 2, 3]})
     assert read_json(p2) == {"x": [1, 2, 3]}
+
+
+def test_read_json_keeps_stdlib_semantics(tmp_path: Path):
+    import json
+    import math
+
+    p = tmp_path / "lenient.json"
+    p.write_text('{"nan": NaN, "big": 123456789012345678901234567890}', encoding="utf-8")
+    doc = read_json(p)
+    assert math.isnan(doc["nan"]) and doc["big"] == 123456789012345678901234567890
+
+    bad = tmp_path / "bad.json"
+    bad.write_text("{", encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        read_json(bad)
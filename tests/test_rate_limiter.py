@@ -0,0 +1,82 @@
+# tests/test_rate_limiter.py
+from __future__ import annotations
+
+import pytest
+
+from helpers.threading import rate_limiter
+from helpers.threading.rate_limiter import RateLimiter
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps = []
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def sleep(self, s: float) -> None:
+        self.sleeps.append(s)
+        self.now += s
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = _FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "perf_counter", c.perf_counter)
+    monkeypatch.setattr(rate_limiter.time, "sleep", c.sleep)
+    return c
+
+
+def test_rate_limiter_paces_to_target_fps(clock):
+    rl = RateLimiter(target_fps=10)
+    rl.sleep_if_needed()
+    assert clock.sleeps == []
+
+    clock.now += 0.03
+    rl.sleep_if_needed()
+    assert clock.sleeps == [pytest.approx(0.07)]
+    assert clock.now == pytest.approx(100.1)
+
+    for _ in range(3):
+        clock.now += 0.02
+        rl.sleep_if_needed()
+    assert clock.sleeps[1:] == [pytest.approx(0.08)] * 3
+    assert clock.now == pytest.approx(100.4)
+
+
+@pytest.mark.parametrize("fps", [None, 0, -5])
+def test_rate_limiter_disabled_never_sleeps(clock, fps):
+    rl = RateLimiter(target_fps=fps)
+    for _ in range(5):
+        rl.sleep_if_needed()
+    assert clock.sleeps == []
+    assert rl.target_fps == fps
+
+
+def test_rate_limiter_reset_makes_next_tick_first(clock):
+    rl = RateLimiter(target_fps=10)
+    rl.sleep_if_needed()
+    rl.reset()
+    clock.now += 0.01
+    rl.sleep_if_needed()
+    assert clock.sleeps == []
+
+    clock.now += 0.01
+    rl.tick()
+    assert clock.sleeps == [pytest.approx(0.09)]
+
+
+def test_rate_limiter_late_call_does_not_burst(clock):
+    rl = RateLimiter(target_fps=10)
+    rl.sleep_if_needed()
+
+    # Stall for several intervals: the late call re-anchors to now instead of
+    # letting the following calls run back-to-back to catch up.
+    clock.now += 0.55
+    rl.sleep_if_needed()
+    assert clock.sleeps == []
+
+    clock.now += 0.01
+    rl.sleep_if_needed()
+    assert clock.sleeps == [pytest.approx(0.09)]
@@ -8,6 +8,7 @@ import pytest
 
 from helpers.strip_map import (
     FixedStrip,
+    SegmentTimeline,
     TimeSegment,
     progress_to_index,
     segments_to_ranges,
@@ -80,6 +81,39 @@ def test_active_segment_index_and_progress():
     assert p is None or (0.0 <= p <= 1.0)
 
 
+def test_segment_timeline_locate():
+    tl = SegmentTimeline(
+        [
+            TimeSegment("a", timedelta(seconds=2)),
+            TimeSegment("skip", timedelta(0)),
+            TimeSegment("b", timedelta(seconds=4)),
+        ]
+    )
+    assert tl.locate(timedelta(seconds=1)) == (0, 0.5)
+    assert tl.locate(timedelta(seconds=2)) == (2, 0.0)
+    assert tl.locate(timedelta(seconds=5)) == (2, 0.75)
+    assert tl.locate(timedelta(seconds=9)) == (2, 1.0)
+    assert SegmentTimeline([]).locate(timedelta(seconds=1)) is None
+
+
+def test_segment_timeline_negative_elapsed_and_durations():
+    tl = SegmentTimeline([TimeSegment("a", timedelta(0)), TimeSegment("b", timedelta(seconds=10))])
+    assert tl.locate(timedelta(seconds=-1)) == (1, 0.0)
+    assert tl.locate(timedelta(0)) == (1, 0.0)
+
+    tl = SegmentTimeline(
+        [
+            TimeSegment("a", timedelta(seconds=2)),
+            TimeSegment("neg", timedelta(seconds=-5)),
+            TimeSegment("b", timedelta(seconds=2)),
+        ]
+    )
+    assert tl.cumdur == [2.0, 2.0, 4.0]
+    assert tl.locate(timedelta(seconds=-3)) == (0, 0.0)
+    assert tl.locate(timedelta(seconds=1)) == (0, 0.5)
+    assert tl.locate(timedelta(seconds=3)) == (2, 0.5)
+
+
 def test_session_playhead_index():
     tz = timezone.utc
     session = TimedSession()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import pytest
+
+from helpers.tags import (
+    TagSet,
+    apply_tag_add,
+    apply_tag_remove,
+    apply_tag_remove_unchecked,
+    normalize_tag_str,
+    parse_tag,
+    validate_tag_catalog,
+    validate_tag_str,
+    validate_tagset,
+)
+from helpers.validation import ValidationError
+
+
+def _catalog():
+    return validate_tag_catalog(
+        {
+            "namespaces": [
+                {"name": "topic", "multi_valued": True},
+                {"name": "Mood", "multi_valued": False, "allowed_values": ["calm", "hype"]},
+                {"name": "scene", "applies_to": ["phrases"]},
+            ]
+        }
+    )
+
+
+def test_parse_and_normalize():
+    t = parse_tag("  Topic : news ")
+    assert (t.namespace, t.value) == ("Topic", "news")
+    assert normalize_tag_str("Topic:news") == "topic:news"
+    assert normalize_tag_str("Topic:news", lower_namespace=False) == "Topic:news"
+
+    assert parse_tag("ns:x").value == "x"
+
+    for bad in ("", "nocolon", ":x", "ns:", "1ns:x", "ns x:y", "ns:a\nb", "\u212aey:x"):
+        with pytest.raises(ValidationError):
+            parse_tag(bad)
+
+
+def test_validate_tag_str_against_catalog():
+    cat = _catalog()
+    assert validate_tag_str("MOOD:calm", cat) == "mood:calm"
+
+    with pytest.raises(ValidationError):
+        validate_tag_str("unknown:x", cat)
+    with pytest.raises(ValidationError):
+        validate_tag_str("mood:angry", cat)
+    with pytest.raises(ValidationError):
+        validate_tag_str("scene:intro", cat, scope="zones")
+    assert validate_tag_str("scene:intro", cat, scope="phrases") == "scene:intro"
+
+
+def test_validate_tagset_dedupes_and_enforces_single_valued():
+    cat = _catalog()
+    ts = validate_tagset(["topic:ai", "Topic:ai", "mood:calm", "MOOD:calm"], cat)
+    assert ts.items == ["topic:ai", "mood:calm"]
+
+    with pytest.raises(ValidationError):
+        validate_tagset(["mood:calm", "mood:hype"], cat)
+
+
+def test_apply_tag_add_and_remove():
+    cat = _catalog()
+    ts = TagSet(["mood:calm", "topic:ai"])
+    apply_tag_add(ts, "Mood:hype", cat)
+    assert ts.items == ["topic:ai", "mood:hype"]
+
+    apply_tag_remove(ts, " TOPIC:ai ")
+    assert ts.items == ["mood:hype"]
+
+    apply_tag_remove(ts, "mood:hype")
+    assert ts.items == []
+    with pytest.raises(ValidationError):
+        apply_tag_remove(ts, "not a tag")
+
+    ts = TagSet(["topic:ai"])
+    apply_tag_remove_unchecked(ts, "topic:ai")
+    assert ts.items == []
+
+
+def test_parse_tag_cache_keeps_caller_path_in_errors():
+    for path in ("first", "second"):
+        with pytest.raises(ValidationError, match=rf"^{path} has invalid namespace"):
+            parse_tag("1bad:x", path=path)
+    assert parse_tag("topic:news") is parse_tag("topic:news")
@@ -10,6 +10,12 @@ from helpers.time_utils import (
     monotonic_s,
     to_unix_seconds,
     delta,
+    floor_to,
+    ceil_to,
+    floor_to_epoch,
+    ceil_to_epoch,
+    since,
+    until,
     format_timedelta,
     progress_ratio,
     TimeWindow,
@@ -39,6 +45,14 @@ def test_delta_mixed_inputs():
 
     # unix timestamps
     assert delta(0.0, 10.0, tz=tz).total_seconds() == 10
+    assert delta(5, 2.5, tz=tz).total_seconds() == -2.5
+    assert delta(0, b, tz=tz) == b - datetime(1970, 1, 1, tzinfo=tz)
+
+
+def test_since_until_unix_seconds():
+    t = _time.time()
+    assert 9.0 < since(t - 10.0).total_seconds() < 11.0
+    assert 9.0 < until(t + 10.0).total_seconds() < 11.0
 
 
 def test_format_timedelta():
@@ -94,3 +108,28 @@ def test_timed_session_active_elapsed_paused():
     assert e2 is not None
     assert (e2 - e1).total_seconds() < 0.02
     s.pause.resume()
+
+
+def test_timed_session_active_elapsed_external_start():
+    tz = timezone.utc
+    s = TimedSession()
+    s.window.tz = tz
+    s.start()
+    # Assigning start directly bypasses the monotonic anchor (wall-clock fallback).
+    s.window.start = datetime.now(tz) - timedelta(seconds=30)
+    e = s.active_elapsed()
+    assert e is not None and 29.0 < e.total_seconds() < 31.0
+
+
+def test_floor_ceil_to():
+    tz = timezone.utc
+    t = datetime(2020, 1, 1, 0, 0, 7, 500000, tzinfo=tz)
+    assert floor_to(t, seconds=5) == datetime(2020, 1, 1, 0, 0, 5, tzinfo=tz)
+    assert ceil_to(t, seconds=5) == datetime(2020, 1, 1, 0, 0, 10, tzinfo=tz)
+    assert floor_to_epoch(17.9, 5) == 15
+    assert ceil_to_epoch(15.0, 5) == 15
+    assert ceil_to_epoch(1.5, 1) == 2
+    assert floor_to_epoch(-0.5, 1) == -1
+    assert ceil_to_epoch(-4.5, 5) == 0 and floor_to_epoch(-4.5, 5) == -5
+    with pytest.raises(ValueError):
+        floor_to(t, seconds=0)
@@ -76,3 +76,94 @@ def test_make_gamma_lut_u8_properties() -> None:
     assert len(lut) == 256
     assert lut[0] == 0
     assert lut[255] == 255
+
+
+def test_apply_brightness_u8_matches_per_byte_rounding() -> None:
+    frame = bytes(range(256)) + bytes([255, 7])  # 258 bytes, every value
+    for b in (0.1, 0.25, 0.5, 0.73, 0.999):
+        expected = bytes(min(255, int(round(v * b))) for v in frame)
+        assert apply_brightness_u8(frame, b) == expected
+        assert apply_brightness_u8(bytearray(frame), b) == expected
+        assert apply_brightness_u8(memoryview(frame), b) == expected
+
+
+def test_apply_lut_u8_clamps_and_accepts_bytes_lut() -> None:
+    frame = bytes([0, 1, 2, 253, 254, 255])
+    lut = [v * 2 - 100 for v in range(256)]  # negative and >255 entries
+    expected = bytes(min(255, max(0, lut[v])) for v in frame)
+    assert apply_lut_u8(frame, lut) == expected
+    assert apply_lut_u8(frame, bytes(reversed(range(256)))) == bytes(255 - v for v in frame)
+    with pytest.raises(ValueError):
+        apply_lut_u8(frame, [0] * 255)
+
+
+def test_make_gamma_lut_u8_values_and_fresh_list() -> None:
+    lut = make_gamma_lut_u8(2.2)
+    assert lut == [min(255, int(round(pow(i / 255.0, 2.2) * 255.0))) for i in range(256)]
+    lut[0] = 99
+    assert make_gamma_lut_u8(2.2)[0] == 0
+    with pytest.raises(ValueError):
+        make_gamma_lut_u8(0)
+
+
+def test_solid_frame_bytes_memoized_and_validates_order() -> None:
+    c = ColorRGB(300, -5, 7)  # packed with clamping
+    a = solid_frame_bytes(100, c, order="GRB")
+    assert a == bytes([0, 255, 7]) * 100
+    assert solid_frame_bytes(100, ColorRGB(300, -5, 7), order="GRB") is a
+    with pytest.raises(ValueError):
+        solid_frame_bytes(1, c, order="XYZ")
+
+
+def test_make_frame_pipeline_matches_step_by_step() -> None:
+    from helpers.transforms.bytes import make_frame_pipeline
+
+    frame = bytes(range(256)) + bytes([1, 2])  # 258 bytes
+    for b, g, order in ((1.0, 1.0, "RGB"), (0.6, 2.2, "GRB"), (0.3, 0.5, "BGR"), (0.0, 1.8, "GBR")):
+        step = apply_lut_u8(apply_brightness_u8(frame, b), make_gamma_lut_u8(g))
+        px = [step[i:i + 3] for i in range(0, len(step), 3)]
+        expected = b"".join(pack_rgb_u8(ColorRGB(*p), order) for p in px)
+        assert make_frame_pipeline(b, g, order)(frame) == expected
+
+    assert make_frame_pipeline(0.5, 2.2, "GRB") is make_frame_pipeline(0.5, 2.2, "GRB")
+    with pytest.raises(ValueError):
+        make_frame_pipeline(0.5, 2.2, "XYZ")
+
+
+def test_pack_rgb_u8_all_orders_match_index_table() -> None:
+    from helpers.transforms.bytes.rgb_frame import ALLOWED_COLOR_ORDERS
+
+    c = ColorRGB(10, 20, 30)
+    for order in ALLOWED_COLOR_ORDERS:
+        expected = bytes(getattr(c, ch.lower()) for ch in order)
+        assert pack_rgb_u8(c, order) == expected
+
+
+def test_unchecked_transforms_match_checked() -> None:
+    from helpers.transforms.bytes import apply_brightness_u8_unchecked, apply_lut_u8_unchecked
+
+    frame = bytes(range(255))
+    lut = make_gamma_lut_u8(2.2)
+    assert apply_brightness_u8_unchecked(frame, 0.4) == apply_brightness_u8(frame, 0.4)
+    assert apply_lut_u8_unchecked(frame, lut) == apply_lut_u8(frame, lut)
+
+    # No frame check: a partial pixel is passed through instead of raising.
+    assert apply_brightness_u8_unchecked(b"\xff\xff", 0.0) == b"\x00\x00"
+    with pytest.raises(ValueError):
+        apply_lut_u8_unchecked(frame, lut[:10])
+
+
+def test_reorder_frame_matches_per_pixel_pack() -> None:
+    from helpers.transforms.bytes import reorder_frame
+    from helpers.transforms.bytes.rgb_frame import ALLOWED_COLOR_ORDERS
+
+    frame = bytes(range(30))
+    px = [ColorRGB(*frame[i:i + 3]) for i in range(0, len(frame), 3)]
+    for order in ALLOWED_COLOR_ORDERS:
+        assert reorder_frame(frame, order) == b"".join(pack_rgb_u8(c, order) for c in px)
+
+    assert type(reorder_frame(bytearray(frame), "RGB")) is bytes
+    with pytest.raises(ValueError):
+        reorder_frame(frame, "XYZ")
+    with pytest.raises(ValueError):
+        reorder_frame(frame[:4], "GRB")
@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+from helpers.toolkits.ui.runtime import UiEvent, UiEventBus
+
+
+def test_event_bus_drain_upgrades_and_clears():
+    bus = UiEventBus()
+    bus.emit("state_dirty", reason="x")
+    bus.emit("command_executed", command_id="a")
+    bus.emit("command_executed", command_id="b")
+
+    evs = bus.drain()
+    assert all(isinstance(e, UiEvent) for e in evs)
+    assert [e.type for e in evs] == ["state_dirty", "command_executed", "command_executed"]
+    assert [e.payload for e in evs][1:] == [{"command_id": "a"}, {"command_id": "b"}]
+    assert evs[0].ts > 0
+    assert bus.drain() == []
+
+
+def test_event_bus_stamps_each_emit():
+    import time
+
+    bus = UiEventBus()
+    bus.emit("a")
+    time.sleep(0.01)
+    bus.emit("b")
+    a, b = bus.drain()
+    assert b.ts - a.ts >= 0.005
+
+
+def test_event_bus_maxlen_drops_oldest():
+    bus = UiEventBus(maxlen=2)
+    for i in range(3):
+        bus.emit("e", i=i)
+    assert [e.payload["i"] for e in bus.drain()] == [1, 2]
+
+
+def _spec(menus=(), windows=()):
+    from helpers.toolkits.ui.spec.models import CommandSpec, UiSpec
+
+    return UiSpec(
+        version=1,
+        commands=[CommandSpec(id="app.quit", title="Quit")],
+        menus=list(menus),
+        windows=list(windows),
+    )
+
+
+def test_enrich_menus_adds_defaults_and_view_toggles():
+    from helpers.toolkits.ui.runtime.menu_enrich import enrich_menus
+    from helpers.toolkits.ui.spec.models import MenuItemWindowToggle, MenuSpec, WindowSpec
+
+    spec = _spec(
+        menus=[MenuSpec(id="view", title="View", items=[MenuItemWindowToggle(type="window_toggle", window_id="w1")])],
+        windows=[WindowSpec(id="w1", title="W1", factory="f"), WindowSpec(id="win.about", title="About", factory="f")],
+    )
+    menus = enrich_menus(spec)
+
+    assert [m.title for m in menus] == ["View", "File", "Help"]
+    assert [it.window_id for it in menus[0].items] == ["w1", "win.about"]
+    assert menus[1].items[0].command_id == "app.quit"
+    assert menus[2].items[0].window_id == "win.about"
+    assert len(spec.menus[0].items) == 1  # source spec untouched
+
+
+def test_enrich_menus_is_memoized_per_spec():
+    import gc
+
+    from helpers.toolkits.ui.runtime import menu_enrich
+
+    spec = _spec()
+    a = menu_enrich.enrich_menus(spec)
+    b = menu_enrich.enrich_menus(spec)
+    assert a == b and a is not b
+    assert all(x is y for x, y in zip(a, b))
+
+    key = id(spec)
+    assert key in menu_enrich._ENRICH_CACHE
+    del spec, a, b
+    gc.collect()
+    assert key not in menu_enrich._ENRICH_CACHE
+
+
+class _FakeHandle:
+    def __init__(self, window_id):
+        self.window_id = window_id
+        self.open = True
+
+    def set_open(self, is_open):
+        self.open = is_open
+
+    def is_open(self):
+        return self.open
+
+    def apply_state(self, state):
+        self.open = state.is_open
+
+    def capture_state(self):
+        from helpers.toolkits.ui.state import WindowState
+
+        return WindowState(id=self.window_id, is_open=self.open)
+
+
+class _FakeHost:
+    def __init__(self):
+        self.created = []
+        self.menus = None
+
+    def create_window(self, spec, factory_key, ctx):
+        self.created.append(spec.id)
+        return _FakeHandle(spec.id)
+
+    def build_menus(self, spec_menus, on_command, on_window_toggle):
+        self.menus = spec_menus
+
+    def request_quit(self):
+        pass
+
+
+def _session(windows):
+    from helpers.toolkits.ui.runtime import CommandRegistry, UiSession, WindowFactoryRegistry
+    from helpers.toolkits.ui.state import UiState
+
+    factories = WindowFactoryRegistry()
+    factories.register("f", lambda host, ctx, wid, parent: None)
+    return UiSession(spec=_spec(windows=windows), state=UiState(), commands=CommandRegistry(), factories=factories)
+
+
+def test_session_creates_hidden_windows_lazily():
+    from helpers.toolkits.ui.spec.models import WindowSpec
+
+    session = _session([
+        WindowSpec(id="main", title="Main", factory="f"),
+        WindowSpec(id="tools", title="Tools", factory="f", drawn_on_start=False),
+    ])
+    host = _FakeHost()
+    session.build(host)
+    assert host.created == ["main"]
+
+    session.state.get_window("main").is_open = True
+    session.apply_state()
+    session.capture_state()
+    assert host.created == ["main"]
+    assert session.state.windows["tools"].is_open is False
+
+    session.toggle_window("tools")
+    assert host.created == ["main", "tools"]
+    assert session.state.windows["tools"].is_open is True
+
+
+def test_session_apply_state_materializes_saved_open_windows():
+    from helpers.toolkits.ui.spec.models import WindowSpec
+
+    session = _session([WindowSpec(id="tools", title="Tools", factory="f", drawn_on_start=False)])
+    host = _FakeHost()
+    session.build(host)
+    session.state.get_window("tools").is_open = True
+    session.apply_state()
+    assert host.created == ["tools"]
+
+
+def test_ui_spec_id_sets_are_cached_and_validated():
+    import pytest
+
+    from helpers.toolkits.ui.spec.models import CommandSpec, UiSpec
+    from helpers.toolkits.ui.spec.validate import validate_ui_spec
+
+    spec = _spec()
+    assert spec.command_ids() == {"app.quit"}
+    assert spec.command_ids() is spec.command_ids()
+    assert spec == _spec()  # cache fields do not affect equality
+    validate_ui_spec(spec)
+
+    dup = UiSpec(version=1, commands=[CommandSpec(id="a", title="A"), CommandSpec(id="a", title="B")])
+    with pytest.raises(ValueError, match="Duplicate command"):
+        validate_ui_spec(dup)
+
+
+def test_validate_ui_spec_walks_nested_submenus():
+    import pytest
+
+    from helpers.toolkits.ui.spec.models import MenuItemSubmenu, MenuItemWindowToggle, MenuSpec
+    from helpers.toolkits.ui.spec.validate import validate_ui_spec
+
+    deep = [MenuItemWindowToggle(type="window_toggle", window_id="missing")]
+    for _ in range(50):
+        deep = [MenuItemSubmenu(type="submenu", title="s", items=deep)]
+    spec = _spec(menus=[MenuSpec(id="m", title="M", items=deep)])
+    with pytest.raises(ValueError, match="unknown window_id: missing"):
+        validate_ui_spec(spec)
+
+
+def test_ui_spec_serde_round_trip(tmp_path):
+    import json
+
+    import pytest
+
+    from helpers.toolkits.ui.spec.serde import dump_ui_spec, load_ui_spec
+
+    doc = {
+        "version": 1,
+        "commands": [{"id": "app.quit", "title": "Quit", "kind": "app", "payload_schema": None, "enabled_when": None}],
+        "menus": [
+            {
+                "id": "file",
+                "title": "File",
+                "items": [
+                    {"type": "command", "command_id": "app.quit"},
+                    {"type": "separator"},
+                    {"type": "submenu", "title": "More", "items": [{"type": "window_toggle", "window_id": "w"}]},
+                ],
+            }
+        ],
+        "windows": [
+            {
+                "id": "w",
+                "title": "W",
+                "factory": "f",
+                "drawn_on_start": False,
+                "dock_hint": {"area": "left", "ratio": 0.25, "target_window_id": None},
+                "menu_path": None,
+                "factory_args": {"a": 1},
+                "factory_args_ref": None,
+            }
+        ],
+    }
+    p = tmp_path / "ui.json"
+    p.write_text(json.dumps(doc), encoding="utf-8")
+    assert dump_ui_spec(load_ui_spec(p)) == doc
+
+    doc["menus"][0]["items"].append({"type": "bogus"})
+    p.write_text(json.dumps(doc), encoding="utf-8")
+    with pytest.raises(ValueError, match="Unknown menu item type"):
+        load_ui_spec(p)
+
+
+def test_registries_single_lookup_helpers():
+    import pytest
+
+    from helpers.toolkits.ui.runtime import CommandRegistry, WindowFactoryRegistry
+
+    factories = WindowFactoryRegistry()
+    fn = lambda host, ctx, wid, parent: None  # noqa: E731
+    factories.register("f", fn)
+    assert factories.get_or_raise("f") is fn
+    with pytest.raises(KeyError):
+        factories.get_or_raise("nope")
+
+    cmds = CommandRegistry()
+    cmds.register("a", lambda ctx, payload: None)
+    cmds.register("b", lambda ctx, payload: None, enabled_when=lambda ctx: False)
+    assert cmds.is_enabled("a", None) is True
+    assert cmds.is_enabled("b", None) is False
+    assert cmds.is_enabled("c", None) is False
+
+
+def test_event_bus_subscribers_run_off_thread():
+    import threading
+
+    seen = []
+    threads = set()
+
+    def sub(ev):
+        threads.add(threading.get_ident())
+        seen.append((ev.type, ev.payload))
+
+    def bad(ev):
+        raise RuntimeError("boom")
+
+    bus = UiEventBus()
+    bus.add_subscriber(sub)
+    bus.add_subscriber(bad)
+    bus.emit("a", x=1)
+    bus.emit("b", y=2)
+    bus.close()
+
+    assert seen == [("a", {"x": 1}), ("b", {"y": 2})]
+    assert threading.get_ident() not in threads
+    assert "boom" in (bus.last_subscriber_error or "")
+    assert [e.type for e in bus.drain()] == ["a", "b"]
+
+
+def test_factory_args_ref_is_cached_until_file_changes(tmp_path, monkeypatch):
+    import json
+    import os
+
+    from helpers.toolkits.ui.runtime import spec_resolve
+    from helpers.toolkits.ui.spec.models import WindowSpec
+
+    p = tmp_path / "args.json"
+    p.write_text(json.dumps({"a": 1, "b": 2}), encoding="utf-8")
+
+    reads = []
+    real = spec_resolve.read_json_strict
+    monkeypatch.setattr(spec_resolve, "read_json_strict", lambda *a, **k: reads.append(a) or real(*a, **k))
+
+    w = WindowSpec(id="w", title="W", factory="f", factory_args={"b": 3}, factory_args_ref=f"path:{p}")
+    first = spec_resolve.resolve_window_factory_args(w, helpers_root=None)
+    first["a"] = 99
+    assert spec_resolve.resolve_window_factory_args(w, helpers_root=None) == {"a": 1, "b": 3}
+    assert len(reads) == 1
+
+    p.write_text(json.dumps({"a": 5}), encoding="utf-8")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert spec_resolve.resolve_window_factory_args(w, helpers_root=None) == {"a": 5, "b": 3}
+    assert len(reads) == 2
+
+
+def test_factory_args_ref_cache_is_not_shared_with_callers(tmp_path):
+    import json
+
+    from helpers.toolkits.ui.runtime import spec_resolve
+    from helpers.toolkits.ui.spec.models import WindowSpec
+
+    p = tmp_path / "args.json"
+    p.write_text(json.dumps({"opts": {"n": 1}, "items": [1, 2]}), encoding="utf-8")
+
+    w = WindowSpec(id="w", title="W", factory="f", factory_args_ref=f"path:{p}")
+    first = spec_resolve.resolve_window_factory_args(w, helpers_root=None)
+    first["opts"]["n"] = 99
+    first["items"].append(3)
+    assert spec_resolve.resolve_window_factory_args(w, helpers_root=None) == {"opts": {"n": 1}, "items": [1, 2]}
+
+
+def test_enrich_menus_keeps_complete_view_menu():
+    from helpers.toolkits.ui.runtime.menu_enrich import enrich_menus
+    from helpers.toolkits.ui.spec.models import MenuItemWindowToggle, MenuSpec, WindowSpec
+
+    view = MenuSpec(id="view", title="View", items=[MenuItemWindowToggle(type="window_toggle", window_id="w1")])
+    spec = _spec(menus=[view], windows=[WindowSpec(id="w1", title="W1", factory="f")])
+    assert enrich_menus(spec)[0] is view
+
+
+def test_parse_deeply_nested_submenus_without_recursion():
+    import sys
+
+    from helpers.toolkits.ui.spec.models import MenuItemCommand, MenuItemSubmenu
+    from helpers.toolkits.ui.spec.serde import _parse_menu_items
+
+    depth = sys.getrecursionlimit() + 100
+    d = {"type": "command", "command_id": "x"}
+    for i in range(depth):
+        d = {"type": "submenu", "title": f"s{i}", "items": [{"type": "separator"}, d]}
+
+    (it,) = _parse_menu_items([d])
+    n = 0
+    while isinstance(it, MenuItemSubmenu):
+        assert it.items[0].type == "separator"
+        it = it.items[1]
+        n += 1
+    assert n == depth and isinstance(it, MenuItemCommand)
+
+
+def test_ui_records_are_slotted_and_copyable():
+    import copy
+    import pickle
+
+    from helpers.toolkits.ui.spec.models import MenuItemSubmenu, MenuItemWindowToggle, MenuSpec
+
+    ev = UiEvent(type="a", payload={"x": 1}, ts=1.0)
+    assert not hasattr(ev, "__dict__")
+
+    m = MenuSpec(id="m", title="M", items=[MenuItemSubmenu(type="submenu", title="s", items=[
+        MenuItemWindowToggle(type="window_toggle", window_id="w")])])
+    assert pickle.loads(pickle.dumps(m)) == m
+    assert copy.deepcopy(m) == m
+
+
+def test_load_ui_spec_shares_identical_subtrees(tmp_path):
+    import json
+
+    from helpers.toolkits.ui.spec.serde import dump_ui_spec, load_ui_spec
+
+    recent = {"type": "submenu", "title": "Recent", "items": [{"type": "command", "command_id": "app.quit"}]}
+    doc = {
+        "version": 1,
+        "commands": [{"id": "app.quit", "title": "Quit"}],
+        "menus": [
+            {"id": "a", "title": "A", "items": [recent, {"type": "separator"}]},
+            {"id": "b", "title": "B", "items": [{"type": "separator"}, json.loads(json.dumps(recent))]},
+        ],
+    }
+    p = tmp_path / "ui.json"
+    p.write_text(json.dumps(doc), encoding="utf-8")
+    spec = load_ui_spec(p)
+
+    a, b = spec.menus
+    assert a.items[0] is b.items[1]
+    assert a.items[1] is b.items[0]
+    assert [m["items"] for m in dump_ui_spec(spec)["menus"]] == [m["items"] for m in doc["menus"]]
+
+
+def test_enrich_menus_without_windows_adds_empty_view():
+    from helpers.toolkits.ui.runtime.menu_enrich import enrich_menus
+
+    menus = enrich_menus(_spec())
+    assert [(m.title, m.items) for m in menus][2] == ("View", [])
+
+
+def test_session_build_reports_all_missing_factories():
+    import pytest
+
+    from helpers.toolkits.ui.spec.models import WindowSpec
+
+    session = _session([
+        WindowSpec(id="a", title="A", factory="nope1"),
+        WindowSpec(id="b", title="B", factory="f"),
+        WindowSpec(id="c", title="C", factory="nope2", drawn_on_start=False),
+    ])
+    with pytest.raises(KeyError, match="a -> nope1, c -> nope2"):
+        session.build(_FakeHost())
+
+
+def test_ui_state_save_load_round_trip(tmp_path):
+    import json
+
+    from helpers.toolkits.ui.state import UiState, WindowState
+    from helpers.toolkits.ui.state.serde import dump_ui_state, load_ui_state, save_ui_state
+
+    state = UiState(kv={"name": "é", 1: "int key"})
+    state.windows["w"] = WindowState(id="w", is_open=False, pos_xy=(1, 2), size_wh=(3, 4), extra={"k": [1]})
+    p = tmp_path / "state" / "ui.json"
+    save_ui_state(p, state)
+
+    text = p.read_text(encoding="utf-8")
+    assert text == json.dumps(dump_ui_state(state), ensure_ascii=False, indent=2) + "\n"
+    assert [x.name for x in p.parent.iterdir()] == ["ui.json"]  # no temp file left behind
+    loaded = load_ui_state(p)
+    assert loaded.windows["w"] == state.windows["w"]
+    assert loaded.kv == {"name": "é", "1": "int key"}
+
+
+def test_ui_state_round_trip_keeps_non_finite_floats(tmp_path):
+    import math
+
+    from helpers.toolkits.ui.state import UiState, WindowState
+    from helpers.toolkits.ui.state.serde import load_ui_state, save_ui_state
+
+    state = UiState(kv={"nan": float("nan"), "inf": float("inf"), "ninf": float("-inf")})
+    state.windows["w"] = WindowState(id="w", extra={"zoom": float("nan")})
+    p = tmp_path / "ui.json"
+    save_ui_state(p, state)
+
+    loaded = load_ui_state(p)
+    assert math.isnan(loaded.kv["nan"]) and math.isnan(loaded.windows["w"].extra["zoom"])
+    assert loaded.kv["inf"] == math.inf and loaded.kv["ninf"] == -math.inf
+
+
+def test_ensure_ui_state_copies_caller_dicts():
+    from helpers.toolkits.ui.state.serde import ensure_ui_state
+
+    raw = {"windows": {"w": {"pos_xy": [1, 2], "extra": {"k": 1}}}, "kv": {"a": 1}}
+    state = ensure_ui_state(raw)
+    raw["windows"]["w"]["extra"]["k"] = 2
+    raw["kv"]["a"] = 2
+
+    assert state.windows["w"].pos_xy == (1, 2)
+    assert state.windows["w"].extra == {"k": 1}
+    assert state.kv == {"a": 1}
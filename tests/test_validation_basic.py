@@ -71,3 +71,53 @@ def test_require_unique():
 def test_require_ip_current_bug():
     # As shipped, require_ip likely raises due to require_str signature mismatch.
     assert require_ip("127.0.0.1", path="ip") == "127.0.0.1"
+
+
+def test_optional_readers_treat_missing_and_none_alike():
+    from helpers.validation import optional_int, optional_str
+
+    assert optional_int({}, "n", default=3) == 3
+    assert optional_int({"n": None}, "n", default=3) == 3
+    assert optional_int({"n": 0}, "n", default=3) == 0
+    assert optional_str({"s": " x "}, "s") == "x"
+    with pytest.raises(ValidationError):
+        require_int({}, "n", path="cfg")
+    assert require_int({}, "n", default=1) == 1
+    with pytest.raises(ValidationError):
+        require_int({"n": None}, "n", default=1)  # present-but-None is validated, not defaulted
+
+
+def test_make_mapping_reader_matches_require_readers():
+    from helpers.validation import make_mapping_reader
+
+    read = make_mapping_reader(
+        {
+            "led_count": ("int", {"min_v": 1}),
+            "host": "host",
+            "mode": ("one_of", {"allowed": ("a", "b"), "default": "a"}),
+            "name": ("str", {"allow_empty": True}),
+        },
+        path="strip",
+    )
+    cfg = {"led_count": 30, "host": "wled.local", "name": " x "}
+    assert read(cfg) == {"led_count": 30, "host": "wled.local", "mode": "a", "name": "x"}
+
+    with pytest.raises(ValidationError, match="'strip.led_count' must be >= 1"):
+        read({**cfg, "led_count": 0})
+    with pytest.raises(ValidationError, match="Missing required field 'strip.host'"):
+        read({"led_count": 1, "name": ""})
+    with pytest.raises(ValueError):
+        make_mapping_reader({"x": "nope"})
+
+    # Missing keys with defaults: the default goes through the field check.
+    from helpers.validation import require_int, require_str
+
+    read_defaults = make_mapping_reader({"name": ("str", {"default": "  padded  "})})
+    assert read_defaults({}) == {"name": require_str({}, "name", default="  padded  ")} == {"name": "padded"}
+
+    read_bad_default = make_mapping_reader({"n": ("int", {"default": None})})
+    with pytest.raises(ValidationError) as want:
+        require_int({}, "n", default=None)
+    with pytest.raises(ValidationError) as got:
+        read_bad_default({})
+    assert str(got.value) == str(want.value)
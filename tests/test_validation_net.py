@@ -0,0 +1,54 @@
+# tests/test_validation_net.py
+from __future__ import annotations
+
+import pytest
+
+from helpers.validation import ValidationError, ensure_host
+
+
+def test_ensure_host_hostname_labels():
+    assert ensure_host(" my-host.local ") == "my-host.local"
+    assert ensure_host("a" * 63 + ".com") == "a" * 63 + ".com"
+    assert ensure_host("LocalHost") == "localhost"
+    assert ensure_host("10.0.0.1") == "10.0.0.1"
+
+    for bad in ("a" * 64 + ".com", "-a.com", "a-.com", "a..com", "a_b.com", "hé.com", "ab\n.com"):
+        with pytest.raises(ValidationError):
+            ensure_host(bad)
+
+    with pytest.raises(ValidationError, match="bad label 'a_b'"):
+        ensure_host("ok.a_b.com")
+
+
+def test_ensure_ip_versions():
+    from helpers.validation import ensure_ip
+
+    assert ensure_ip(" 10.0.0.1 ") == "10.0.0.1"
+    assert ensure_ip("::1", version=6) == "::1"
+    with pytest.raises(ValidationError, match="must be IPv6"):
+        ensure_ip("10.0.0.1", version=6)
+    with pytest.raises(ValidationError, match=r"'ip.version' must be one of \[4, 6\]"):
+        ensure_ip("10.0.0.1", version=5)
+    with pytest.raises(ValidationError):
+        ensure_ip("10.0.0.256")
+
+
+def test_ensure_http_url():
+    from helpers.validation import ensure_http_url
+
+    assert ensure_http_url(" http://wled.local/json;x ") == "http://wled.local/json;x"
+    assert ensure_http_url("HTTPS://[::1]:8080") == "HTTPS://[::1]:8080"
+    for bad in ("ftp://host", "http://", "wled.local", "http://[::1"):
+        with pytest.raises(ValidationError):
+            ensure_http_url(bad)
+
+
+def test_ensure_endpoint():
+    from helpers.validation import ensure_endpoint
+
+    assert ensure_endpoint("wled.local:80") == ("wled.local", 80)
+    assert ensure_endpoint("[::1]:4048") == ("::1", 4048)
+    huge = "h:" + "9" * 5000  # beyond int()'s max digits: still a ValidationError
+    for bad in ("wled.local", "wled.local:", "wled.local:0", "wled.local:65536", "h:+80", "[::1]4048", "[::1", huge):
+        with pytest.raises(ValidationError):
+            ensure_endpoint(bad)
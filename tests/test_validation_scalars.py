@@ -0,0 +1,72 @@
+# tests/test_validation_scalars.py
+from __future__ import annotations
+
+import pytest
+
+from helpers.validation import ValidationError, ensure_regex
+
+
+def test_ensure_regex_memoizes_compiled_patterns():
+    a = ensure_regex(r" ^foo\d+$ ", path="rule")
+    assert a.match("foo12")
+    assert ensure_regex(r"^foo\d+$") is a
+
+    with pytest.raises(ValidationError):
+        ensure_regex("(unclosed", path="rule")
+
+
+def test_scalar_validators_accept_subclasses_and_reject_bool():
+    from helpers.validation import ensure_bool, ensure_float, ensure_int, ensure_str
+
+    class _Str(str):
+        pass
+
+    class _Int(int):
+        pass
+
+    assert ensure_str(_Str(" a ")) == "a"
+    assert ensure_int(_Int(3)) == 3
+    assert ensure_float(_Int(2)) == 2.0
+    assert ensure_bool(False) is False
+    for fn, v in ((ensure_int, True), (ensure_float, False), (ensure_bool, 1), (ensure_float, "1")):
+        with pytest.raises(ValidationError):
+            fn(v)
+
+
+def test_list_validators_report_item_paths():
+    from helpers.validation import ensure_list_of_dicts, ensure_list_of_str
+
+    assert ensure_list_of_str([" a ", "b"]) == ["a", "b"]
+    assert ensure_list_of_str(["", " "], allow_empty_items=True) == ["", ""]
+    assert ensure_list_of_dicts([{"a": 1}]) == [{"a": 1}]
+
+    with pytest.raises(ValidationError, match=r"'tags\[1\]' must be a non-empty string"):
+        ensure_list_of_str(["a", "  "], path="tags")
+    with pytest.raises(ValidationError, match=r"'tags\[2\]' must be a string"):
+        ensure_list_of_str(["a", "b", 3], path="tags")
+    with pytest.raises(ValidationError, match=r"'items\[0\]' must be an object/dict"):
+        ensure_list_of_dicts([[]], path="items")
+
+
+def test_ensure_pathlike_expands_only_tilde_paths():
+    from pathlib import Path
+
+    from helpers.validation import ensure_pathlike
+
+    p = Path("data/x.json")
+    assert ensure_pathlike(p) is p
+    assert ensure_pathlike(" data/x.json ") == p
+    assert ensure_pathlike("~/x.json") == Path("~/x.json").expanduser()
+    assert ensure_pathlike(Path("~/x.json"), expanduser=False) == Path("~/x.json")
+
+
+def test_ensure_dict_of_str_reports_key_paths():
+    from helpers.validation import ensure_dict_of_str
+
+    assert ensure_dict_of_str({"a": " x ", "b": ""}, allow_empty_values=True) == {"a": "x", "b": ""}
+    with pytest.raises(ValidationError, match=r"'env.b' must be a non-empty string"):
+        ensure_dict_of_str({"a": "x", "b": " "}, path="env")
+    with pytest.raises(ValidationError, match=r"'env.a' must be a string"):
+        ensure_dict_of_str({"a": 1}, path="env")
+    with pytest.raises(ValidationError, match="keys must be strings"):
+        ensure_dict_of_str({1: "x"}, path="env")
@@ -1,7 +1,7 @@
 # tests/test_validation_time.py
 from __future__ import annotations
 
-from datetime import datetime, timezone, time as dtime
+from datetime import datetime, timedelta, timezone, time as dtime
 
 import pytest
 
@@ -9,7 +9,9 @@ from helpers.validation.time import (
     parse_time_of_day,
     dt,
     resolve_time_like,
+    resolve_time_like_many,
     ensure_end_after_start,
+    parse_duration,
 )
 from helpers.validation.basic import ValidationError
 
@@ -51,3 +53,44 @@ def test_ensure_end_after_start_midnight_guard():
     out = ensure_end_after_start(start, end)
     assert out.day == 2
     assert out.hour == 0 and out.minute == 15
+
+
+def test_parse_duration():
+    assert parse_duration("90m") == timedelta(minutes=90)
+    assert parse_duration(" 1h 30M ") == timedelta(hours=1, minutes=30)
+    assert parse_duration("1.5h2s") == timedelta(hours=1.5, seconds=2)
+    assert parse_duration("1w2d") == timedelta(days=9)
+    for bad in ("", "h", "10", "1.h", "1 h", "1h30x", ".5h", "1h\t2m"):
+        with pytest.raises(ValidationError):
+            parse_duration(bad)
+
+
+def test_resolve_time_like_dispatch():
+    tz = timezone.utc
+    ref = datetime(2020, 1, 2, 10, 0, 0, tzinfo=tz)
+
+    assert resolve_time_like(None, tz=tz) is None
+    assert resolve_time_like(0, tz=tz) == datetime(1970, 1, 1, tzinfo=tz)
+    assert resolve_time_like(dtime(3, 4, 5), tz=tz, reference=ref) == datetime(2020, 1, 2, 3, 4, 5, tzinfo=tz)
+
+    class _Dt(datetime):
+        pass
+
+    assert resolve_time_like(_Dt(2020, 1, 1), tz=tz) == datetime(2020, 1, 1, tzinfo=tz)
+    with pytest.raises(TypeError):
+        resolve_time_like([], tz=tz)  # type: ignore[arg-type]
+
+
+def test_resolve_time_like_many_shares_reference():
+    tz = timezone.utc
+    ref = datetime(2020, 1, 2, 10, 0, 0, tzinfo=tz)
+    out = resolve_time_like_many(["08:00", None, dtime(9, 30), 0], tz=tz, reference=ref)
+    assert out == [
+        datetime(2020, 1, 2, 8, 0, tzinfo=tz),
+        None,
+        datetime(2020, 1, 2, 9, 30, tzinfo=tz),
+        datetime(1970, 1, 1, tzinfo=tz),
+    ]
+
+    a, b = resolve_time_like_many(["00:00", "23:59"], tz=tz)
+    assert a.date() == b.date()
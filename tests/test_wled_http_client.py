@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from helpers.toolkits.wled_http import WledHttpClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def _reply(self, code: int, body: bytes) -> None:
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        srv = self.server
+        srv.ports.add(self.client_address[1])  # type: ignore[attr-defined]
+        if self.path != "/json/state":
+            self._reply(404, b"{}")
+            return
+        self._reply(200, json.dumps(srv.state).encode())  # type: ignore[attr-defined]
+
+    def do_POST(self) -> None:
+        srv = self.server
+        srv.ports.add(self.client_address[1])  # type: ignore[attr-defined]
+        n = int(self.headers["Content-Length"])
+        raw = self.rfile.read(n)
+        srv.posts.append(raw)  # type: ignore[attr-defined]
+        if srv.post_delays:  # type: ignore[attr-defined]
+            time.sleep(srv.post_delays.pop(0))  # type: ignore[attr-defined]
+        if srv.drop_posts:  # type: ignore[attr-defined]
+            srv.drop_posts -= 1  # type: ignore[attr-defined]
+            self.close_connection = True
+            return  # close without any response
+        srv.state.update(json.loads(raw))  # type: ignore[attr-defined]
+        self._reply(200, b'{"success":true}')
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture()
+def wled_server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.state = {"on": True, "bri": 128}  # type: ignore[attr-defined]
+    srv.ports = set()  # type: ignore[attr-defined]
+    srv.posts = []  # type: ignore[attr-defined]
+    srv.post_delays = []  # type: ignore[attr-defined]
+    srv.drop_posts = 0  # type: ignore[attr-defined]
+    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_client_reuses_one_connection(wled_server):
+    client = WledHttpClient("127.0.0.1", wled_server.server_address[1])
+    try:
+        assert client.get_state() == {"on": True, "bri": 128}
+        client.set_state({"bri": 10})
+        assert client.get_state()["bri"] == 10
+        assert len(wled_server.ports) == 1
+    finally:
+        client.close()
+
+
+def test_client_reconnects_after_close_and_maps_errors(wled_server):
+    client = WledHttpClient("127.0.0.1", wled_server.server_address[1])
+    try:
+        client.get_state()
+        client._conn.sock.close()  # simulate the device dropping an idle connection
+        assert client.get_state()["on"] is True
+
+        with pytest.raises(urllib.error.HTTPError):
+            client._request("GET", "/nope")
+    finally:
+        client.close()
+
+    dead = WledHttpClient("127.0.0.1", 1, timeout_s=0.5)
+    with pytest.raises(urllib.error.URLError):
+        dead.get_state()
+
+
+def test_client_reads_into_reusable_buffer(wled_server, monkeypatch):
+    from helpers.toolkits.wled_http import wled_http
+
+    client = WledHttpClient("127.0.0.1", wled_server.server_address[1])
+    try:
+        buf = client._buf
+        assert client.get_state() == {"on": True, "bri": 128}
+        assert client._buf is buf
+
+        wled_server.state["seg"] = "x" * 20000  # larger than the initial buffer
+        assert client.get_state()["seg"] == "x" * 20000
+        assert len(client._buf) >= 20000
+
+        monkeypatch.setattr(wled_http, "_orjson", None)  # stdlib json fallback
+        assert client.get_state()["bri"] == 128
+    finally:
+        client.close()
+
+
+def test_client_socket_is_tuned(wled_server):
+    import socket
+
+    client = WledHttpClient("127.0.0.1", wled_server.server_address[1])
+    try:
+        client.get_state()
+        sock = client._conn.sock
+        assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+    finally:
+        client.close()
+
+
+def test_client_does_not_resend_post_after_timeout(wled_server):
+    wled_server.post_delays = [1.0]
+    client = WledHttpClient("127.0.0.1", wled_server.server_address[1], timeout_s=0.5)
+    try:
+        client.get_state()  # reused connection for the POST
+        with pytest.raises(urllib.error.URLError):
+            client.set_state({"on": "t"})
+        time.sleep(0.7)  # let the delayed handler finish
+        assert len(wled_server.posts) == 1
+    finally:
+        client.close()
+
+
+def test_client_does_not_resend_post_after_remote_disconnect(wled_server):
+    wled_server.drop_posts = 1
+    client = WledHttpClient("127.0.0.1", wled_server.server_address[1])
+    try:
+        client.get_state()
+        with pytest.raises(urllib.error.URLError):
+            client.set_state({"bri": "~10"})
+        assert len(wled_server.posts) == 1
+        client.set_state({"bri": 5})  # next call reconnects
+        assert client.get_state()["bri"] == 5
+    finally:
+        client.close()
+
+
+def test_dumps_keeps_stdlib_output_for_non_finite_floats():
+    from helpers.toolkits.wled_http import wled_http
+
+    patch = {"seg": [{"x": float("nan")}], "bri": float("inf")}
+    assert wled_http._dumps(patch) == json.dumps(patch).encode()
+    assert json.loads(wled_http._dumps({"bri": 10, "on": True})) == {"bri": 10, "on": True}
@@ -0,0 +1,39 @@
+# tests/vision/test_buffer.py
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+from helpers.vision.buffer import LatestFrameBuffer
+from helpers.vision.frame import Frame
+
+
+def _frame(ts: float) -> Frame:
+    return Frame(image=np.zeros((2, 2, 3), dtype=np.uint8), ts_monotonic=ts)
+
+
+def test_latest_frame_buffer_put_get_and_clear() -> None:
+    buf = LatestFrameBuffer()
+    assert buf.get_latest() is None and buf.seq() == 0
+
+    f1, f2 = _frame(1.0), _frame(2.0)
+    buf.put(f1)
+    buf.put(f2)
+    assert buf.get_latest() is f2 and buf.seq() == 2
+
+    buf.clear()
+    assert buf.get_latest() is None and buf.seq() == 2
+
+
+def test_latest_frame_buffer_wait_next() -> None:
+    buf = LatestFrameBuffer()
+    assert buf.wait_next(0, timeout_s=0.01) == (0, None)
+
+    f = _frame(1.0)
+    t = threading.Timer(0.05, buf.put, args=(f,))
+    t.start()
+    seq, got = buf.wait_next(0, timeout_s=2.0)
+    t.join()
+    assert seq == 1 and got is f
@@ -0,0 +1,32 @@
+# tests/vision/test_config_defaults.py
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from helpers.vision.config import clear_config_cache, load_default_config_catalog, load_default_config_editable
+
+
+def _write_config(root: Path, driver: str) -> None:
+    p = root / "configs" / "vision" / "default.json"
+    p.parent.mkdir(parents=True, exist_ok=True)
+    doc = {"schema_version": 1, "pipeline": {"source": {"driver": driver, "params": {}}}}
+    p.write_text(json.dumps(doc), encoding="utf-8")
+
+
+def test_default_config_catalog_is_memoized_until_file_changes(tmp_path: Path) -> None:
+    clear_config_cache()
+    _write_config(tmp_path, "screen_mss")
+
+    first = load_default_config_catalog(helpers_root=tmp_path)
+    assert load_default_config_catalog(helpers_root=tmp_path) is first
+    assert load_default_config_editable(helpers_root=tmp_path) is not load_default_config_editable(helpers_root=tmp_path)
+
+    _write_config(tmp_path, "uvc_opencv_v2")
+    changed = load_default_config_catalog(helpers_root=tmp_path)
+    assert changed is not first
+    assert changed.doc.pipeline.source.driver == "uvc_opencv_v2"
+
+    clear_config_cache()
+    assert load_default_config_catalog(helpers_root=tmp_path) is not changed
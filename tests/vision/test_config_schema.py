@@ -0,0 +1,36 @@
+# tests/vision/test_config_schema.py
+
+from __future__ import annotations
+
+import sys
+
+from helpers.vision.config import ensure_vision_config
+
+
+def _raw(**params):
+    return {
+        "schema_version": 1,
+        "pipeline": {
+            "source": {"driver": "screen_mss", "params": params},
+            "transforms": [{"name": "crop", "params": {"box": [0, 0, 8, 8]}}],
+        },
+    }
+
+
+def test_vision_config_hash_is_value_based_and_cached() -> None:
+    a = ensure_vision_config(_raw(monitor=1, opts={"x": [1, 2]}))
+    b = ensure_vision_config(_raw(opts={"x": [1, 2]}, monitor=1))
+    c = ensure_vision_config(_raw(monitor=2))
+
+    assert a == b and hash(a) == hash(b)
+    assert len({a, b, c}) == 2
+    assert a._hash == hash(a)
+
+
+def test_driver_and_transform_names_are_interned() -> None:
+    raw = _raw()
+    raw["pipeline"]["source"]["driver"] = "".join(["screen", "_mss"])
+    cfg = ensure_vision_config(raw)
+
+    assert cfg.pipeline.source.driver is sys.intern("screen_mss")
+    assert cfg.pipeline.transforms[0].name is sys.intern("crop")
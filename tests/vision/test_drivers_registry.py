@@ -0,0 +1,52 @@
+# tests/vision/test_drivers_registry.py
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from helpers.validation import ValidationError
+from helpers.vision import drivers
+from helpers.vision.drivers import list_driver_names, make_source
+
+
+def test_importing_drivers_does_not_import_driver_modules() -> None:
+    code = (
+        "import sys, helpers.vision.drivers as d; "
+        "assert d.list_driver_names() == ['screen_mss', 'uvc_opencv']; "
+        "assert 'helpers.vision.drivers.screen_mss' not in sys.modules; "
+        "assert 'helpers.vision.drivers.uvc_opencv' not in sys.modules"
+    )
+    root = Path(__file__).resolve().parents[2]
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+
+def test_lazy_source_attributes_and_factories() -> None:
+    from helpers.vision.drivers.screen_mss import ScreenMssSource
+
+    assert drivers.ScreenMssSource is ScreenMssSource
+    src = make_source("screen_mss", {"monitor": 2, "reuse_buffers": True})
+    assert isinstance(src, ScreenMssSource) and src.monitor == 2 and src.reuse_buffers
+
+    with pytest.raises(AttributeError):
+        drivers.NoSuchSource  # noqa: B018
+    with pytest.raises(ValidationError):
+        make_source("nope")
+    assert "uvc_opencv" in list_driver_names()
+
+
+def test_list_driver_names_tracks_registrations(monkeypatch: pytest.MonkeyPatch) -> None:
+    from helpers.vision.drivers import registry
+
+    for attr in ("_REGISTRY", "_SPECS"):
+        monkeypatch.setattr(registry, attr, dict(getattr(registry, attr)))
+    monkeypatch.setattr(registry, "_SORTED_NAMES", registry._SORTED_NAMES)
+
+    registry.register_driver(" aaa_fake ", lambda p: None, summary="test")  # type: ignore[arg-type,return-value]
+    names = list_driver_names()
+    assert names == sorted(names) and names[0] == "aaa_fake"
+    names.append("mutated")
+    assert "mutated" not in list_driver_names()
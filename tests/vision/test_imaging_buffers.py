@@ -0,0 +1,24 @@
+# tests/vision/test_imaging_buffers.py
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from helpers.vision.imaging_buffers import rgb_to_rgba_u8
+
+
+def test_rgb_to_rgba_u8_copies_channels_and_sets_opaque_alpha() -> None:
+    rgb = np.arange(3 * 5 * 3, dtype=np.uint8).reshape(3, 5, 3)
+    for src in (rgb, rgb[:, ::-1]):
+        rgba = rgb_to_rgba_u8(src)
+        assert rgba.shape == (3, 5, 4) and rgba.flags["C_CONTIGUOUS"]
+        assert np.array_equal(rgba[..., :3], src)
+        assert (rgba[..., 3] == 255).all()
+
+
+def test_rgb_to_rgba_u8_rejects_bad_input() -> None:
+    with pytest.raises(ValueError):
+        rgb_to_rgba_u8(np.zeros((2, 2, 4), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        rgb_to_rgba_u8(np.zeros((2, 2, 3), dtype=np.float32))
@@ -0,0 +1,33 @@
+# tests/vision/test_overlays_filters.py
+
+from __future__ import annotations
+
+from helpers.vision.overlays.filters import filter_annotations, match_filter
+from helpers.vision.overlays.models import Annotation, LayerFilter
+
+
+def _a(id: str, kind: str = "bbox", *tags: str) -> Annotation:
+    return Annotation(id=id, kind=kind, tags=list(tags))  # type: ignore[arg-type]
+
+
+def test_filter_annotations_applies_kinds_and_tag_rules() -> None:
+    anns = [
+        _a("a", "bbox", "person", "front"),
+        _a("b", "roi", "person"),
+        _a("c", "bbox", "person", "hidden"),
+        _a("d", "bbox", "car", "front"),
+    ]
+    f = LayerFilter(
+        kinds=["bbox"],
+        require_tags_any=["person", "dog"],
+        require_tags_all=["person"],
+        exclude_tags_any=["hidden"],
+    )
+    assert [a.id for a in filter_annotations(anns, f)] == ["a"]
+
+
+def test_empty_filter_lists_do_not_constrain() -> None:
+    a = _a("a", "text")
+    assert match_filter(a, LayerFilter())
+    assert match_filter(a, LayerFilter(kinds=[], require_tags_any=[], require_tags_all=[], exclude_tags_any=[]))
+    assert not match_filter(a, LayerFilter(require_tags_all=["x"]))
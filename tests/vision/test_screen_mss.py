@@ -0,0 +1,159 @@
+# tests/vision/test_screen_mss.py
+
+from __future__ import annotations
+
+import threading
+from types import MappingProxyType, SimpleNamespace
+
+import numpy as np
+import pytest
+
+from helpers.vision.drivers import screen_mss
+from helpers.vision.drivers.screen_mss import ScreenMssSource
+
+
+class _Shot:
+    """Minimal stand-in for mss.ScreenShot (BGRA bytes + size)."""
+
+    def __init__(self, bgra: np.ndarray) -> None:
+        self.height, self.width = bgra.shape[:2]
+        self.raw = bytearray(bgra.tobytes())
+
+
+class _Sct:
+    def __init__(self, bgra: np.ndarray) -> None:
+        self.bgra = bgra
+
+    def grab(self, mon):
+        return _Shot(self.bgra)
+
+
+class _ThreadSct(_Sct):
+    """mss stand-in recording which thread created/used/closed it."""
+
+    def __init__(self, bgra: np.ndarray) -> None:
+        super().__init__(bgra)
+        h, w = bgra.shape[:2]
+        self.monitors = [None, {"left": 0, "top": 0, "width": w, "height": h}]
+        self.threads = {threading.get_ident()}
+        self.closed = False
+
+    def grab(self, mon):
+        self.threads.add(threading.get_ident())
+        return super().grab(mon)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _source(bgra: np.ndarray) -> ScreenMssSource:
+    src = ScreenMssSource()
+    src._sct = _Sct(bgra)
+    src._mon = {"left": 0, "top": 0, "width": bgra.shape[1], "height": bgra.shape[0]}
+    return src
+
+
+def test_grab_converts_bgra_to_contiguous_rgb() -> None:
+    bgra = np.arange(2 * 3 * 4, dtype=np.uint8).reshape(2, 3, 4)
+    rgb = _source(bgra)._grab_rgb_once()
+
+    assert rgb.shape == (2, 3, 3) and rgb.dtype == np.uint8
+    assert rgb.flags["C_CONTIGUOUS"]
+    assert np.array_equal(rgb, bgra[:, :, [2, 1, 0]])
+
+
+def test_reuse_buffers_alternates_two_preallocated_outputs() -> None:
+    bgra = np.arange(2 * 3 * 4, dtype=np.uint8).reshape(2, 3, 4)
+    src = _source(bgra)
+    src.reuse_buffers = True
+
+    a = src._grab_rgb_once()
+    b = src._grab_rgb_once()
+    c = src._grab_rgb_once()
+
+    assert a is not b and c is a
+    assert np.array_equal(b, bgra[:, :, [2, 1, 0]])
+
+    src._sct = _Sct(np.zeros((4, 5, 4), dtype=np.uint8))
+    assert src._grab_rgb_once().shape == (4, 5, 3)
+
+
+def test_read_shares_one_read_only_meta_mapping() -> None:
+    bgra = np.zeros((2, 2, 4), dtype=np.uint8)
+    src = _source(bgra)
+    src._meta = MappingProxyType({"driver": "screen_mss", "monitor": 1})
+
+    a, b = src.read(), src.read()
+    assert a is not None and b is not None
+    assert a.meta is b.meta and dict(a.meta) == {"driver": "screen_mss", "monitor": 1}
+
+    assert a.with_image(a.image).meta is a.meta
+    tagged = a.with_image(a.image, crop=(0, 0, 1, 1))
+    assert tagged.meta["crop"] == (0, 0, 1, 1) and "crop" not in a.meta
+
+
+def test_async_capture_reads_from_producer_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    bgra = np.arange(2 * 2 * 4, dtype=np.uint8).reshape(2, 2, 4)
+    made: list = []
+    fake_mss = SimpleNamespace(mss=lambda: made.append(_ThreadSct(bgra)) or made[-1])
+    monkeypatch.setattr(screen_mss, "_require_mss", lambda: fake_mss)
+
+    src = ScreenMssSource(async_capture=True, target_fps=200.0, read_timeout_s=1.0)
+    src.open()
+    try:
+        a = src.read()
+        b = src.read()
+        assert a is not None and b is not None and a is not b
+        assert np.array_equal(b.image, bgra[:, :, [2, 1, 0]])
+        assert threading.get_ident() not in made[0].threads
+    finally:
+        src.close()
+    assert made[0].closed and src.read() is None
+
+
+def test_async_capture_surfaces_open_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake_mss = SimpleNamespace(mss=lambda: SimpleNamespace(monitors=[None], close=lambda: None))
+    monkeypatch.setattr(screen_mss, "_require_mss", lambda: fake_mss)
+
+    src = ScreenMssSource(monitor=3, async_capture=True)
+    with pytest.raises(RuntimeError, match="invalid monitor index 3"):
+        src.open()
+    with pytest.raises(RuntimeError, match="reuse_buffers"):
+        ScreenMssSource(async_capture=True, reuse_buffers=True).open()
+
+
+def test_async_capture_defaults_pacing_and_keeps_stuck_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    bgra = np.zeros((2, 2, 4), dtype=np.uint8)
+    release = threading.Event()
+
+    class _StuckSct(_ThreadSct):
+        grabs = 0
+
+        def grab(self, mon):
+            self.grabs += 1
+            if self.grabs > 2:
+                release.wait()
+            return super().grab(mon)
+
+    fake_mss = SimpleNamespace(mss=lambda: _StuckSct(bgra))
+    monkeypatch.setattr(screen_mss, "_require_mss", lambda: fake_mss)
+    monkeypatch.setattr(screen_mss, "_JOIN_TIMEOUT_S", 0.05)
+
+    src = ScreenMssSource(async_capture=True, read_timeout_s=1.0)
+    src.open()
+    try:
+        assert src._limiter.target_fps == screen_mss.ASYNC_DEFAULT_FPS
+        assert src.read() is not None
+
+        src.close()  # producer is blocked in grab(): join times out
+        stuck = src._thread
+        assert stuck is not None and stuck.is_alive()
+        assert src.read() is None
+        with pytest.raises(RuntimeError, match="already running"):
+            src.open()
+    finally:
+        release.set()
+    stuck.join(timeout=2.0)
+    src.open()  # the old producer has exited: reopening works again
+    src.close()
+    assert src._thread is None